@@ -0,0 +1,60 @@
+"""
+Time to load a portfolio when every ticker information request is slow.
+
+Compares one blocking get_ticker_info call per ticker, as assets used to be
+created while walking the transactions, with Portfolio.from_dict, which
+creates all assets at once through get_tickers_info.
+
+Usage:
+    python -m benchmarks.asset_materialization [n_assets] [info_ms]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from portfolio_toolkit.portfolio import Portfolio
+
+from .common import StaticDataProvider, measure
+from .ledger_import import make_ledger
+
+
+class SlowInfoProvider(StaticDataProvider):
+    """StaticDataProvider whose ticker information takes a network round trip."""
+
+    def __init__(self, prices, info_seconds):
+        super().__init__(prices)
+        self.info_seconds = info_seconds
+
+    def get_ticker_info(self, ticker):
+        time.sleep(self.info_seconds)
+        return {"sector": "Technology"}
+
+
+def main(n_assets=200, info_ms=20):
+    ledger = make_ledger(n_assets * 20, n_assets)
+    index = pd.bdate_range("2015-01-01", "2025-01-01")
+    prices = {f"T{i:04d}": pd.Series(100.0, index=index) for i in range(n_assets)}
+    provider = SlowInfoProvider(prices, info_ms / 1000)
+    data = {
+        "name": "Benchmark",
+        "currency": "USD",
+        "transactions": ledger.astype(object)
+        .where(ledger.notna(), None)
+        .to_dict("records"),
+    }
+    print(f"{n_assets} assets, {info_ms} ms per ticker information request")
+
+    with measure("get_ticker_info, one ticker at a time"):
+        for ticker in prices:
+            provider.get_ticker_info(ticker)
+
+    with measure("Portfolio.from_dict"):
+        portfolio = Portfolio.from_dict(data, provider)
+
+    assert len(portfolio.assets) == n_assets
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""
+Closed position statistics over a high-turnover history.
+
+Compares the per-object loop previously used by get_closed_positions_stats
+with the vectorized aggregates of ClosedPositionArrays.
+
+Usage:
+    python -m benchmarks.closed_position_stats [n_positions]
+"""
+
+import sys
+
+import numpy as np
+
+from portfolio_toolkit.position.closed import ClosedPosition, ClosedPositionList
+
+from .common import measure
+
+
+def legacy_stats(positions):
+    """Reference implementation: one Python iteration per position."""
+    total_profit, winning, best, worst = 0.0, 0, float("-inf"), float("inf")
+    for position in positions:
+        total_profit += position.profit
+        winning += position.return_percentage > 0
+        best = max(best, position.return_percentage)
+        worst = min(worst, position.return_percentage)
+    return total_profit, winning, best, worst
+
+
+def main(n_positions=300_000):
+    rng = np.random.default_rng(0)
+    buy_days = np.datetime64("2015-01-01") + rng.integers(0, 3000, n_positions)
+    sell_days = buy_days + rng.integers(0, 400, n_positions)
+    buy_prices = rng.uniform(10, 200, n_positions)
+    sell_prices = buy_prices * rng.lognormal(0, 0.1, n_positions)
+    positions = ClosedPositionList(
+        [
+            ClosedPosition(
+                ticker=f"T{i % 500:03d}",
+                buy_price=buy,
+                quantity=10.0,
+                buy_date=buy_date,
+                sell_price=sell,
+                sell_date=sell_date,
+            )
+            for i, (buy, sell, buy_date, sell_date) in enumerate(
+                zip(
+                    buy_prices.tolist(),
+                    sell_prices.tolist(),
+                    buy_days.astype(str).tolist(),
+                    sell_days.astype(str).tolist(),
+                )
+            )
+        ]
+    )
+    print(f"{n_positions} closed positions")
+
+    with measure("object loop (summary only)"):
+        legacy_stats(positions)
+
+    with measure("columnar view"):
+        positions.to_arrays()
+
+    with measure("vectorized summary + distribution"):
+        positions.get_stats("2025-12-31")
+        positions.get_distribution_stats()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,142 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against synthetic portfolios and an in-memory data provider so
+they do not depend on network access or on the local price cache.
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.account import Account
+from portfolio_toolkit.asset import PortfolioAsset, PortfolioAssetTransaction
+from portfolio_toolkit.data_provider.data_provider import DataProvider
+from portfolio_toolkit.portfolio import Portfolio
+
+
+class StaticDataProvider(DataProvider):
+    """Data provider serving pre-generated price series from memory."""
+
+    def __init__(self, prices, info=None):
+        self.prices = prices
+        self.info = info or {}
+
+    def get_price(self, ticker, date):
+        return self.prices[ticker].asof(pd.Timestamp(date))
+
+    def get_raw_data(self, ticker, period="5y"):
+        return self.prices[ticker].to_frame("Close")
+
+    def get_price_series(self, ticker, column="Close"):
+        return self.prices[ticker]
+
+    def get_price_series_converted(self, ticker, target_currency, column="Close"):
+        return self.prices[ticker]
+
+    def get_ticker_info(self, ticker):
+        return self.info.get(ticker, {})
+
+    def get_ticker_currency(self, ticker=None):
+        return "USD"
+
+
+def make_synthetic_portfolio(
+    n_assets=50, n_days=5 * 365, trades_per_asset=40, seed=0, end_date=None
+):
+    """
+    Builds a portfolio of random buy/sell ledgers with daily business-day prices.
+
+    Args:
+        n_assets (int): Number of tickers.
+        n_days (int): Calendar days covered by the price history.
+        trades_per_asset (int): Transactions generated per ticker.
+        seed (int): Random seed.
+        end_date (str, optional): Last day of the price history. Defaults to today.
+
+    Returns:
+        Portfolio: Portfolio backed by a StaticDataProvider.
+    """
+    rng = np.random.default_rng(seed)
+    end = pd.Timestamp(end_date) if end_date else pd.Timestamp.now().normalize()
+    index = pd.bdate_range(end=end, periods=int(n_days * 5 / 7))
+
+    prices = {}
+    assets = []
+    sectors = ["Technology", "Energy", "Healthcare", "Financials", "Utilities"]
+    countries = ["United States", "Germany", "Canada", "Japan"]
+    info = {}
+
+    for i in range(n_assets):
+        ticker = f"T{i:04d}"
+        steps = rng.normal(0.0003, 0.02, len(index))
+        prices[ticker] = pd.Series(50 * np.exp(np.cumsum(steps)), index=index)
+        info[ticker] = {
+            "sector": sectors[i % len(sectors)],
+            "country": countries[i % len(countries)],
+        }
+
+        days = np.sort(rng.choice(len(index), size=trades_per_asset, replace=False))
+        transactions = []
+        held = 0
+        for day in days:
+            price = float(prices[ticker].iloc[day])
+            if held > 0 and rng.random() < 0.4:
+                transaction_type, quantity = "sell", int(rng.integers(1, held + 1))
+                held -= quantity
+            else:
+                transaction_type, quantity = "buy", int(rng.integers(1, 50))
+                held += quantity
+            total = quantity * price
+            transactions.append(
+                PortfolioAssetTransaction(
+                    date=index[day].strftime("%Y-%m-%d"),
+                    transaction_type=transaction_type,
+                    quantity=quantity,
+                    price=price,
+                    currency="USD",
+                    total=total,
+                    exchange_rate=1.0,
+                    subtotal_base=total,
+                    fees_base=0.0,
+                    total_base=total,
+                )
+            )
+
+        assets.append(
+            PortfolioAsset(
+                ticker=ticker,
+                prices=prices[ticker],
+                info=info[ticker],
+                currency="USD",
+                transactions=transactions,
+            )
+        )
+
+    return Portfolio(
+        name="Synthetic",
+        currency="USD",
+        assets=assets,
+        data_provider=StaticDataProvider(prices, info),
+        account=Account(name="Cash Account", currency="USD"),
+        start_date=index[0].strftime("%Y-%m-%d"),
+    )
+
+
+@contextmanager
+def measure(label):
+    """
+    Prints wall time and tracemalloc peak memory of the enclosed block.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<45} {elapsed:8.3f} s {peak / 2**20:10.1f} MiB peak")
@@ -0,0 +1,59 @@
+"""
+Cost of date parsing on the loading and time series paths.
+
+Compares the previous string/datetime based code with the datetime64 forms
+used now: the portfolio start date, the daily date series of the holding
+intervals and the conversion of a DatetimeIndex for price lookups.
+
+Usage:
+    python -m benchmarks.date_parsing [n_transactions] [n_intervals]
+"""
+
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.utils.dates import expand_day_ranges, to_datetime64_array
+
+from .common import measure
+
+
+def legacy_date_series(intervals):
+    """Reference implementation: one pd.date_range per interval, then a set."""
+    all_dates = []
+    for start_date, end_date in intervals:
+        all_dates.extend(pd.date_range(start=start_date, end=end_date, freq="D"))
+    return pd.DatetimeIndex(sorted(set(all_dates)))
+
+
+def main(n_transactions=50_000, n_intervals=1_000):
+    rng = np.random.default_rng(0)
+    days = np.datetime64("2000-01-01") + rng.integers(0, 9000, n_transactions)
+    date_strings = days.astype(str).tolist()
+    starts = np.sort(np.datetime64("2000-01-01") + rng.integers(0, 9000, n_intervals))
+    ends = starts + rng.integers(0, 120, n_intervals)
+    intervals = list(zip(starts.astype(str).tolist(), ends.astype(str).tolist()))
+    print(f"{n_transactions} transaction dates, {n_intervals} intervals")
+
+    with measure("start date: strptime per transaction"):
+        legacy_start = min(datetime.strptime(d, "%Y-%m-%d") for d in date_strings)
+    with measure("start date: one datetime64 conversion"):
+        start = to_datetime64_array(date_strings).min()
+    assert legacy_start.date() == start.item()
+
+    with measure("date series: pd.date_range + set"):
+        legacy = legacy_date_series(intervals)
+    with measure("date series: datetime64 day ranges"):
+        series = pd.DatetimeIndex(expand_day_ranges(starts, ends).astype("M8[ns]"))
+    assert legacy.equals(series)
+
+    with measure("DatetimeIndex -> datetime64[D], per Timestamp"):
+        np.array(list(series), dtype="datetime64[D]")
+    with measure("DatetimeIndex -> datetime64[D], vectorized"):
+        to_datetime64_array(series)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
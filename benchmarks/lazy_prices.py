@@ -0,0 +1,82 @@
+"""
+Cost of loading a portfolio when asset prices are fetched on first use.
+
+A provider that counts its calls and sleeps for every fetch (standing in for
+a download or a cache read) shows how many price series each step requests:
+loading the portfolio fetches none, a valuation on one date fetches a small
+window per held ticker, and the full series only when it is read.
+
+Usage:
+    python -m benchmarks.lazy_prices [n_assets] [fetch_ms]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from portfolio_toolkit.asset.market.price_loader import slice_price_series
+from portfolio_toolkit.portfolio import Portfolio
+
+from .common import StaticDataProvider, measure
+from .ledger_import import make_ledger
+
+
+class SlowDataProvider(StaticDataProvider):
+    """StaticDataProvider that pays a fixed delay per price request."""
+
+    def __init__(self, prices, fetch_seconds):
+        super().__init__(prices)
+        self.fetch_seconds = fetch_seconds
+        self.full_fetches = 0
+        self.window_fetches = 0
+
+    def get_price_series_converted(self, ticker, target_currency, column="Close"):
+        self.full_fetches += 1
+        time.sleep(self.fetch_seconds)
+        return self.prices[ticker]
+
+    def get_price_series_converted_between(
+        self, ticker, target_currency, start=None, end=None, column="Close"
+    ):
+        self.window_fetches += 1
+        time.sleep(self.fetch_seconds)
+        return slice_price_series(self.prices[ticker], start, end)
+
+
+def main(n_assets=500, fetch_ms=5):
+    ledger = make_ledger(n_assets * 40, n_assets)
+    index = pd.bdate_range("2015-01-01", "2025-01-01")
+    prices = {f"T{i:04d}": pd.Series(100.0, index=index) for i in range(n_assets)}
+    provider = SlowDataProvider(prices, fetch_ms / 1000)
+    data = {
+        "name": "Benchmark",
+        "currency": "USD",
+        "transactions": ledger.astype(object)
+        .where(ledger.notna(), None)
+        .to_dict("records"),
+    }
+    print(f"{n_assets} assets, {fetch_ms} ms per price request")
+
+    def report():
+        print(
+            f"  full fetches: {provider.full_fetches}, "
+            f"window fetches: {provider.window_fetches}"
+        )
+
+    with measure("Portfolio.from_dict"):
+        portfolio = Portfolio.from_dict(data, provider)
+    report()
+
+    with measure("get_open_positions (one date)"):
+        portfolio.get_open_positions("2024-12-31")
+    report()
+
+    with measure("read every asset.prices"):
+        for asset in portfolio.assets:
+            asset.prices
+    report()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
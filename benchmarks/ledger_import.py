@@ -0,0 +1,95 @@
+"""
+Time and peak memory of loading a large ledger.
+
+Compares the JSON path (json.load of the whole portfolio, then
+portfolio_from_dict dispatching one dict at a time) with the chunked
+CSV and NDJSON import of import_ledger.
+
+Usage:
+    python -m benchmarks.ledger_import [n_rows] [n_assets]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.portfolio.ledger_import import import_ledger
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+
+from .common import StaticDataProvider, measure
+
+
+def make_ledger(n_rows, n_assets, seed=0):
+    """Random buy/sell/dividend rows plus cash deposits, as a DataFrame."""
+    rng = np.random.default_rng(seed)
+    dates = np.sort(np.datetime64("2015-01-01") + rng.integers(0, 3650, n_rows)).astype(
+        str
+    )
+    tickers = np.array([f"T{i:04d}" for i in range(n_assets)], dtype=object)
+    quantity = rng.integers(1, 50, n_rows).astype(float)
+    price = rng.uniform(10, 200, n_rows).round(2)
+    total = (quantity * price).round(2)
+    cash = rng.random(n_rows) < 0.05
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "ticker": np.where(cash, None, tickers[rng.integers(0, n_assets, n_rows)]),
+            "type": np.where(
+                cash,
+                "deposit",
+                rng.choice(["buy", "buy", "sell", "dividend"], n_rows),
+            ),
+            "quantity": quantity,
+            "price": price,
+            "currency": "USD",
+            "total": total,
+            "exchange_rate": 1.0,
+            "subtotal_base": total,
+            "fees_base": 0.0,
+            "total_base": total,
+        }
+    )
+
+
+def main(n_rows=200_000, n_assets=200):
+    ledger = make_ledger(n_rows, n_assets)
+    index = pd.bdate_range("2015-01-01", "2025-01-01")
+    prices = {f"T{i:04d}": pd.Series(100.0, index=index) for i in range(n_assets)}
+    provider = StaticDataProvider(prices)
+    print(f"{n_rows} rows, {n_assets} assets")
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "portfolio.json")
+        csv_path = os.path.join(directory, "ledger.csv")
+        ndjson_path = os.path.join(directory, "ledger.ndjson")
+        records = ledger.astype(object).where(ledger.notna(), None)
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    "name": "Benchmark",
+                    "currency": "USD",
+                    "transactions": records.to_dict("records"),
+                },
+                f,
+            )
+        ledger.to_csv(csv_path, index=False)
+        ledger.to_json(ndjson_path, orient="records", lines=True)
+        del records
+
+        with measure("json.load + portfolio_from_dict"):
+            with open(json_path) as f:
+                portfolio_from_dict(json.load(f), provider)
+
+        with measure("import_ledger, CSV"):
+            import_ledger(csv_path, provider, "USD")
+
+        with measure("import_ledger, NDJSON"):
+            import_ledger(ndjson_path, provider, "USD")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,50 @@
+"""
+PortfolioStats for a ten-year history: one query per year versus one sweep.
+
+Each measurement uses a fresh portfolio, so per-asset query caches do not
+carry over between the two approaches.
+
+Usage:
+    python -m benchmarks.multi_year_stats [n_assets] [trades_per_asset]
+"""
+
+import sys
+
+from portfolio_toolkit.portfolio import PortfolioStats
+
+from .common import make_synthetic_portfolio, measure
+
+
+def main(n_assets=200, trades_per_asset=400):
+    def portfolio():
+        return make_synthetic_portfolio(
+            n_assets=n_assets,
+            n_days=10 * 365,
+            trades_per_asset=trades_per_asset,
+            end_date="2024-12-31",
+        )
+
+    years = [str(year) for year in range(2015, 2025)]
+    print(
+        f"{n_assets} assets, {trades_per_asset} trades each, years {years[0]}-{years[-1]}"
+    )
+
+    loaded = portfolio()
+    with measure("get_stats, one call per year"):
+        per_year = [loaded.get_stats(year) for year in years]
+
+    loaded = portfolio()
+    with measure("PortfolioStats.for_years"):
+        swept = PortfolioStats.for_years(loaded, years)
+
+    loaded = portfolio()
+    with measure("PortfolioStats.for_periods, monthly"):
+        months = PortfolioStats.for_periods(loaded, "2015-01-01", "2024-12-31", "month")
+
+    for single, year in zip(per_year, years):
+        assert abs(single.final_valuation - swept[year].final_valuation) < 1e-6
+    assert len(months) == 120
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""
+Time-weighted and money-weighted returns over many windows.
+
+Builds the daily value and flow series of a synthetic ten-year portfolio,
+then evaluates rolling one-year windows in one batch and one at a time.
+
+Usage:
+    python -m benchmarks.returns_engine [n_assets] [n_windows]
+"""
+
+import sys
+
+import numpy as np
+
+from .common import make_synthetic_portfolio, measure
+
+
+def main(n_assets=200, n_windows=2000):
+    portfolio = make_synthetic_portfolio(
+        n_assets=n_assets, n_days=10 * 365, trades_per_asset=200, end_date="2024-12-31"
+    )
+    print(f"{n_assets} assets, {n_windows} rolling one-year windows")
+
+    with measure("Portfolio.get_returns"):
+        returns = portfolio.get_returns(end_date="2024-12-31")
+
+    starts = returns.dates[1] + np.linspace(
+        0, len(returns.dates) - 368, n_windows
+    ).astype("int64")
+    ends = starts + 364
+
+    with measure("twrs + mwrs, one batch"):
+        twrs = returns.twrs(starts, ends)
+        mwrs = returns.mwrs(starts, ends)
+
+    sample = slice(0, n_windows, 10)
+    with measure(f"twr + mwr, one call per window ({n_windows // 10})"):
+        single = [
+            (returns.twr(start, end), returns.mwr(start, end))
+            for start, end in zip(starts[sample], ends[sample])
+        ]
+
+    with measure("table, monthly"):
+        table = returns.table("month")
+
+    assert np.allclose([pair[0] for pair in single], twrs[sample])
+    assert np.allclose(
+        [pair[1] for pair in single], mwrs[sample], equal_nan=True, atol=1e-8
+    )
+    print(f"{len(table)} months")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Time and peak memory of reloading a portfolio from its compiled snapshot.
+
+Compares json.load + Portfolio.from_dict with Portfolio.from_file once the
+snapshot written by compile_portfolio is current.
+
+Usage:
+    python -m benchmarks.snapshot_loading [n_rows] [n_assets]
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from portfolio_toolkit.portfolio import Portfolio
+from portfolio_toolkit.portfolio.snapshot import compile_portfolio
+
+from .common import StaticDataProvider, measure
+from .ledger_import import make_ledger
+
+
+def main(n_rows=200_000, n_assets=200):
+    ledger = make_ledger(n_rows, n_assets)
+    index = pd.bdate_range("2015-01-01", "2025-01-01")
+    prices = {f"T{i:04d}": pd.Series(100.0, index=index) for i in range(n_assets)}
+    provider = StaticDataProvider(prices)
+    print(f"{n_rows} rows, {n_assets} assets")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "portfolio.json")
+        records = ledger.astype(object).where(ledger.notna(), None)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "name": "Benchmark",
+                    "currency": "USD",
+                    "transactions": records.to_dict("records"),
+                },
+                f,
+            )
+        del records
+
+        with measure("json.load + Portfolio.from_dict"):
+            with open(path) as f:
+                Portfolio.from_dict(json.load(f), provider)
+
+        with measure("compile_portfolio"):
+            _, snapshot = compile_portfolio(path, provider)
+        print(f"snapshot size: {os.path.getsize(snapshot) / 2**20:.1f} MiB")
+
+        with measure("Portfolio.from_file (snapshot)"):
+            portfolio = Portfolio.from_file(path, provider)
+
+        assert len(portfolio.assets) == n_assets
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
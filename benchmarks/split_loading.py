@@ -0,0 +1,133 @@
+"""
+Portfolio loading time for split-heavy histories.
+
+Compares applying each split as synthetic sell/buy transactions after a full
+replay (the previous loader) with adding every split of a ticker as an
+adjustment event handled by a single lot replay.
+
+Usage:
+    python -m benchmarks.split_loading [n_tickers] [transactions_per_ticker] [splits_per_ticker]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.asset import PortfolioAssetTransaction
+from portfolio_toolkit.portfolio.portfolio_from_dict import process_transactions
+from portfolio_toolkit.position.lots import LotEngine
+
+from .common import StaticDataProvider, measure
+
+
+def make_split_history(n_tickers, n_transactions, n_splits, seed=0):
+    """
+    Builds portfolio JSON transactions and splits for ``n_tickers`` tickers.
+
+    Returns:
+        tuple: (transactions, splits, data provider)
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2025-12-31", periods=max(n_transactions * 2, 260))
+    prices, transactions, splits = {}, [], []
+
+    for i in range(n_tickers):
+        ticker = f"T{i:04d}"
+        prices[ticker] = pd.Series(
+            50 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, len(index)))), index=index
+        )
+        days = np.sort(rng.choice(len(index), size=n_transactions, replace=False))
+        held = 0
+        for day in days:
+            price = float(prices[ticker].iloc[day])
+            if held > 0 and rng.random() < 0.4:
+                transaction_type, quantity = "sell", int(rng.integers(1, held + 1))
+                held -= quantity
+            else:
+                transaction_type, quantity = "buy", int(rng.integers(1, 50))
+                held += quantity
+            total = quantity * price
+            transactions.append(
+                {
+                    "date": index[day].strftime("%Y-%m-%d"),
+                    "type": transaction_type,
+                    "ticker": ticker,
+                    "quantity": quantity,
+                    "price": price,
+                    "currency": "USD",
+                    "total": total,
+                    "exchange_rate": 1.0,
+                    "subtotal_base": total,
+                    "fees_base": 0.0,
+                    "total_base": total,
+                }
+            )
+
+        for day in np.sort(rng.choice(len(index), size=n_splits, replace=False)):
+            factor = float(rng.choice([2.0, 3.0, 0.5, 0.1]))
+            splits.append(
+                {
+                    "ticker": ticker,
+                    "date": index[day].strftime("%Y-%m-%d"),
+                    "split_factor": factor,
+                }
+            )
+
+    transactions.sort(key=lambda transaction: transaction["date"])
+    return transactions, splits, StaticDataProvider(prices)
+
+
+def legacy_add_split(asset, split_dict):
+    """Reference implementation: full replay, then a synthetic sell and buy."""
+    table = asset.transactions
+    engine = LotEngine(table).advance(split_dict["date"])
+    quantity, cost = engine.open_quantity_and_cost()
+    if quantity == 0:
+        return 0.0
+
+    factor = split_dict["split_factor"]
+    new_quantity = int(quantity * factor)
+    new_price = cost / quantity / factor
+    for transaction_type, amount, price in (
+        ("sell", quantity, cost / quantity),
+        ("buy", new_quantity, new_price),
+    ):
+        total = amount * price
+        asset.add_transaction(
+            PortfolioAssetTransaction(
+                date=split_dict["date"],
+                transaction_type=transaction_type,
+                quantity=amount,
+                price=price,
+                currency="USD",
+                total=total,
+                exchange_rate=1.0,
+                subtotal_base=total,
+                fees_base=0.0,
+                total_base=total,
+            )
+        )
+    return (quantity * factor - new_quantity) * new_price
+
+
+def main(n_tickers=20, n_transactions=2000, n_splits=40):
+    transactions, splits, provider = make_split_history(
+        n_tickers, n_transactions, n_splits
+    )
+    print(f"{n_tickers} tickers, {n_transactions} transactions, {n_splits} splits")
+
+    with measure("synthetic sell/buy per split"):
+        assets, _, _ = process_transactions(transactions, [], "USD", provider)
+        by_ticker = {asset.ticker: asset for asset in assets}
+        for split in splits:
+            legacy_add_split(by_ticker[split["ticker"]], split)
+
+    with measure("split events, one replay per ticker"):
+        assets, _, _ = process_transactions(transactions, splits, "USD", provider)
+        for asset in assets:
+            asset.get_lot_engine()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""
+Peak memory of building the portfolio time series frame.
+
+Compares the previous list-of-dicts construction with the column-wise builder
+used by PortfolioTimeSeries, with float64 and float32 value columns.
+
+Usage:
+    python -m benchmarks.time_series_memory [n_assets] [n_days]
+"""
+
+import sys
+
+import pandas as pd
+
+from portfolio_toolkit.portfolio.time_series.utils import (
+    PositionCursor,
+    create_date_series_from_intervals,
+    get_ticker_holding_intervals,
+)
+
+from .common import make_synthetic_portfolio, measure
+
+
+def build_from_records(portfolio):
+    """Reference implementation: one dict per row, then pd.DataFrame(records)."""
+    records = []
+    for asset in portfolio.assets:
+        intervals = get_ticker_holding_intervals(portfolio.assets, asset.ticker)
+        dates = create_date_series_from_intervals(intervals)
+        prices = asset.prices.asof(dates).fillna(0.0).to_numpy()
+        cursor = PositionCursor(asset)
+        for date, price in zip(dates, prices):
+            quantity, cost = cursor.advance(date.strftime("%Y-%m-%d"))
+            records.append(
+                {
+                    "Date": date,
+                    "Ticker": asset.ticker,
+                    "Quantity": quantity,
+                    "Price": 0,
+                    "Price_Base": price,
+                    "Value": 0,
+                    "Value_Base": quantity * price,
+                    "Cost": cost,
+                    "Sector": asset.sector,
+                    "Country": asset.country,
+                }
+            )
+    return pd.DataFrame(records)
+
+
+def main(n_assets=100, n_days=5 * 365):
+    portfolio = make_synthetic_portfolio(n_assets=n_assets, n_days=n_days)
+    print(f"{n_assets} assets, {n_days} days")
+
+    with measure("list of dicts"):
+        legacy = build_from_records(portfolio)
+
+    with measure("column-wise, float64"):
+        compact = portfolio.get_time_series().portfolio_timeseries
+
+    with measure("column-wise, float32"):
+        compact32 = portfolio.get_time_series(
+            float_dtype="float32"
+        ).portfolio_timeseries
+
+    for label, frame in [
+        ("list of dicts", legacy),
+        ("column-wise, float64", compact),
+        ("column-wise, float32", compact32),
+    ]:
+        size = frame.memory_usage(deep=True).sum() / 2**20
+        print(f"{label:<45} {len(frame):10d} rows {size:10.1f} MiB frame")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,61 @@
+"""
+Time and peak memory of exporting all asset transactions.
+
+Compares the previous export (one list-of-dicts frame per asset, appended
+with pd.concat in a loop) with the column-wise PortfolioAsset.to_dataframe
+and the chunked CSV writer used by ``portfolio transactions --output``.
+
+Usage:
+    python -m benchmarks.transaction_export [n_assets] [trades_per_asset]
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from portfolio_toolkit.asset import PortfolioAsset, PortfolioAssetTransaction
+from portfolio_toolkit.asset.portfolio.transaction_export import (
+    write_transactions_csv,
+)
+
+from .common import make_synthetic_portfolio, measure
+
+
+def concat_in_loop(assets):
+    """Reference implementation: quadratic pd.concat over assets."""
+    data = pd.DataFrame()
+    for asset in assets:
+        transactions = PortfolioAssetTransaction.to_dataframe(
+            list(asset.transactions), asset.ticker
+        )
+        data = pd.concat([data, transactions], ignore_index=True)
+    data.sort_values(by=["date", "ticker"], inplace=True)
+    return data.reset_index(drop=True)
+
+
+def main(n_assets=500, trades_per_asset=400):
+    portfolio = make_synthetic_portfolio(
+        n_assets=n_assets, trades_per_asset=trades_per_asset
+    )
+    print(f"{n_assets} assets, {n_assets * trades_per_asset} transactions")
+
+    with measure("pd.concat in a loop"):
+        legacy = concat_in_loop(portfolio.assets)
+
+    with measure("column-wise to_dataframe"):
+        data = PortfolioAsset.to_dataframe(portfolio.assets)
+
+    assert len(legacy) == len(data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "transactions.csv")
+        with measure("to_dataframe + to_csv"):
+            PortfolioAsset.to_dataframe(portfolio.assets).to_csv(path, index=False)
+        with measure("chunked CSV writer"):
+            write_transactions_csv(portfolio.assets, path)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,119 @@
+"""
+Memory per position and transaction object.
+
+Compares plain dataclasses (one __dict__ per instance) with the slotted value
+objects used by the toolkit, and a list of ClosedPosition objects with the
+array-backed ClosedPositionList returned by Portfolio.get_closed_positions.
+
+Usage:
+    python -m benchmarks.value_object_memory [n_objects]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import field, fields, make_dataclass
+from datetime import date
+
+import numpy as np
+
+from portfolio_toolkit.account.transaction import AccountTransaction
+from portfolio_toolkit.asset import PortfolioAssetTransaction
+from portfolio_toolkit.position import ClosedPosition, OpenPosition
+from portfolio_toolkit.position.closed import ClosedPositionArrays, ClosedPositionList
+
+from .common import measure
+
+
+def unslotted(cls):
+    """Reference: a plain dataclass with the same fields and __post_init__."""
+    specs = [
+        (f.name, f.type, field(init=f.init, default=f.default)) for f in fields(cls)
+    ]
+    namespace = {}
+    if hasattr(cls, "__post_init__"):
+        namespace["__post_init__"] = cls.__post_init__
+    return make_dataclass(f"Plain{cls.__name__}", specs, namespace=namespace)
+
+
+# Keyword arguments of the i-th sample object of each class
+SAMPLES = {
+    OpenPosition: lambda i: dict(
+        ticker=f"T{i % 500:04d}",
+        buy_price=float(i % 1000),
+        quantity=10.0,
+        current_price=float(i % 700),
+        sector="Technology",
+        country="United States",
+    ),
+    ClosedPosition: lambda i: dict(
+        ticker=f"T{i % 500:04d}",
+        buy_price=float(i % 1000),
+        quantity=10.0,
+        buy_date="2024-01-02",
+        sell_price=float(i % 700),
+        sell_date="2025-01-02",
+    ),
+    PortfolioAssetTransaction: lambda i: dict(
+        date="2025-01-02",
+        transaction_type="buy",
+        quantity=10.0,
+        price=float(i % 1000),
+        currency="USD",
+        total=float(i % 1000) * 10,
+        exchange_rate=1.0,
+        subtotal_base=float(i % 1000) * 10,
+        fees_base=0.0,
+        total_base=float(i % 1000) * 10,
+    ),
+    AccountTransaction: lambda i: dict(
+        transaction_date=date(2025, 1, 2),
+        transaction_type="deposit",
+        amount=float(i % 1000),
+    ),
+}
+
+
+def bytes_per_object(factory, n):
+    tracemalloc.start()
+    objects = [factory(i) for i in range(n)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / n
+
+
+def main(n=100_000):
+    print(f"{n} objects")
+    for cls in SAMPLES:
+        plain = unslotted(cls)
+        for label, target in (
+            (f"{cls.__name__}, __dict__", plain),
+            (cls.__name__, cls),
+        ):
+            per_object = bytes_per_object(lambda i: target(**SAMPLES[cls](i)), n)
+            print(f"{label:<45} {per_object:10.0f} B/object")
+
+    rng = np.random.default_rng(0)
+    arrays = ClosedPositionArrays(
+        tickers=np.array([f"T{i % 500:04d}" for i in range(n)], dtype=object),
+        sectors=np.full(n, "Technology", dtype=object),
+        buy_dates=np.datetime64("2024-01-02") + rng.integers(0, 365, n),
+        sell_dates=np.datetime64("2025-01-02") + rng.integers(0, 365, n),
+        quantities=rng.integers(1, 100, n).astype("float64"),
+        buy_prices=rng.uniform(10, 100, n),
+        sell_prices=rng.uniform(10, 100, n),
+    )
+
+    with measure("ClosedPositionList of objects"):
+        objects = ClosedPositionList([arrays.row(i) for i in range(n)])
+        objects.get_stats("2025-12-31")
+
+    with measure("array-backed ClosedPositionList"):
+        backed = ClosedPositionList.from_arrays(arrays)
+        backed.get_stats("2025-12-31")
+
+    assert len(objects) == len(backed)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,4 +1,5 @@
 from .account import Account
+from .ledger import AccountLedger
 from .transaction import AccountTransaction
 
-__all__ = ["AccountTransaction", "Account"]
+__all__ = ["AccountTransaction", "AccountLedger", "Account"]
@@ -1,9 +1,13 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
-from .transaction import AccountTransaction
+from portfolio_toolkit.utils.dates import to_datetime64, to_datetime64_array, today
+
+from .ledger import AccountLedger
+from .transaction import ACCOUNT_TRANSACTION_TYPES, AccountTransaction
 
 
 @dataclass
@@ -14,7 +18,16 @@ class Account:
 
     name: str
     currency: str
-    transactions: List[AccountTransaction] = field(default_factory=list)
+    transactions: AccountLedger = field(default_factory=AccountLedger)
+
+    # Running balance over the ledger, rebuilt lazily after mutations
+    _ledger_index: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if not isinstance(self.transactions, AccountLedger):
+            self.transactions = AccountLedger(self.transactions)
 
     def add_transaction(self, transaction: AccountTransaction):
         """
@@ -106,14 +119,19 @@ class Account:
         """
         return self.transactions.to_list()
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self, types: Optional[Iterable[str]] = None) -> pd.DataFrame:
         """
         Converts the account transactions to a pandas DataFrame.
 
+        Args:
+            types (Iterable[str], optional): Only include these transaction types.
+
         Returns:
             pd.DataFrame: DataFrame containing the account transactions.
         """
-        return self.transactions.to_dataframe()
+        if types is None:
+            return self.transactions.to_dataframe()
+        return self.transactions.to_dataframe(self.transactions.mask(types=types))
 
     def export_to_dataframe(self, from_date: str, to_date: str) -> pd.DataFrame:
         """
@@ -122,10 +140,10 @@ class Account:
         Returns:
             pd.DataFrame: DataFrame containing the account transactions.
         """
-        df = self.transactions.to_dataframe()
-        # Filter the DataFrame by the specified date range
-        df = df[(df["date"] >= from_date) & (df["date"] <= to_date)]
-        return df
+        # Binary search on the sorted ledger instead of filtering a full DataFrame
+        return self.transactions.to_dataframe(
+            self.transactions.search(from_date, to_date)
+        )
 
     def get_amount(self) -> float:
         """
@@ -134,7 +152,7 @@ class Account:
         Returns:
             float: Total amount of all transactions.
         """
-        return sum(tx.amount for tx in self.transactions)
+        return float(self.transactions.amounts.sum())
 
     def get_amount_at(self, date) -> float:
         """
@@ -146,33 +164,122 @@ class Account:
         Returns:
             float: Total amount of all transactions up to the specified date.
         """
-        from datetime import datetime
+        index = self._get_ledger_index()
+        position = np.searchsorted(index["dates"], to_datetime64(date), side="right")
+        return float(index["balances"][position - 1]) if position > 0 else 0.0
+
+    def get_amounts_at(self, dates: Iterable) -> np.ndarray:
+        """
+        Calculates the account balance at each of the given dates.
+
+        Args:
+            dates (Iterable): Cutoff dates (strings or date objects), in any order.
+
+        Returns:
+            np.ndarray: Balance on or before each date, in the same order.
+        """
+        index = self._get_ledger_index()
+        positions = np.searchsorted(
+            index["dates"], to_datetime64_array(dates), side="right"
+        )
+        padded = np.concatenate(([0.0], index["balances"]))
+        return padded[positions]
+
+    def get_balance_series(
+        self,
+        start_date=None,
+        end_date=None,
+        freq: str = "D",
+        by_type: bool = False,
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Computes the account balance for every day of a date range in one pass.
 
-        # Convert date to date object if it's a string
-        if isinstance(date, str):
-            cutoff_date = datetime.strptime(date, "%Y-%m-%d").date()
-        else:  # assume it's already a date object
-            cutoff_date = date
+        Transactions are bucketed per day (and per type) and accumulated with a
+        single cumulative sum, so the whole series costs about the same as one
+        balance lookup per transaction.
 
-        total = 0
-        for tx in self.transactions:
-            # Convert transaction date to date object for comparison
-            if isinstance(tx.transaction_date, str):
-                tx_date = datetime.strptime(tx.transaction_date, "%Y-%m-%d").date()
-            else:  # assume it's already a date object
-                tx_date = tx.transaction_date
+        Args:
+            start_date (optional): First date of the series. Transactions before it
+                are folded into the opening balance. Defaults to the first
+                transaction date.
+            end_date (optional): Last date of the series. Defaults to today.
+            freq (str): "D" for daily values, or any pandas offset alias (e.g. "W",
+                "ME", "QE", "YE") to return the balance at the end of each period.
+            by_type (bool): If True, return a DataFrame with the running
+                contribution of each transaction type plus a "balance" column.
+
+        Returns:
+            Union[pd.Series, pd.DataFrame]: Balance indexed by date.
+        """
+        index = self._get_ledger_index()
+        dates = index["dates"]
 
-            # Include transaction if it's on or before the cutoff date
-            if tx_date <= cutoff_date:
-                total += tx.amount
+        if start_date is not None:
+            start = to_datetime64(start_date)
+        elif len(dates):
+            start = dates[0]
+        else:
+            start = today()
+        end = to_datetime64(end_date) if end_date is not None else today()
+
+        calendar = np.arange(start, end + 1, dtype="datetime64[D]")
+        included = dates <= end
+        offsets = np.clip((dates[included] - start).astype("int64"), 0, None)
+
+        # Daily net flows per transaction type, then one cumulative sum over days
+        flows = np.zeros((len(ACCOUNT_TRANSACTION_TYPES), len(calendar)))
+        if len(calendar):
+            np.add.at(
+                flows,
+                (index["types"][included], offsets),
+                index["amounts"][included],
+            )
+        running = np.cumsum(flows, axis=1)
+
+        date_index = pd.DatetimeIndex(calendar, name="Date")
+        if by_type:
+            result = pd.DataFrame(
+                running.T, index=date_index, columns=list(ACCOUNT_TRANSACTION_TYPES)
+            )
+            result["balance"] = running.sum(axis=0)
+        else:
+            result = pd.Series(running.sum(axis=0), index=date_index, name="balance")
 
-        return total
+        if freq != "D":
+            result = result.resample(freq).last()
+
+        return result
+
+    def _get_ledger_index(self) -> Dict[str, Any]:
+        """
+        Returns the ledger arrays plus the running balance after each transaction.
+
+        The balance is recomputed only when the ledger changed since the last call,
+        so balance queries are a binary search instead of a full scan.
+        """
+        ledger = self.transactions
+        if (
+            self._ledger_index is None
+            or self._ledger_index["version"] != ledger.version
+        ):
+            self._ledger_index = {
+                "version": ledger.version,
+                "dates": ledger.dates,
+                "amounts": ledger.amounts,
+                "types": ledger.types,
+                "balances": np.cumsum(ledger.amounts),
+            }
+
+        return self._ledger_index
 
     def sort_transactions(self):
         """
         Sorts the account transactions by date.
+
+        The ledger is always kept in date order, so this is a no-op kept for
+        compatibility.
         """
-        self.transactions.sort(key=lambda x: x.transaction_date)
 
     def __repr__(self):
         return f"Account(name={self.name}, currency={self.currency}, transactions={self.transactions})"
@@ -0,0 +1,179 @@
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.utils.columnar import SortedColumnStore
+from portfolio_toolkit.utils.dates import to_datetime64, to_datetime64_array
+
+from .transaction import ACCOUNT_TRANSACTION_TYPES, AccountTransaction
+
+
+class AccountLedger(SortedColumnStore):
+    """
+    Columnar store of account transactions, kept sorted by date.
+
+    Transactions are stored as parallel arrays (datetime64 dates, int8 type codes
+    indexing ACCOUNT_TRANSACTION_TYPES, float amounts and descriptions). Indexing
+    or iterating returns AccountTransaction objects, which are built on the fly
+    and kept only for compatibility: modifying them does not change the ledger.
+    """
+
+    COLUMNS = {
+        "date": "datetime64[D]",
+        "type": "int8",
+        "amount": "float64",
+        "description": "object",
+    }
+
+    def __init__(self, transactions: Optional[Iterable[AccountTransaction]] = None):
+        super().__init__()
+        if transactions is not None:
+            self.extend(transactions)
+
+    def append(self, transaction: AccountTransaction):
+        """
+        Adds a transaction at its date position.
+
+        Args:
+            transaction (AccountTransaction): The transaction to add.
+        """
+        self._insert_row(
+            {
+                "date": to_datetime64(transaction.transaction_date),
+                "type": ACCOUNT_TRANSACTION_TYPES.index(transaction.transaction_type),
+                "amount": transaction.amount,
+                "description": transaction.description,
+            }
+        )
+
+    def extend(self, transactions: Iterable[AccountTransaction]):
+        """
+        Adds many transactions at once.
+
+        Args:
+            transactions (Iterable[AccountTransaction]): The transactions to add.
+        """
+        transactions = list(transactions)
+        self._extend_columns(
+            {
+                "date": to_datetime64_array(tx.transaction_date for tx in transactions),
+                "type": np.array(
+                    [
+                        ACCOUNT_TRANSACTION_TYPES.index(tx.transaction_type)
+                        for tx in transactions
+                    ],
+                    dtype="int8",
+                ),
+                "amount": np.array([tx.amount for tx in transactions], dtype=float),
+                "description": np.array(
+                    [tx.description for tx in transactions], dtype=object
+                ),
+            }
+        )
+
+    def extend_arrays(
+        self,
+        dates: np.ndarray,
+        types: np.ndarray,
+        amounts: np.ndarray,
+        descriptions: Optional[np.ndarray] = None,
+    ):
+        """
+        Adds already validated transactions given as column arrays.
+
+        Args:
+            dates (np.ndarray): Transaction dates (datetime64[D]).
+            types (np.ndarray): Type codes indexing ACCOUNT_TRANSACTION_TYPES.
+            amounts (np.ndarray): Signed amounts.
+            descriptions (np.ndarray, optional): Descriptions, or None for all rows.
+        """
+        if descriptions is None:
+            descriptions = np.full(len(dates), None, dtype=object)
+        self._extend_columns(
+            {
+                "date": np.asarray(dates, dtype="datetime64[D]"),
+                "type": np.asarray(types, dtype="int8"),
+                "amount": np.asarray(amounts, dtype=float),
+                "description": np.asarray(descriptions, dtype=object),
+            }
+        )
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.column("date")
+
+    @property
+    def types(self) -> np.ndarray:
+        return self.column("type")
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self.column("amount")
+
+    @property
+    def descriptions(self) -> np.ndarray:
+        return self.column("description")
+
+    def mask(
+        self,
+        types: Optional[Iterable[str]] = None,
+        from_date=None,
+        to_date=None,
+    ) -> np.ndarray:
+        """
+        Builds a boolean row mask from a type filter and a date range.
+
+        Args:
+            types (Iterable[str], optional): Transaction types to keep.
+            from_date (optional): First date to keep.
+            to_date (optional): Last date to keep.
+
+        Returns:
+            np.ndarray: Boolean array with one entry per transaction.
+        """
+        selected = np.zeros(len(self), dtype=bool)
+        selected[self.search(from_date, to_date)] = True
+        if types is not None:
+            codes = [ACCOUNT_TRANSACTION_TYPES.index(name) for name in types]
+            selected &= np.isin(self.types, codes)
+        return selected
+
+    def to_list(self) -> List[dict]:
+        """Convert the ledger to a list of dictionaries."""
+        return AccountTransaction.to_list(list(self))
+
+    def to_dataframe(self, rows=None) -> pd.DataFrame:
+        """
+        Converts the ledger to a pandas DataFrame.
+
+        Amounts and type codes are handed to pandas without copying; the type
+        column is a categorical over ACCOUNT_TRANSACTION_TYPES.
+
+        Args:
+            rows (optional): Slice or boolean mask selecting the rows to export.
+
+        Returns:
+            pd.DataFrame: Columns date, type, amount and description.
+        """
+        rows = slice(None) if rows is None else rows
+        return pd.DataFrame(
+            {
+                "date": self.dates[rows],
+                "type": pd.Categorical.from_codes(
+                    self.types[rows], categories=list(ACCOUNT_TRANSACTION_TYPES)
+                ),
+                "amount": self.amounts[rows],
+                "description": self.descriptions[rows],
+            },
+            copy=False,
+        )
+
+    def _row_to_object(self, position: int) -> AccountTransaction:
+        columns = self._columns
+        return AccountTransaction(
+            transaction_date=columns["date"][position].astype(object),
+            transaction_type=ACCOUNT_TRANSACTION_TYPES[columns["type"][position]],
+            amount=float(columns["amount"][position]),
+            description=columns["description"][position],
+        )
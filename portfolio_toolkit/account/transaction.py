@@ -1,11 +1,21 @@
-from dataclasses import dataclass
 from datetime import date
 from typing import List, Optional
 
 import pandas as pd
 
+from portfolio_toolkit.utils.slots import slotted_dataclass
 
-@dataclass
+ACCOUNT_TRANSACTION_TYPES = (
+    "buy",
+    "sell",
+    "deposit",
+    "withdrawal",
+    "income",
+    "adjustment",
+)
+
+
+@slotted_dataclass
 class AccountTransaction:
     """
     Represents a transaction in an account.
@@ -17,15 +27,15 @@ class AccountTransaction:
     description: Optional[str] = None
 
     def __post_init__(self):
-        allowed_types = {"buy", "sell", "deposit", "withdrawal", "income", "adjustment"}
-        if self.transaction_type not in allowed_types:
+        if self.transaction_type not in ACCOUNT_TRANSACTION_TYPES:
             raise ValueError(f"Invalid transaction type: {self.transaction_type}")
 
-    def to_list(self) -> List[dict]:
+    @classmethod
+    def to_list(cls, transactions: List["AccountTransaction"]) -> List[dict]:
         """Convert a list of AccountTransaction objects to a list of dictionaries."""
 
         data = []
-        for tx in self.transactions:
+        for tx in transactions:
             data.append(
                 {
                     "date": tx.transaction_date,
@@ -37,10 +47,11 @@ class AccountTransaction:
 
         return data
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert the account transactions to a pandas DataFrame."""
+    @classmethod
+    def to_dataframe(cls, transactions: List["AccountTransaction"]) -> pd.DataFrame:
+        """Convert a list of AccountTransaction objects to a pandas DataFrame."""
 
-        data = self.to_list()
+        data = cls.to_list(transactions)
         return pd.DataFrame(data)
 
     def __repr__(self):
@@ -1,5 +1,9 @@
 from .market_asset import MarketAsset
+from .price_index import PriceIndex
+from .price_loader import PriceLoader
 
 __all__ = [
     "MarketAsset",
+    "PriceIndex",
+    "PriceLoader",
 ]
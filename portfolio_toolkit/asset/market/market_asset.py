@@ -1,13 +1,43 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from portfolio_toolkit.utils.dates import to_datetime64_array
+
+from .price_index import PriceIndex
+from .price_loader import PriceLoader
+
+
+class _Prices:
+    """
+    Descriptor behind ``MarketAsset.prices``.
+
+    Assigning a pd.Series (or None) stores it as before. Assigning a
+    PriceLoader defers the fetch: the full series is loaded on first read.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, asset, owner=None):
+        if asset is None:
+            # No class-level value, so the dataclass field keeps no default
+            raise AttributeError(self.name)
+        loader = asset.__dict__["_price_loader"]
+        return asset.__dict__["_prices"] if loader is None else loader.load()
+
+    def __set__(self, asset, value):
+        loader = value if isinstance(value, PriceLoader) else None
+        asset.__dict__["_price_loader"] = loader
+        asset.__dict__["_prices"] = None if loader is not None else value
+
 
 @dataclass
 class MarketAsset:
     ticker: str
-    prices: pd.Series
+    prices: pd.Series = _Prices()
     info: Dict
     currency: Optional[str] = None
 
@@ -15,11 +45,94 @@ class MarketAsset:
     sector: str = field(init=False)
     country: str = field(init=False)
 
+    # (prices, PriceIndex) pair; the index is rebuilt when the series it was
+    # built from is replaced (or a lazily loaded window is widened)
+    _price_index: Optional[Tuple[pd.Series, PriceIndex]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         self.sector = self.info.get("sector", "Unknown")
         self.country = self.info.get("country", "Unknown")
         self.currency = self.currency or self.info.get("currency", "Unknown")
 
+    @property
+    def prices_loaded(self) -> bool:
+        """
+        False while ``prices`` is a PriceLoader that has not fetched the full
+        series yet. Reading ``prices`` loads it.
+        """
+        loader = self.__dict__["_price_loader"]
+        return loader is None or loader.loaded
+
+    @property
+    def price_source(self):
+        """
+        The object prices come from: the PriceLoader when loaded lazily,
+        otherwise the series itself. Results derived from prices can be cached
+        against its identity without forcing a load.
+        """
+        return self.__dict__["_price_loader"] or self.__dict__["_prices"]
+
+    def get_price_index(self, start=None, end=None) -> PriceIndex:
+        """
+        Returns the as-of lookup index over ``prices``, building it on first use.
+
+        With a PriceLoader that has not loaded the full series, passing the
+        range of dates to look up (datetime64[D]) loads only that window.
+        """
+        loader = self.__dict__["_price_loader"]
+        if loader is None or loader.loaded or start is None or end is None:
+            prices = self.prices
+        else:
+            prices = loader.load_window(start, end)
+        if self._price_index is None or self._price_index[0] is not prices:
+            self._price_index = (prices, PriceIndex(prices))
+        return self._price_index[1]
+
+    def get_price_at(self, date, default: Optional[float] = None) -> Optional[float]:
+        """
+        Returns the last known price on or before a date.
+
+        Args:
+            date: Date to look up ("YYYY-MM-DD" string, date or pd.Timestamp).
+            default (float, optional): Value returned when no price is known yet.
+
+        Returns:
+            Optional[float]: The price, or ``default``.
+        """
+        return self.get_price_index(*self._lookup_range([date])).get_price_at(
+            date, default
+        )
+
+    def get_prices_at(self, dates: Iterable, default: float = np.nan) -> np.ndarray:
+        """
+        Returns the last known price on or before each of the given dates.
+
+        Args:
+            dates (Iterable): Dates to look up, in any order.
+            default (float): Value for dates before the first known price.
+
+        Returns:
+            np.ndarray: One price per date, in the same order.
+        """
+        dates = to_datetime64_array(dates)
+        return self.get_price_index(*self._lookup_range(dates)).get_prices_at(
+            dates, default
+        )
+
+    def _lookup_range(self, dates) -> Tuple[Optional[np.datetime64], ...]:
+        """
+        Returns the (first, last) date to look up, or Nones when the prices
+        are already in memory and the range is not needed.
+        """
+        if self.prices_loaded:
+            return None, None
+        dates = to_datetime64_array(dates)
+        if not len(dates):
+            return None, None
+        return dates.min(), dates.max()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to a dictionary representation."""
         return {
@@ -29,8 +142,14 @@ class MarketAsset:
             "currency": self.currency,
         }
 
+    def _prices_length(self):
+        """Length of the prices for reprs, without loading them."""
+        if not self.prices_loaded:
+            return "not loaded"
+        return len(self.prices)
+
     def __repr__(self):
         return (
             f"MarketAsset(ticker={self.ticker}, sector={self.sector}, currency={self.currency}, "
-            f"prices_length={len(self.prices)}, info_keys={list(self.info.keys())})"
+            f"prices_length={self._prices_length()}, info_keys={list(self.info.keys())})"
         )
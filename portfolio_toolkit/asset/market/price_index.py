@@ -0,0 +1,69 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.utils.dates import to_day_numbers
+
+
+class PriceIndex:
+    """
+    As-of lookup over a daily price series.
+
+    The series is reduced once to a sorted int64 array of day numbers and a
+    float64 array of prices (NaN prices are dropped, so a lookup returns the
+    last known price). Every lookup is then a ``searchsorted`` on the day
+    numbers, for one date or many at once.
+    """
+
+    def __init__(self, prices: Optional[pd.Series]):
+        if prices is None or len(prices) == 0:
+            self.days = np.empty(0, dtype="int64")
+            self.values = np.empty(0, dtype="float64")
+            return
+
+        index = prices.index
+        if getattr(index, "tz", None) is not None:
+            # Keep the local calendar day of tz-aware timestamps
+            index = index.tz_localize(None)
+        days = np.asarray(index, dtype="datetime64[D]").view("int64")
+        values = np.asarray(prices, dtype="float64")
+
+        known = ~np.isnan(values)
+        days, values = days[known], values[known]
+        if np.any(days[1:] < days[:-1]):
+            order = np.argsort(days, kind="stable")
+            days, values = days[order], values[order]
+
+        self.days = days
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def get_prices_at(self, dates: Iterable, default: float = np.nan) -> np.ndarray:
+        """
+        Returns the last known price on or before each date.
+
+        Args:
+            dates (Iterable): Dates to look up ("YYYY-MM-DD" strings, dates,
+                pd.Timestamps or a datetime64 array), in any order.
+            default (float): Value for dates before the first known price.
+
+        Returns:
+            np.ndarray: One price per date, in the same order.
+        """
+        days = to_day_numbers(dates)
+
+        positions = np.searchsorted(self.days, days, side="right") - 1
+        if not len(self.values):
+            return np.full(len(days), default, dtype="float64")
+        prices = self.values[np.maximum(positions, 0)]
+        return np.where(positions >= 0, prices, default)
+
+    def get_price_at(self, date, default: Optional[float] = None) -> Optional[float]:
+        """
+        Returns the last known price on or before a date, or ``default``.
+        """
+        price = self.get_prices_at([date])[0]
+        return default if np.isnan(price) else float(price)
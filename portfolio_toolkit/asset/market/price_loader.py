@@ -0,0 +1,121 @@
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.utils.dates import to_datetime64
+
+# Days loaded before the first requested date, so that an as-of lookup still
+# finds the last close across weekends and market holidays
+PRICE_LOOKBACK_DAYS = 10
+
+
+class PriceLoader:
+    """
+    Deferred fetch of an asset's price series, converted to the asset currency.
+
+    Nothing is requested from the data provider until prices are needed.
+    ``load`` fetches the full series once; ``load_window`` fetches only the
+    prices needed for as-of lookups between two dates, widening the window
+    when a later request falls outside it.
+    """
+
+    def __init__(self, data_provider, ticker: str, currency: str):
+        self.data_provider = data_provider
+        self.ticker = ticker
+        self.currency = currency
+        self.series: Optional[pd.Series] = None
+        # (first day, last day, prices) of the widest window loaded so far,
+        # where the first day is that of the first known price
+        self._window: Optional[Tuple[np.datetime64, np.datetime64, pd.Series]] = None
+
+    @property
+    def loaded(self) -> bool:
+        """True once the full series has been fetched."""
+        return self.series is not None
+
+    def load(self) -> Optional[pd.Series]:
+        """
+        Returns the full price series, fetching it on first use.
+        """
+        if self.series is None:
+            self.series = self.data_provider.get_price_series_converted(
+                self.ticker, target_currency=self.currency
+            )
+            self._window = None
+        return self.series
+
+    def load_window(self, start, end) -> Optional[pd.Series]:
+        """
+        Returns prices enough to look up any date between ``start`` and ``end``.
+
+        The result starts PRICE_LOOKBACK_DAYS before ``start``. If it has no
+        price on or before ``start`` (a long gap or a delisted ticker), the
+        full series is loaded instead, so lookups match the full series.
+
+        Args:
+            start (np.datetime64): First date to look up (datetime64[D]).
+            end (np.datetime64): Last date to look up (datetime64[D]).
+
+        Returns:
+            Optional[pd.Series]: The window, or the full series once loaded.
+        """
+        if self.series is not None:
+            return self.series
+        if self._window is not None:
+            first, last, prices = self._window
+            if first <= start and end <= last:
+                return prices
+            start, end = min(first, start), max(last, end)
+
+        prices = self.data_provider.get_price_series_converted_between(
+            self.ticker,
+            self.currency,
+            start=start - np.timedelta64(PRICE_LOOKBACK_DAYS, "D"),
+            end=end,
+        )
+        known = None if prices is None else prices.dropna()
+        first = (
+            _index_days(known.index).min() if known is not None and len(known) else None
+        )
+        if first is None or first > start:
+            return self.load()
+        # Any date from the first known price to ``end`` can be looked up
+        self._window = (first, end, prices)
+        return prices
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"PriceLoader(ticker={self.ticker}, currency={self.currency}, {state})"
+
+
+def slice_price_series(prices: Optional[pd.Series], start=None, end=None):
+    """
+    Returns the prices dated between ``start`` and ``end``, both inclusive.
+
+    Timestamps are compared by local calendar day, so tz-aware indexes are
+    sliced like naive ones.
+
+    Args:
+        prices (pd.Series, optional): Price series indexed by date.
+        start: First date, or None for no lower bound.
+        end: Last date, or None for no upper bound.
+
+    Returns:
+        Optional[pd.Series]: The slice (``prices`` itself if None or unbounded).
+    """
+    if prices is None or (start is None and end is None):
+        return prices
+    days = _index_days(prices.index)
+    keep = np.ones(len(days), dtype=bool)
+    if start is not None:
+        keep &= days >= to_datetime64(start)
+    if end is not None:
+        keep &= days <= to_datetime64(end)
+    return prices[keep]
+
+
+def _index_days(index: pd.Index) -> np.ndarray:
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+    return np.asarray(index, dtype="datetime64[D]")
@@ -1,7 +1,9 @@
 from .portfolio_asset import PortfolioAsset
 from .portfolio_asset_transaction import PortfolioAssetTransaction
+from .transaction_table import TransactionTable
 
 __all__ = [
     "PortfolioAsset",
     "PortfolioAssetTransaction",
+    "TransactionTable",
 ]
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from portfolio_toolkit.data_provider.data_provider import DataProvider
 
+from ..market.price_loader import PriceLoader
 from .portfolio_asset import PortfolioAsset
 
 
@@ -20,7 +21,7 @@ def create_portfolio_asset(
         PortfolioAsset: The PortfolioAsset object with market data including:
                         - ticker
                         - sector
-                        - prices (historical price data)
+                        - prices (historical price data, loaded on first use)
                         - info (ticker information from data provider)
                         - currency
                         - transactions (empty list)
@@ -31,16 +32,44 @@ def create_portfolio_asset(
     # Determine currency - use provided currency or default from ticker info
     asset_currency = currency or data_provider.get_ticker_currency()
 
-    # Get historical price data
-    prices = data_provider.get_price_series_converted(
-        ticker, target_currency=asset_currency
-    )
-
-    # Create and return a PortfolioAsset object
+    # Historical prices are fetched on first use, see PriceLoader
     return PortfolioAsset(
         ticker=ticker,
-        prices=prices,
+        prices=PriceLoader(data_provider, ticker, asset_currency),
         info=ticker_info,
         currency=asset_currency,
         transactions=[],  # Initialize with an empty list of transactions
     )
+
+
+def create_portfolio_assets(
+    data_provider: DataProvider, tickers: Iterable[str], currency: str
+) -> Dict[str, PortfolioAsset]:
+    """
+    Creates the PortfolioAsset objects of several tickers at once.
+
+    Ticker information is requested in one ``get_tickers_info`` call, which
+    fetches concurrently (or in one batch, depending on the provider) instead
+    of one blocking request per ticker. Prices are loaded on first use, as in
+    ``create_portfolio_asset``.
+
+    Args:
+        data_provider: The data provider instance to fetch ticker information and prices.
+        tickers (Iterable[str]): The tickers, without duplicates.
+        currency (str): The currency for price data.
+
+    Returns:
+        Dict[str, PortfolioAsset]: Assets with no transactions, keyed by
+        ticker in the order given.
+    """
+    infos = data_provider.get_tickers_info(list(tickers))
+    return {
+        ticker: PortfolioAsset(
+            ticker=ticker,
+            prices=PriceLoader(data_provider, ticker, currency),
+            info=info,
+            currency=currency,
+            transactions=[],
+        )
+        for ticker, info in infos.items()
+    }
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
@@ -7,11 +7,23 @@ from portfolio_toolkit.data_provider.data_provider import DataProvider
 
 from ..market import MarketAsset
 from .portfolio_asset_transaction import PortfolioAssetTransaction
+from .transaction_table import TransactionTable
 
 
 @dataclass
 class PortfolioAsset(MarketAsset):
-    transactions: List[PortfolioAssetTransaction] = field(default_factory=list)
+    transactions: TransactionTable = field(default_factory=TransactionTable)
+
+    # Lot replays over the whole ledger per cost-basis method, reused while
+    # the ledger is unchanged
+    _lot_engines: Dict[str, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        super().__post_init__()
+        if not isinstance(self.transactions, TransactionTable):
+            self.transactions = TransactionTable(self.transactions)
 
     @classmethod
     def from_ticker(
@@ -25,26 +37,53 @@ class PortfolioAsset(MarketAsset):
 
     @classmethod
     def to_dataframe(cls, assets: List["PortfolioAsset"]) -> pd.DataFrame:
-        """Convert a list of PortfolioAsset objects to a pandas DataFrame."""
-        data = pd.DataFrame()
-        if not assets:
-            return data
-
-        for asset in assets:
-            transactions = PortfolioAssetTransaction.to_dataframe(
-                asset.transactions, asset.ticker
-            )
-            data = pd.concat([data, transactions], ignore_index=True)
+        """
+        Convert the transactions of a list of PortfolioAsset objects to one
+        pandas DataFrame, sorted by date and ticker.
+
+        The frame is assembled column-wise from the transaction tables in one
+        pass; use ``iter_transaction_frames`` to stream it in chunks instead.
+        """
+        from .transaction_export import iter_transaction_frames
+
+        return next(iter_transaction_frames(assets), pd.DataFrame())
+
+    @property
+    def ledger_version(self) -> int:
+        """
+        Counter bumped by every change to the transactions, such as
+        add_transaction or add_split. Results derived from the ledger can be
+        cached against it.
+        """
+        return self.transactions.version
+
+    def get_lot_engine(self, method: str = "fifo") -> "LotEngine":
+        """
+        Returns a LotEngine advanced through all of the asset's transactions.
+
+        The replay is cached per cost-basis method, so open-position,
+        closed-position and realized-profit queries over different dates share
+        it. When the transactions change, only the part following the first
+        edited transaction is replayed again (see LotEngine.sync).
+
+        Args:
+            method (str): Cost-basis method ("fifo", "lifo", "hifo", "average"
+                or "specific").
+        """
+        from portfolio_toolkit.position.lots import LotEngine
 
-        # Only sort if columns exist
-        if not data.empty and "date" in data.columns and "ticker" in data.columns:
-            data.sort_values(by=["date", "ticker"], inplace=True)
-            data.reset_index(drop=True, inplace=True)
-        return data
+        table = self.transactions
+        engine = self._lot_engines.get(method)
+        if engine is None or engine.table is not table:
+            engine = LotEngine(table, method).advance()
+            self._lot_engines[method] = engine
+        elif engine.table_version != table.version:
+            engine.sync()
+        return engine
 
     def add_transaction(self, transaction: PortfolioAssetTransaction):
         """
-        Adds a transaction to the portfolio asset.
+        Adds a transaction to the portfolio asset, keeping the date order.
         """
         self.transactions.append(transaction)
 
@@ -63,13 +102,17 @@ class PortfolioAsset(MarketAsset):
             subtotal_base=transaction_dict["subtotal_base"],
             fees_base=transaction_dict["fees_base"],
             total_base=transaction_dict["total_base"],
+            lots=transaction_dict.get("lots"),
         )
         self.add_transaction(transaction)
 
     def add_split(self, split_dict: dict) -> float:
         """
-        Adds a stock split to the portfolio asset by simulating sell all + buy equivalent.
-        Creates a sell transaction for all held shares and a buy transaction for split-adjusted quantity.
+        Adds a stock split to the portfolio asset.
+
+        The split is stored as a "split" transaction; the lot replay adjusts the
+        open lots when it reaches it, keeping each lot's buy date and scaling
+        its quantity and unit cost.
 
         Args:
             split_dict: Dictionary containing split information with keys:
@@ -80,82 +123,64 @@ class PortfolioAsset(MarketAsset):
             float: Cash amount to be added to account due to fractional shares sold
                    (only applies to reverse splits where shares are lost)
         """
-        from portfolio_toolkit.position.open.list_from_portfolio import (
-            get_asset_open_positions,
-        )
-
-        split_date = split_dict["date"]
-        split_factor = split_dict["split_factor"]
+        return self.add_splits([split_dict])[0]
 
-        # Get open positions at split date (day before split)
-        open_positions = get_asset_open_positions(self, split_date)
-
-        if not open_positions or open_positions.quantity == 0:
-            # No open positions to split
-            return 0.0
+    def add_splits(self, split_dicts: List[dict]) -> List[float]:
+        """
+        Adds several stock splits at once, with a single replay of the lots.
 
-        # Calculate total quantity held and average cost
-        total_quantity = open_positions.quantity
-        total_cost_base = open_positions.cost
-        average_cost_per_share = (
-            total_cost_base / total_quantity if total_quantity > 0 else 0
-        )
+        Splits dated before the first transaction are ignored, since nothing
+        was held yet.
 
-        # Calculate new quantities after split
-        exact_new_quantity = total_quantity * split_factor
-        new_total_quantity = int(exact_new_quantity)  # Integer part only
-        fractional_shares = (
-            exact_new_quantity - new_total_quantity
-        )  # Shares that become cash
-
-        # Calculate prices and costs
-        new_price_per_share = average_cost_per_share / split_factor
-        new_total_cost_base = new_total_quantity * new_price_per_share
-
-        # Calculate cash from fractional shares (at post-split price)
-        cash_from_fractional_shares = fractional_shares * new_price_per_share
-
-        # Create sell transaction for all current holdings
-        sell_transaction = PortfolioAssetTransaction(
-            date=split_date,
-            transaction_type="sell",
-            quantity=total_quantity,
-            price=average_cost_per_share,
-            currency=self.currency,
-            total=total_cost_base,
-            exchange_rate=1.0,  # Assuming same currency
-            subtotal_base=total_cost_base,
-            fees_base=0.0,  # No fees for split
-            total_base=total_cost_base,
-        )
+        Args:
+            split_dicts: Split dictionaries, as for ``add_split``.
 
-        # Create buy transaction for split-adjusted quantity (only whole shares)
-        buy_transaction = PortfolioAssetTransaction(
-            date=split_date,
-            transaction_type="buy",
-            quantity=new_total_quantity,
-            price=new_price_per_share,
-            currency=self.currency,
-            total=new_total_cost_base,
-            exchange_rate=1.0,  # Assuming same currency
-            subtotal_base=new_total_cost_base,
-            fees_base=0.0,  # No fees for split
-            total_base=new_total_cost_base,
+        Returns:
+            List[float]: Cash from fractional shares for each split, in order.
+        """
+        table = self.transactions
+        added = [split for split in split_dicts if table.count_until(split["date"]) > 0]
+        if not added:
+            return [0.0] * len(split_dicts)
+
+        table.extend(
+            PortfolioAssetTransaction(
+                date=split["date"],
+                transaction_type="split",
+                quantity=split["split_factor"],
+                price=0.0,
+                currency=self.currency,
+                total=0.0,
+                exchange_rate=1.0,
+                subtotal_base=0.0,
+                fees_base=0.0,
+                total_base=0.0,
+            )
+            for split in added
         )
 
-        # Add transactions to the asset
-        self.add_transaction(sell_transaction)
-        self.add_transaction(buy_transaction)
-
-        # Sort transactions by date to maintain chronological order
-        self.transactions.sort(key=lambda x: x.date)
-
-        # Return cash amount from fractional shares
-        return cash_from_fractional_shares
+        # Match each split with its row: rows of the same date keep the order
+        # in which they were added, so earlier splits come first
+        cash_by_row = dict(self.get_lot_engine().split_adjustments())
+        used = set()
+        cash = []
+        for split in split_dicts:
+            rows = table.search(split["date"], split["date"])
+            row = next(
+                (
+                    row
+                    for row in range(rows.start, rows.stop)
+                    if row in cash_by_row and row not in used
+                ),
+                None,
+            )
+            used.add(row)
+            cash.append(cash_by_row.get(row, 0.0))
+        return cash
 
     def __repr__(self):
         return (
             f"PortfolioAsset(ticker={self.ticker}, sector={self.sector}, currency={self.currency}, "
-            f"prices_length={len(self.prices)}, transactions_count={len(self.transactions)}, "
+            f"prices_length={self._prices_length()}, transactions_count={len(self.transactions)}, "
             f"info_keys={list(self.info.keys())})"
         )
@@ -1,10 +1,11 @@
-from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 import pandas as pd
 
+from portfolio_toolkit.utils.slots import slotted_dataclass
 
-@dataclass
+
+@slotted_dataclass
 class PortfolioAssetTransaction:
     date: str
     transaction_type: str
@@ -16,6 +17,8 @@ class PortfolioAssetTransaction:
     subtotal_base: float
     fees_base: float
     total_base: float
+    # Buy dates of the lots a sell closes, for the specific-lot cost basis
+    lots: Optional[List[str]] = None
 
     @classmethod
     def to_dataframe(
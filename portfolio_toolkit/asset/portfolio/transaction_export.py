@@ -0,0 +1,125 @@
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .transaction_table import ASSET_TRANSACTION_TYPES, TransactionTable
+
+if TYPE_CHECKING:
+    from .portfolio_asset import PortfolioAsset
+
+# Columns of the transactions frame, in order, with the table column they
+# are read from
+EXPORT_COLUMNS = {
+    "date": "date",
+    "ticker": None,
+    "type": "type",
+    "quantity": "quantity",
+    "price": "price",
+    "currency": "currency",
+    "total": "total",
+    "exchange_rate": "exchange_rate",
+    "subtotal_base": "subtotal_base",
+    "fees_base": "fees_base",
+    "total_base": "total_base",
+}
+
+_TYPE_NAMES = np.array(ASSET_TRANSACTION_TYPES, dtype=object)
+
+
+def get_transaction_columns(assets: List["PortfolioAsset"]) -> Dict[str, np.ndarray]:
+    """
+    Gathers the transactions of all assets into one array per column.
+
+    Each column is concatenated once from the assets' transaction tables, then
+    every column is reordered by a single stable sort on (date, ticker).
+    Dates stay datetime64[D] and types stay int8 codes here; they are turned
+    into strings only when a frame is built.
+
+    Args:
+        assets (List[PortfolioAsset]): Assets whose transactions are exported.
+
+    Returns:
+        Dict[str, np.ndarray]: Sorted arrays keyed by EXPORT_COLUMNS name.
+    """
+    tables = [asset.transactions for asset in assets]
+    counts = [len(table) for table in tables]
+
+    def concatenate(source):
+        if not tables:
+            return np.empty(0, dtype=TransactionTable.COLUMNS[source])
+        return np.concatenate([table.column(source) for table in tables])
+
+    tickers = np.array([asset.ticker for asset in assets], dtype=object)
+    # Rank of each asset's ticker, so the sort compares ints instead of strings
+    ticker_ranks = np.argsort(np.argsort(tickers, kind="stable"), kind="stable")
+    dates = concatenate("date")
+    order = np.lexsort((np.repeat(ticker_ranks, counts), dates.view("int64")))
+
+    # Reordered one column at a time, so only one unsorted copy is alive
+    columns = {"date": dates[order], "ticker": np.repeat(tickers, counts)[order]}
+    del dates
+    for name, source in EXPORT_COLUMNS.items():
+        if name not in columns:
+            columns[name] = concatenate(source)[order]
+    return columns
+
+
+def iter_transaction_frames(
+    assets: List["PortfolioAsset"], chunk_rows: Optional[int] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Yields the transactions of all assets, sorted by date and ticker, as
+    DataFrames of at most ``chunk_rows`` rows.
+
+    The sorted columns are assembled once (see get_transaction_columns);
+    only the string formatting of dates and types is done chunk by chunk, so
+    writers can stream very large ledgers without holding a DataFrame of the
+    whole ledger.
+
+    Args:
+        assets (List[PortfolioAsset]): Assets whose transactions are exported.
+        chunk_rows (int, optional): Rows per frame. A single frame if None.
+
+    Yields:
+        pd.DataFrame: Frames with the EXPORT_COLUMNS columns. Nothing is
+        yielded when there are no transactions.
+    """
+    if chunk_rows is not None and chunk_rows <= 0:
+        raise ValueError("chunk_rows must be a positive integer")
+
+    columns = get_transaction_columns(assets)
+    rows = len(columns["date"])
+    step = chunk_rows or max(rows, 1)
+    for start in range(0, rows, step):
+        chunk = {name: columns[name][start : start + step] for name in EXPORT_COLUMNS}
+        # Ledgers repeat dates a lot, so each distinct date is formatted once
+        days, positions = np.unique(chunk["date"], return_inverse=True)
+        chunk["date"] = np.datetime_as_string(days, unit="D").astype(object)[positions]
+        chunk["type"] = _TYPE_NAMES[chunk["type"]]
+        yield pd.DataFrame(chunk, copy=False)
+
+
+def write_transactions_csv(
+    assets: List["PortfolioAsset"], output, chunk_rows: int = 50_000
+) -> int:
+    """
+    Streams the transactions of all assets to a CSV file, chunk by chunk.
+
+    Args:
+        assets (List[PortfolioAsset]): Assets whose transactions are exported.
+        output: Output file path or open text stream.
+        chunk_rows (int): Rows formatted and written at a time.
+
+    Returns:
+        int: Number of rows written.
+    """
+    if isinstance(output, str):
+        with open(output, "w", encoding="utf-8", newline="") as stream:
+            return write_transactions_csv(assets, stream, chunk_rows)
+
+    rows = 0
+    for chunk in iter_transaction_frames(assets, chunk_rows):
+        chunk.to_csv(output, header=rows == 0, index=False)
+        rows += len(chunk)
+    return rows
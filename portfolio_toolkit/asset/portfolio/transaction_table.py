@@ -0,0 +1,207 @@
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from portfolio_toolkit.utils.columnar import SortedColumnStore
+from portfolio_toolkit.utils.dates import to_datetime64, to_datetime64_array
+
+from .portfolio_asset_transaction import PortfolioAssetTransaction
+
+ASSET_TRANSACTION_TYPES = (
+    "buy",
+    "sell",
+    "dividend",
+    "deposit",
+    "withdrawal",
+    "split",
+)
+# Split rows store the split factor in the quantity column
+SPLIT = ASSET_TRANSACTION_TYPES.index("split")
+
+
+def transaction_type_code(transaction_type: str) -> int:
+    """
+    Returns the int8 code of an asset transaction type.
+
+    Raises:
+        ValueError: If the type is not one of ASSET_TRANSACTION_TYPES.
+    """
+    try:
+        return ASSET_TRANSACTION_TYPES.index(transaction_type)
+    except ValueError:
+        raise ValueError(f"Unknown transaction type: {transaction_type}") from None
+
+
+class TransactionTable(SortedColumnStore):
+    """
+    Columnar store of the transactions of a portfolio asset, kept sorted by date.
+
+    Position and interval algorithms read the ``dates``, ``types``,
+    ``quantities`` and ``totals_base`` arrays directly. Indexing or iterating
+    returns PortfolioAssetTransaction objects with "YYYY-MM-DD" dates, built on
+    the fly for compatibility: modifying them does not change the table.
+    """
+
+    COLUMNS = {
+        "date": "datetime64[D]",
+        "type": "int8",
+        "quantity": "float64",
+        "price": "float64",
+        "currency": "object",
+        "total": "float64",
+        "exchange_rate": "float64",
+        "subtotal_base": "float64",
+        "fees_base": "float64",
+        "total_base": "float64",
+        "lots": "object",
+    }
+
+    # Fields copied as-is between PortfolioAssetTransaction and the columns
+    _VALUE_FIELDS = (
+        "quantity",
+        "price",
+        "currency",
+        "total",
+        "exchange_rate",
+        "subtotal_base",
+        "fees_base",
+        "total_base",
+        "lots",
+    )
+
+    def __init__(
+        self, transactions: Optional[Iterable[PortfolioAssetTransaction]] = None
+    ):
+        super().__init__()
+        if transactions is not None:
+            self.extend(transactions)
+
+    def append(self, transaction: PortfolioAssetTransaction) -> int:
+        """
+        Adds a transaction at its date position.
+
+        Args:
+            transaction (PortfolioAssetTransaction): The transaction to add.
+
+        Returns:
+            int: Position where the transaction was inserted.
+        """
+        row = {name: getattr(transaction, name) for name in self._VALUE_FIELDS}
+        row["date"] = to_datetime64(transaction.date)
+        row["type"] = transaction_type_code(transaction.transaction_type)
+        return self._insert_row(row)
+
+    def extend(
+        self, transactions: Iterable[PortfolioAssetTransaction]
+    ) -> Optional[int]:
+        """
+        Adds many transactions at once.
+
+        Args:
+            transactions (Iterable[PortfolioAssetTransaction]): The transactions to add.
+
+        Returns:
+            Optional[int]: Position of the first row that changed, or None if
+            nothing was added.
+        """
+        transactions = list(transactions)
+        columns = {
+            name: np.array(
+                [getattr(tx, name) for tx in transactions], dtype=self.COLUMNS[name]
+            )
+            for name in self._VALUE_FIELDS
+        }
+        columns["date"] = to_datetime64_array(tx.date for tx in transactions)
+        columns["type"] = np.array(
+            [transaction_type_code(tx.transaction_type) for tx in transactions],
+            dtype="int8",
+        )
+        return self._extend_columns(columns)
+
+    def extend_arrays(self, columns: Dict[str, np.ndarray]) -> Optional[int]:
+        """
+        Adds already validated transactions given as column arrays.
+
+        Args:
+            columns (dict): Array of values for every column in COLUMNS, all
+                the same length. "date" must be datetime64[D] and "type" the
+                codes indexing ASSET_TRANSACTION_TYPES. "lots" may be omitted.
+
+        Returns:
+            Optional[int]: Position of the first row that changed, or None if
+            nothing was added.
+        """
+        count = len(columns["date"])
+        if "lots" not in columns:
+            columns = dict(columns, lots=np.full(count, None, dtype=object))
+        return self._extend_columns(
+            {
+                name: np.asarray(columns[name], dtype=dtype)
+                for name, dtype in self.COLUMNS.items()
+            }
+        )
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.column("date")
+
+    @property
+    def types(self) -> np.ndarray:
+        return self.column("type")
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self.column("quantity")
+
+    @property
+    def totals_base(self) -> np.ndarray:
+        return self.column("total_base")
+
+    def count_until(self, date) -> int:
+        """
+        Returns the number of transactions dated on or before ``date``.
+        """
+        return self.search(None, date).stop
+
+    def signed_quantities(self) -> np.ndarray:
+        """
+        Returns the quantity change of every transaction: positive for buys,
+        negative for sells and zero for the other types.
+        """
+        types = self.types
+        signs = np.where(types == 0, 1.0, np.where(types == 1, -1.0, 0.0))
+        return signs * self.quantities
+
+    def held_quantities(self) -> np.ndarray:
+        """
+        Returns the quantity held after each transaction: buys add, sells
+        subtract and splits multiply the quantity, keeping whole shares only.
+        """
+        signed = self.signed_quantities()
+        held = np.cumsum(signed)
+        split_rows = np.nonzero(self.types == SPLIT)[0].tolist()
+        if not split_rows:
+            return held
+
+        factors = self.quantities
+        start, base = 0, 0.0
+        for row in split_rows:
+            held[start:row] = base + np.cumsum(signed[start:row])
+            before = held[row - 1] if row > start else base
+            base = float(int(before * factors[row]))
+            held[row] = base
+            start = row + 1
+        held[start:] = base + np.cumsum(signed[start:])
+        return held
+
+    def _row_to_object(self, position: int) -> PortfolioAssetTransaction:
+        columns = self._columns
+        values = {name: columns[name][position] for name in self._VALUE_FIELDS}
+        for name, value in values.items():
+            if isinstance(value, np.floating):
+                values[name] = float(value)
+        return PortfolioAssetTransaction(
+            date=str(columns["date"][position]),
+            transaction_type=ASSET_TRANSACTION_TYPES[columns["type"][position]],
+            **values,
+        )
@@ -0,0 +1,30 @@
+import click
+
+from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
+from portfolio_toolkit.portfolio.snapshot import compile_portfolio
+
+
+@click.command("compile")
+@click.argument("file", type=click.Path(exists=True))
+@click.option(
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Snapshot file (default: FILE with a .snapshot extension)",
+)
+def compile_command(file, output):
+    """Compile a portfolio JSON file into a binary snapshot"""
+    try:
+        portfolio, output = compile_portfolio(file, YFDataProvider(), output)
+    except ValueError as e:
+        click.echo(f"Error: {e}")
+        raise click.Abort()
+
+    transactions = sum(len(asset.transactions) for asset in portfolio.assets)
+    click.echo(
+        f"✅ {portfolio.name}: {len(portfolio.assets)} assets, "
+        f"{transactions} asset transactions, "
+        f"{len(portfolio.account.transactions)} cash entries"
+    )
+    click.echo(f"   Snapshot saved to: {output}")
+    click.echo("   Commands reading this file use it while the JSON is unchanged")
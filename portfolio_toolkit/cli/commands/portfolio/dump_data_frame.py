@@ -1,17 +1,39 @@
 import click
 
 from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
-from portfolio_toolkit.portfolio import Portfolio
+from portfolio_toolkit.portfolio.time_series.export import EXPORT_FORMATS
 
-from ..utils import load_json_file
+from ..utils import load_portfolio_file
 
 
 @click.command()
 @click.argument("file", type=click.Path(exists=True))
-def dump_data_frame(file):
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(EXPORT_FORMATS),
+    default="table",
+    help="Output format (default: table)",
+)
+@click.option(
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Write to this file instead of stdout (required for parquet)",
+)
+def dump_data_frame(file, fmt, output):
     """Show portfolio data frame"""
-    data = load_json_file(file)
+    if fmt == "parquet" and output is None:
+        raise click.UsageError("--output is required when --format is parquet")
+
     data_provider = YFDataProvider()
-    basic_portfolio = Portfolio.from_dict(data, data_provider=data_provider)
+    basic_portfolio = load_portfolio_file(file, data_provider)
     time_series = basic_portfolio.get_time_series()
-    time_series.print()
+
+    if fmt == "table" and output is None:
+        time_series.print()
+        return
+
+    rows = time_series.export(output=output, fmt=fmt)
+    if output:
+        click.echo(f"✅ {rows} rows saved to: {output}")
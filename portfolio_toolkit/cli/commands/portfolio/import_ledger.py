@@ -0,0 +1,66 @@
+import click
+
+from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
+from portfolio_toolkit.portfolio.ledger_import import LEDGER_FORMATS, import_ledger
+
+from ..utils import load_json_file
+
+
+@click.command("import")
+@click.argument("file", type=click.Path(exists=True))
+@click.option("--currency", required=True, help="Base currency of the portfolio")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(LEDGER_FORMATS),
+    default=None,
+    help="Ledger format (default: from the file extension)",
+)
+@click.option(
+    "--splits",
+    type=click.Path(exists=True),
+    default=None,
+    help="JSON file with a list of stock splits",
+)
+@click.option(
+    "--skip-invalid",
+    is_flag=True,
+    default=False,
+    help="Import the valid rows and report the invalid ones",
+)
+@click.option(
+    "--errors-output",
+    type=click.Path(),
+    default=None,
+    help="Save the per-row error report to a CSV file",
+)
+def import_ledger_command(file, currency, fmt, splits, skip_invalid, errors_output):
+    """Import a broker CSV or NDJSON ledger"""
+    try:
+        portfolio, report = import_ledger(
+            file,
+            YFDataProvider(),
+            currency,
+            fmt=fmt,
+            splits=load_json_file(splits) if splits else None,
+            errors="skip" if skip_invalid else "raise",
+        )
+    except ValueError as e:
+        click.echo(f"Error: {e}")
+        raise click.Abort()
+
+    click.echo(f"📥 Ledger imported: {portfolio.name} ({portfolio.currency})")
+    click.echo(f"   Rows read:        {report.rows}")
+    click.echo(f"   Rows imported:    {report.imported}")
+    click.echo(f"   Rows rejected:    {report.rejected}")
+    click.echo(f"   Assets:           {len(portfolio.assets)}")
+    click.echo(f"   Cash entries:     {len(portfolio.account.transactions)}")
+
+    for error in report.errors[:10]:
+        click.echo(f"   ⚠️  {error}")
+    if len(report.errors) > 10:
+        click.echo(f"   ... {len(report.errors) - 10} more errors")
+
+    if errors_output:
+        report.to_dataframe().to_csv(errors_output, index=False)
+        click.echo(f"✅ Error report saved to: {errors_output}")
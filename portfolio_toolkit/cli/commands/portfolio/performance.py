@@ -1,11 +1,10 @@
 import click
 
 from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
-from portfolio_toolkit.portfolio import Portfolio
 from portfolio_toolkit.position.compare_open_positions import compare_open_positions
 from portfolio_toolkit.utils import get_last_periods
 
-from ..utils import load_json_file
+from ..utils import load_portfolio_file
 
 
 @click.command("performance")
@@ -37,10 +36,9 @@ from ..utils import load_json_file
 )
 def performance(file, display, periods, period_type, output):
     """Show performance summary of the portfolio across multiple periods"""
-    data = load_json_file(file)
 
     data_provider = YFDataProvider()
-    portfolio = Portfolio.from_dict(data, data_provider=data_provider)
+    portfolio = load_portfolio_file(file, data_provider)
 
     # Obtener los períodos especificados
     period_objects = get_last_periods(
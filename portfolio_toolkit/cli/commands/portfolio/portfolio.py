@@ -1,7 +1,9 @@
 import click
 
+from .compile import compile_command
 from .dump_data_frame import dump_data_frame
 from .evolution import evolution
+from .import_ledger import import_ledger_command
 from .performance import performance
 
 # Import individual command modules
@@ -23,6 +25,8 @@ def debug():
 
 
 portfolio.add_command(transactions)
+portfolio.add_command(import_ledger_command)
+portfolio.add_command(compile_command)
 portfolio.add_command(positions)
 
 portfolio.add_command(evolution)
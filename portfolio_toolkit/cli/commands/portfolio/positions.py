@@ -2,9 +2,8 @@ import click
 
 from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
 from portfolio_toolkit.plot.engine import PlotEngine
-from portfolio_toolkit.portfolio import Portfolio
 
-from ..utils import load_json_file
+from ..utils import load_portfolio_file
 
 
 @click.command("positions")
@@ -24,9 +23,8 @@ from ..utils import load_json_file
 @click.option("--sector", is_flag=True, help="Plot open positions by sector (optional)")
 def positions(file, date, output_file, plot, country, sector):
     """Show open positions"""
-    data = load_json_file(file)
     data_provider = YFDataProvider()
-    portfolio = Portfolio.from_dict(data, data_provider=data_provider)
+    portfolio = load_portfolio_file(file, data_provider)
     open_positions = portfolio.get_open_positions(date)
 
     # Aquí puedes usar los parámetros opcionales
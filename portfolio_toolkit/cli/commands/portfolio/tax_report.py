@@ -2,9 +2,8 @@ import click
 from tabulate import tabulate
 
 from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
-from portfolio_toolkit.portfolio import Portfolio
 
-from ..utils import load_json_file
+from ..utils import load_portfolio_file
 
 
 @click.command("tax-report")
@@ -12,7 +11,6 @@ from ..utils import load_json_file
 @click.argument("year", required=True)
 def tax_report(file, year):
     """Generate tax report (gains/losses)"""
-    data = load_json_file(file)
 
     previous_year = int(year) - 1
     previous_last_day = f"{previous_year}-12-31"
@@ -24,7 +22,7 @@ def tax_report(file, year):
     )
 
     data_provider = YFDataProvider()
-    portfolio = Portfolio.from_dict(data, data_provider=data_provider)
+    portfolio = load_portfolio_file(file, data_provider)
 
     stats = portfolio.get_stats(year)
 
@@ -2,10 +2,12 @@ import click
 
 from portfolio_toolkit.account.account import Account
 from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.portfolio.transaction_export import (
+    write_transactions_csv,
+)
 from portfolio_toolkit.data_provider.yf_data_provider import YFDataProvider
-from portfolio_toolkit.portfolio import Portfolio
 
-from ..utils import load_json_file
+from ..utils import load_portfolio_file
 
 
 @click.command()
@@ -20,9 +22,8 @@ from ..utils import load_json_file
 @click.option("--income", is_flag=True, default=False, help="Income transactions")
 def transactions(file, output, cash, income):
     """Show portfolio transactions"""
-    data = load_json_file(file)
     data_provider = YFDataProvider()
-    portfolio = Portfolio.from_dict(data, data_provider=data_provider)
+    portfolio = load_portfolio_file(file, data_provider)
 
     if cash:
         cash_transactions(portfolio, output, income)
@@ -35,7 +36,8 @@ def cash_transactions(portfolio, output, income):
     click.echo(
         f"📊 Portfolio transactions for: {portfolio.name} ({portfolio.currency})"
     )
-    transactions_df = Account.to_dataframe(portfolio.account)
+    types = ["income"] if income else None
+    transactions_df = Account.to_dataframe(portfolio.account, types=types)
     # Save to CSV file or display in console
     if output:
         transactions_df.to_csv(output, index=False)
@@ -51,12 +53,13 @@ def asset_transactions(portfolio, output):
     """Show asset transactions"""
     click.echo("\n📊 Portfolio asset transactions")
     click.echo("=" * 60)
-    assets_df = PortfolioAsset.to_dataframe(portfolio.assets)
 
     # Save to CSV file or display in console
     if output:
-        assets_df.to_csv(output, index=False)
-        click.echo(f"✅ Results saved to: {output}")
+        # Streamed in chunks, so large ledgers never build one big frame
+        rows = write_transactions_csv(portfolio.assets, output)
+        click.echo(f"✅ {rows} rows saved to: {output}")
     else:
+        assets_df = PortfolioAsset.to_dataframe(portfolio.assets)
         click.echo(assets_df.to_string())
         click.echo("=" * 60)
@@ -20,3 +20,19 @@ def load_json_file(filepath):
     except json.JSONDecodeError:
         click.echo(f"Error: Invalid JSON in file '{filepath}'")
         raise click.Abort()
+
+
+def load_portfolio_file(filepath, data_provider):
+    """Load a portfolio JSON file, using its compiled snapshot when current"""
+    import json
+
+    from portfolio_toolkit.portfolio import Portfolio
+
+    try:
+        return Portfolio.from_file(filepath, data_provider)
+    except FileNotFoundError:
+        click.echo(f"Error: File '{filepath}' not found")
+        raise click.Abort()
+    except json.JSONDecodeError:
+        click.echo(f"Error: Invalid JSON in file '{filepath}'")
+        raise click.Abort()
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent requests used by the default get_tickers_info
+TICKER_INFO_WORKERS = 8
 
 
 class DataProvider(ABC):
@@ -63,6 +67,30 @@ class DataProvider(ABC):
         """
         pass
 
+    def get_price_series_converted_between(
+        self, ticker, target_currency, start=None, end=None, column="Close"
+    ):
+        """
+        Gets the converted price series of an asset between two dates.
+
+        Providers able to download a date range should override this; the
+        default slices the full series from ``get_price_series_converted``.
+
+        Args:
+            ticker (str): The ticker symbol.
+            target_currency (str): The currency to convert prices to.
+            start: First date (inclusive), or None for no lower bound.
+            end: Last date (inclusive), or None for no upper bound.
+            column (str): The price column to get (default "Close").
+
+        Returns:
+            pd.Series: Price series of the asset in the target currency.
+        """
+        from portfolio_toolkit.asset.market.price_loader import slice_price_series
+
+        prices = self.get_price_series_converted(ticker, target_currency, column)
+        return slice_price_series(prices, start, end)
+
     @abstractmethod
     def get_ticker_info(self, ticker):
         """
@@ -75,3 +103,24 @@ class DataProvider(ABC):
             dict: Dictionary with company information and key statistics.
         """
         pass
+
+    def get_tickers_info(self, tickers, max_workers=TICKER_INFO_WORKERS):
+        """
+        Gets the information of several tickers at once.
+
+        The default runs ``get_ticker_info`` for the tickers concurrently, so
+        the round trips overlap; providers with a batch endpoint should
+        override this with a single request.
+
+        Args:
+            tickers (list): The ticker symbols.
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            dict: Information of every ticker, keyed by ticker, in the order given.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) <= 1:
+            return {ticker: self.get_ticker_info(ticker) for ticker in tickers}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+            return dict(zip(tickers, pool.map(self.get_ticker_info, tickers)))
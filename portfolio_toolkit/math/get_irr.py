@@ -0,0 +1,91 @@
+import numpy as np
+from scipy.optimize import brentq
+
+
+def get_npv(rates, amounts, times) -> np.ndarray:
+    """
+    Calculates the net present value of rows of cash flows.
+
+    Args:
+        rates: One discount rate per row (per unit of time).
+        amounts: Cash flows, one row per series (2D; rows may be zero-padded).
+        times: Time of each cash flow, in the unit of the rates (same shape).
+
+    Returns:
+        np.ndarray: NPV of each row at its rate.
+    """
+    rates = np.asarray(rates, dtype="float64")
+    amounts = np.atleast_2d(np.asarray(amounts, dtype="float64"))
+    times = np.atleast_2d(np.asarray(times, dtype="float64"))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return (amounts * (1.0 + rates[:, None]) ** -times).sum(axis=1)
+
+
+def get_irr(
+    amounts, times, guess: float = 0.0, tol: float = 1e-10, max_iterations: int = 50
+) -> np.ndarray:
+    """
+    Calculates the internal rate of return of many rows of cash flows at once.
+
+    Newton's method runs on all rows together; rows where it does not
+    converge (or leaves the rate above -100%) are solved one by one with
+    Brent's method on a bracket where the NPV changes sign.
+
+    Args:
+        amounts: Cash flows, one row per series (2D). Rows may be padded with
+            zero amounts, which do not affect the result.
+        times: Time of each cash flow (same shape). The rate is returned per
+            unit of time, so times in years give annual rates.
+        guess (float): Starting rate.
+        tol (float): Tolerance on the rate.
+        max_iterations (int): Newton iterations before falling back.
+
+    Returns:
+        np.ndarray: Rate of each row, NaN when the NPV never changes sign
+        (for example when every cash flow has the same sign).
+    """
+    amounts = np.atleast_2d(np.asarray(amounts, dtype="float64"))
+    times = np.atleast_2d(np.asarray(times, dtype="float64"))
+    rates = np.full(len(amounts), float(guess))
+    active = np.arange(len(amounts))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(max_iterations):
+            if not len(active):
+                break
+            a, t, r = amounts[active], times[active], rates[active]
+            growth = 1.0 + r[:, None]
+            discounted = a * growth**-t
+            npv = discounted.sum(axis=1)
+            slope = (-t * discounted / growth).sum(axis=1)
+            new = r - npv / slope
+            # Never step to or below -100%: go halfway there instead
+            new = np.where(new <= -1.0, (r - 1.0) / 2.0, new)
+            finite = np.isfinite(new)
+            rates[active] = np.where(finite, new, np.nan)
+            active = active[finite & (np.abs(new - r) > tol * (1.0 + np.abs(r)))]
+
+    scale = np.abs(amounts).sum(axis=1)
+    residual = np.abs(get_npv(rates, amounts, times))
+    unresolved = ~np.isfinite(rates) | (residual > 1e-8 * np.maximum(scale, 1.0))
+    for row in np.nonzero(unresolved)[0]:
+        rates[row] = _brent_irr(amounts[row], times[row], tol)
+    return rates
+
+
+def _brent_irr(amounts: np.ndarray, times: np.ndarray, tol: float) -> float:
+    """
+    Solves one row with Brent's method, widening the bracket upwards.
+    """
+
+    def npv(rate):
+        return float(get_npv([rate], amounts[None, :], times[None, :])[0])
+
+    low, high = -1.0 + 1e-6, 1.0
+    low_value = npv(low)
+    while not np.isnan(low_value) and high < 1e9:
+        high_value = npv(high)
+        if np.sign(high_value) != np.sign(low_value):
+            return brentq(npv, low, high, xtol=tol)
+        high *= 10.0
+    return np.nan
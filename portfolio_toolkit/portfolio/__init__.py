@@ -1,5 +1,6 @@
 from .portfolio import Portfolio
+from .returns import PortfolioReturns
 from .stats import PortfolioStats
 from .time_series import PortfolioTimeSeries
 
-__all__ = ["Portfolio", "PortfolioStats", "PortfolioTimeSeries"]
+__all__ = ["Portfolio", "PortfolioReturns", "PortfolioStats", "PortfolioTimeSeries"]
@@ -0,0 +1,478 @@
+import json
+import os
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.account.account import Account
+from portfolio_toolkit.account.transaction import ACCOUNT_TRANSACTION_TYPES
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.portfolio.asset_from_dict import create_portfolio_assets
+from portfolio_toolkit.asset.portfolio.transaction_table import ASSET_TRANSACTION_TYPES
+from portfolio_toolkit.data_provider.data_provider import DataProvider
+
+from .portfolio import Portfolio
+from .portfolio_from_dict import process_splits
+
+LEDGER_FORMATS = ["csv", "ndjson"]
+
+# Fields of a ledger row, as in the "transactions" of the JSON format
+LEDGER_COLUMNS = (
+    "date",
+    "ticker",
+    "type",
+    "quantity",
+    "price",
+    "currency",
+    "total",
+    "exchange_rate",
+    "subtotal_base",
+    "fees_base",
+    "total_base",
+)
+NUMERIC_COLUMNS = (
+    "quantity",
+    "price",
+    "total",
+    "exchange_rate",
+    "subtotal_base",
+    "fees_base",
+    "total_base",
+)
+TEXT_COLUMNS = ("date", "ticker", "type", "currency", "description")
+# Optional field copied to the account entry of cash rows
+DESCRIPTION_COLUMN = "description"
+
+# Splits are not ledger rows: they are passed separately, as in the JSON format
+ASSET_ROW_TYPES = tuple(name for name in ASSET_TRANSACTION_TYPES if name != "split")
+
+# Account entry recorded for asset rows: type, amount sign and description,
+# as Account.add_transaction_from_assets_dict does
+_ENTRY_TYPES = {"buy": "sell", "sell": "buy", "dividend": "income"}
+_ENTRY_SIGNS = {"buy": -1.0, "sell": 1.0, "dividend": 1.0}
+_ENTRY_PREFIXES = {
+    "buy": "Buy $",
+    "sell": "Sell $",
+    "dividend": "Dividend received for $",
+}
+
+_ACCOUNT_TYPE_CODES = {name: i for i, name in enumerate(ACCOUNT_TRANSACTION_TYPES)}
+_ASSET_TYPE_CODES = {name: i for i, name in enumerate(ASSET_TRANSACTION_TYPES)}
+_ASSET_ROW_TYPE_CODES = {name: i for i, name in enumerate(ASSET_ROW_TYPES)}
+
+# Row errors listed in the message raised with errors="raise"
+_ERRORS_IN_MESSAGE = 10
+
+
+@dataclass
+class LedgerRowError:
+    """
+    A ledger row rejected by the import.
+
+    Attributes:
+        line (int): Line of the row in the file (1-based, header included).
+        column (str, optional): Offending field, or None if the whole line
+            could not be parsed.
+        value (Any): Offending value as read from the file.
+        message (str): What is wrong with it.
+    """
+
+    line: int
+    column: Optional[str]
+    value: Any
+    message: str
+
+    def __str__(self):
+        where = f", {self.column}" if self.column else ""
+        return f"line {self.line}{where}: {self.message} ({self.value!r})"
+
+
+@dataclass
+class LedgerImportReport:
+    """
+    Outcome of a ledger import.
+
+    Attributes:
+        rows (int): Rows read from the file.
+        rejected (int): Rows skipped because of at least one error.
+        errors (List[LedgerRowError]): Every error found, in file order.
+    """
+
+    rows: int = 0
+    rejected: int = 0
+    errors: List[LedgerRowError] = field(default_factory=list)
+
+    @property
+    def imported(self) -> int:
+        return self.rows - self.rejected
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert the errors to a pandas DataFrame, one row per error."""
+        return pd.DataFrame(
+            [
+                {
+                    "line": error.line,
+                    "column": error.column,
+                    "value": error.value,
+                    "message": error.message,
+                }
+                for error in self.errors
+            ],
+            columns=["line", "column", "value", "message"],
+        )
+
+
+def import_ledger(
+    path: str,
+    data_provider: DataProvider,
+    currency: str,
+    name: Optional[str] = None,
+    fmt: Optional[str] = None,
+    splits: Optional[List[dict]] = None,
+    cost_basis: str = "fifo",
+    chunk_rows: int = 50_000,
+    errors: str = "raise",
+) -> Tuple[Portfolio, LedgerImportReport]:
+    """
+    Builds a portfolio from a broker CSV or NDJSON ledger, chunk by chunk.
+
+    Each chunk is validated column-wise and appended directly to the
+    columnar transaction tables of the assets and to the account ledger, so
+    memory is bounded by the chunk size plus the ledgers themselves. Rows
+    have the fields of the "transactions" of the JSON format (plus an
+    optional "description"); an empty ticker marks a cash transaction.
+
+    Args:
+        path (str): Ledger file.
+        data_provider (DataProvider): Provider of ticker information and prices.
+        currency (str): Base currency of the portfolio.
+        name (str, optional): Portfolio name. Defaults to the file name.
+        fmt (str, optional): One of LEDGER_FORMATS. Inferred from the file
+            extension (".csv", ".ndjson" or ".jsonl") if None.
+        splits (List[dict], optional): Stock splits, as in the JSON format.
+        cost_basis (str): Cost-basis method of the portfolio.
+        chunk_rows (int): Rows read and validated at a time.
+        errors (str): "raise" to stop at the first chunk with invalid rows,
+            or "skip" to import the valid rows and report the others.
+
+    Returns:
+        Tuple[Portfolio, LedgerImportReport]: The portfolio and the report.
+
+    Raises:
+        ValueError: If the format is unknown, CSV columns are missing, or
+            rows are invalid and ``errors`` is "raise".
+    """
+    if errors not in ("raise", "skip"):
+        raise ValueError('errors must be "raise" or "skip"')
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be a positive integer")
+
+    fmt = fmt or _infer_format(path)
+    if fmt == "csv":
+        chunks = _read_csv_chunks(path, chunk_rows)
+    elif fmt == "ndjson":
+        chunks = _read_ndjson_chunks(path, chunk_rows)
+    else:
+        raise ValueError(f"fmt must be one of {LEDGER_FORMATS}")
+
+    report = LedgerImportReport()
+    assets_dict: Dict[str, PortfolioAsset] = {}
+    cash_account = Account(name="Cash Account", currency=currency)
+    start_date = None
+
+    for frame, lines, parse_errors in chunks:
+        columns = parse_ledger_chunk(frame)
+        valid, row_errors = validate_ledger_chunk(frame, columns, lines)
+        chunk_errors = sorted(parse_errors + row_errors, key=lambda e: e.line)
+        report.rows += len(frame) + len(parse_errors)
+        report.rejected += int(np.count_nonzero(~valid)) + len(parse_errors)
+        report.errors.extend(chunk_errors)
+
+        if chunk_errors and errors == "raise":
+            listed = "\n".join(str(e) for e in chunk_errors[:_ERRORS_IN_MESSAGE])
+            raise ValueError(f"Invalid ledger rows in {path}:\n{listed}")
+
+        first_date = _add_ledger_chunk(
+            {name: values[valid] for name, values in columns.items()},
+            assets_dict,
+            cash_account,
+            currency,
+            data_provider,
+        )
+        if first_date is not None and (start_date is None or first_date < start_date):
+            start_date = first_date
+
+    process_splits(splits or [], assets_dict, cash_account)
+
+    portfolio = Portfolio(
+        name=name or os.path.splitext(os.path.basename(path))[0],
+        currency=currency,
+        assets=list(assets_dict.values()),
+        account=cash_account,
+        start_date=(
+            start_date.astype("datetime64[us]").item()
+            if start_date is not None
+            else None
+        ),
+        data_provider=data_provider,
+        cost_basis=cost_basis,
+    )
+    return portfolio, report
+
+
+def parse_ledger_chunk(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Converts a chunk of raw ledger rows to typed column arrays.
+
+    Values that cannot be converted become NaT or NaN, for
+    ``validate_ledger_chunk`` to report.
+
+    Args:
+        frame (pd.DataFrame): Ledger rows with the LEDGER_COLUMNS columns.
+
+    Returns:
+        Dict[str, np.ndarray]: One array per LEDGER_COLUMNS field and
+        "description", plus "cash", which marks the cash rows.
+    """
+    columns = {
+        "date": _parse_dates(frame["date"]),
+        "ticker": frame["ticker"].to_numpy(dtype=object),
+        "type": frame["type"].to_numpy(dtype=object),
+        "currency": frame["currency"].to_numpy(dtype=object),
+        "cash": _cash_rows(frame["ticker"]),
+    }
+    for column in NUMERIC_COLUMNS:
+        columns[column] = pd.to_numeric(frame[column], errors="coerce").to_numpy(
+            dtype=float
+        )
+    if DESCRIPTION_COLUMN in frame:
+        notes = frame[DESCRIPTION_COLUMN].to_numpy(dtype=object)
+        columns[DESCRIPTION_COLUMN] = np.where(pd.isna(notes), None, notes)
+    else:
+        columns[DESCRIPTION_COLUMN] = np.full(len(frame), None, dtype=object)
+    return columns
+
+
+def validate_ledger_chunk(
+    frame: pd.DataFrame, columns: Dict[str, np.ndarray], lines: np.ndarray
+) -> Tuple[np.ndarray, List[LedgerRowError]]:
+    """
+    Checks every field of a chunk of ledger rows with column-wise operations.
+
+    Args:
+        frame (pd.DataFrame): Raw ledger rows, for the values in the report.
+        columns (dict): The rows parsed by ``parse_ledger_chunk``.
+        lines (np.ndarray): File line of each row, for the error report.
+
+    Returns:
+        Tuple[np.ndarray, List[LedgerRowError]]: Boolean mask of the valid
+        rows, and the errors of the others in file order.
+    """
+    invalid = np.zeros(len(frame), dtype=bool)
+    found = []
+
+    def reject(mask, column, message):
+        rows = np.nonzero(mask)[0]
+        if not len(rows):
+            return
+        values = frame[column].to_numpy(dtype=object)
+        for row in rows.tolist():
+            found.append(
+                (row, LedgerRowError(int(lines[row]), column, values[row], message))
+            )
+        invalid[rows] = True
+
+    reject(np.isnat(columns["date"]), "date", "missing or not a YYYY-MM-DD date")
+
+    cash = columns["cash"]
+    types = columns["type"]
+    known = np.where(
+        cash,
+        _lookup(types, _ACCOUNT_TYPE_CODES, -1) >= 0,
+        _lookup(types, _ASSET_ROW_TYPE_CODES, -1) >= 0,
+    )
+    reject(~known, "type", "unknown transaction type")
+
+    for column in NUMERIC_COLUMNS:
+        reject(np.isnan(columns[column]), column, "missing or not a number")
+
+    reject(~cash & pd.isna(columns["currency"]), "currency", "missing value")
+
+    found.sort(key=lambda item: item[0])
+    return ~invalid, [error for _, error in found]
+
+
+def _add_ledger_chunk(
+    columns: Dict[str, np.ndarray],
+    assets_dict: Dict[str, PortfolioAsset],
+    cash_account: Account,
+    currency: str,
+    data_provider: DataProvider,
+) -> Optional[np.datetime64]:
+    """
+    Appends validated ledger rows to the asset tables and the account ledger.
+
+    Returns:
+        Optional[np.datetime64]: Earliest date of the rows, None if empty.
+    """
+    dates = columns["date"]
+    if not len(dates):
+        return None
+    types = columns["type"]
+    tickers = columns["ticker"]
+    cash = columns["cash"]
+
+    # Asset rows, appended to each ticker's table in one block per chunk
+    asset_rows = np.nonzero(~cash)[0]
+    codes, uniques = pd.factorize(tickers[asset_rows])
+    type_codes = _lookup(types, _ASSET_TYPE_CODES, -1)
+    # Tickers first seen in this chunk are created together
+    new_tickers = [ticker for ticker in uniques if ticker not in assets_dict]
+    if new_tickers:
+        assets_dict.update(
+            create_portfolio_assets(data_provider, new_tickers, currency)
+        )
+    for code, ticker in enumerate(uniques):
+        rows = asset_rows[codes == code]
+        table_columns = {name: columns[name][rows] for name in NUMERIC_COLUMNS}
+        table_columns.update(
+            date=dates[rows], type=type_codes[rows], currency=columns["currency"][rows]
+        )
+        assets_dict[ticker].transactions.extend_arrays(table_columns)
+
+    # One account entry per cash row and per asset buy, sell or dividend,
+    # in file order
+    entry_types = np.where(cash, types, _lookup(types, _ENTRY_TYPES, None))
+    signs = np.where(
+        cash,
+        np.where(np.isin(types, ["sell", "withdrawal"]), -1.0, 1.0),
+        _lookup(types, _ENTRY_SIGNS, 0.0),
+    )
+    entries = np.nonzero(pd.notna(entry_types))[0]
+    prefixes = _lookup(types[entries], _ENTRY_PREFIXES, "")
+    descriptions = np.where(
+        cash[entries],
+        columns[DESCRIPTION_COLUMN][entries],
+        [
+            f"{prefix}{ticker} asset"
+            for prefix, ticker in zip(prefixes, tickers[entries])
+        ],
+    )
+    cash_account.transactions.extend_arrays(
+        dates[entries],
+        _lookup(entry_types[entries], _ACCOUNT_TYPE_CODES, -1),
+        (signs * columns["total_base"])[entries],
+        descriptions,
+    )
+
+    return dates.min()
+
+
+def _lookup(values: np.ndarray, mapping: dict, default) -> np.ndarray:
+    """
+    Maps every value through ``mapping`` with one lookup per distinct value.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    table = np.array([mapping.get(value, default) for value in uniques])
+    return table[codes] if len(codes) else np.empty(0, dtype=table.dtype)
+
+
+def _parse_dates(values: pd.Series) -> np.ndarray:
+    """
+    Parses "YYYY-MM-DD" dates column-wise; anything else becomes NaT.
+    """
+    parsed = pd.to_datetime(values, format="%Y-%m-%d", errors="coerce")
+    return parsed.to_numpy(dtype="datetime64[D]")
+
+
+def _cash_rows(tickers: pd.Series) -> np.ndarray:
+    """
+    Marks cash rows: no ticker, or a synthetic "__CUR" cash ticker.
+    """
+    text = tickers.astype(object).where(tickers.notna(), "")
+    text = text.astype(str).str.strip()
+    return (text.eq("") | text.str.startswith("__")).to_numpy(dtype=bool)
+
+
+def _infer_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise ValueError(
+        f"Cannot infer the ledger format of {path}; expected one of {LEDGER_FORMATS}"
+    )
+
+
+def _read_csv_chunks(
+    path: str, chunk_rows: int
+) -> Iterator[Tuple[pd.DataFrame, np.ndarray, List[LedgerRowError]]]:
+    """
+    Reads a CSV ledger in chunks of raw strings (empty cells become NaN).
+    """
+    # Numeric columns are left to the parser: clean columns come out as
+    # float64, and columns with bad values as strings for to_numeric to check
+    reader = pd.read_csv(
+        path,
+        chunksize=chunk_rows,
+        dtype={name: str for name in TEXT_COLUMNS},
+        keep_default_na=False,
+        na_values=[""],
+        skipinitialspace=True,
+    )
+    line = 2  # First data line, after the header
+    with reader:
+        for frame in reader:
+            frame.columns = frame.columns.str.strip()
+            missing = [name for name in LEDGER_COLUMNS if name not in frame.columns]
+            if missing:
+                raise ValueError(
+                    f"The ledger {path} is missing columns: {', '.join(missing)}"
+                )
+            lines = np.arange(line, line + len(frame))
+            line += len(frame)
+            yield frame, lines, []
+
+
+def _read_ndjson_chunks(
+    path: str, chunk_rows: int
+) -> Iterator[Tuple[pd.DataFrame, np.ndarray, List[LedgerRowError]]]:
+    """
+    Reads an NDJSON ledger (one JSON object per line) in chunks.
+
+    Lines that are not JSON objects are reported instead of failing the
+    import; missing fields become NaN and are reported by the validation.
+    """
+    columns = LEDGER_COLUMNS + (DESCRIPTION_COLUMN,)
+    line = 0
+    with open(path, "r", encoding="utf-8") as stream:
+        while True:
+            texts = list(islice(stream, chunk_rows))
+            if not texts:
+                return
+            records, lines, parse_errors = [], [], []
+            for text in texts:
+                line += 1
+                text = text.strip()
+                if not text:
+                    continue
+                try:
+                    record = json.loads(text)
+                except json.JSONDecodeError as e:
+                    parse_errors.append(
+                        LedgerRowError(line, None, text, f"invalid JSON: {e.msg}")
+                    )
+                    continue
+                if not isinstance(record, dict):
+                    parse_errors.append(
+                        LedgerRowError(line, None, text, "not a JSON object")
+                    )
+                    continue
+                records.append(record)
+                lines.append(line)
+            frame = pd.DataFrame.from_records(records, columns=columns)
+            yield frame, np.array(lines, dtype="int64"), parse_errors
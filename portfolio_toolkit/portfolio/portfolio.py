@@ -1,9 +1,14 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from portfolio_toolkit.account.account import Account
 from portfolio_toolkit.asset.portfolio.portfolio_asset import PortfolioAsset
 from portfolio_toolkit.data_provider.data_provider import DataProvider
+from portfolio_toolkit.utils.dates import to_datetime64
+
+# Per-asset query results kept by Portfolio before the least recently used
+# ones are dropped
+QUERY_CACHE_SIZE = 4096
 
 
 @dataclass
@@ -14,8 +19,22 @@ class Portfolio:
     data_provider: DataProvider
     account: Account
     start_date: str  # = field(init=False)
+    # Cost-basis method used to match sells against lots (see COST_BASIS_METHODS)
+    cost_basis: str = "fifo"
+
+    # Per-asset results of position queries, see _get_asset_results
+    _query_cache: Dict[tuple, tuple] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
+        from portfolio_toolkit.position.lots import COST_BASIS_METHODS
+
+        if self.cost_basis not in COST_BASIS_METHODS:
+            raise ValueError(
+                f"Unknown cost basis method: {self.cost_basis}. "
+                f"Expected one of {', '.join(COST_BASIS_METHODS)}"
+            )
         self.account.sort_transactions()
 
     # def __post_init__(self):
@@ -39,6 +58,16 @@ class Portfolio:
         """
         return portfolio_from_dict(data, data_provider)
 
+    @classmethod
+    def from_file(cls, path: str, data_provider: DataProvider) -> "Portfolio":
+        """
+        Loads a portfolio JSON file, or its compiled snapshot when the
+        snapshot was built from the current content of the file.
+        """
+        from .snapshot import load_portfolio
+
+        return load_portfolio(path, data_provider)
+
     def __repr__(self):
         return (
             f"Portfolio(name={self.name}, currency={self.currency}, "
@@ -55,30 +84,158 @@ class Portfolio:
 
         return PortfolioStats.from_portfolio(self, year)
 
-    def get_time_series(self) -> "PortfolioTimeSeries":
+    def get_returns(
+        self, start_date: Optional[str] = None, end_date: Optional[str] = None
+    ) -> "PortfolioReturns":
+        """
+        Returns the daily value and flow series of the portfolio, from which
+        time-weighted and money-weighted returns of any window are computed.
+        """
+        from .returns.portfolio_returns import PortfolioReturns
+
+        return PortfolioReturns.from_portfolio(self, start_date, end_date)
+
+    def get_time_series(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        float_dtype: str = "float64",
+        include_cash: bool = False,
+    ) -> "PortfolioTimeSeries":
         """
         Returns a PortfolioTimeSeries for the given portfolio.
+
+        The series is computed lazily and only for the requested window and tickers.
         """
         from .time_series.portfolio_time_series import PortfolioTimeSeries
 
-        return PortfolioTimeSeries.from_portfolio(self)
+        return PortfolioTimeSeries.from_portfolio(
+            self,
+            start_date=start_date,
+            end_date=end_date,
+            tickers=tickers,
+            float_dtype=float_dtype,
+            include_cash=include_cash,
+        )
+
+    def _get_asset_results(
+        self, query: tuple, compute: Callable[[PortfolioAsset], Any]
+    ) -> List[Any]:
+        """
+        Returns ``compute(asset)`` for every asset, cached per asset and query.
+
+        A cached result is reused while the asset's ledger version and price
+        source are unchanged, so editing one asset only recomputes that asset.
+
+        Args:
+            query (tuple): Hashable description of the query and its parameters.
+            compute (Callable): Computes the result for one asset.
+
+        Returns:
+            List[Any]: One result per asset, in the order of ``assets``.
+        """
+        cache = self._query_cache
+        results = []
+        for asset in self.assets:
+            key = (query, id(asset))
+            entry = cache.pop(key, None)
+            # The entry holds the asset, so its id cannot be reused meanwhile
+            if (
+                entry is None
+                or entry[0] is not asset
+                or entry[1] is not asset.transactions
+                or entry[2] != asset.ledger_version
+                or entry[3] is not asset.price_source
+            ):
+                entry = (
+                    asset,
+                    asset.transactions,
+                    asset.ledger_version,
+                    asset.price_source,
+                    compute(asset),
+                )
+            cache[key] = entry
+            results.append(entry[4])
+
+        while len(cache) > QUERY_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return results
 
     def get_open_positions(self, date: str) -> "OpenPositionList":
         """
         Returns OpenPositionList for the given date.
+
+        Results are cached per asset; repeating a query only rebuilds the list,
+        and the OpenPosition objects are shared between calls.
+        """
+        from portfolio_toolkit.position.open.list_from_portfolio import (
+            get_asset_open_positions,
+        )
+        from portfolio_toolkit.position.open.open_position_list import OpenPositionList
+
+        method = self.cost_basis
+        positions = self._get_asset_results(
+            ("open", to_datetime64(date), method),
+            lambda asset: get_asset_open_positions(asset, date, method),
+        )
+        # Only include positions with non-zero quantity
+        return OpenPositionList(
+            [position for position in positions if position.quantity != 0]
+        )
+
+    def get_open_positions_at(self, dates: Iterable) -> List["OpenPositionList"]:
+        """
+        Returns one OpenPositionList per date, in the same order as ``dates``.
+
+        Every asset is replayed once for all dates, so many snapshots (for
+        example one per week) cost about the same as a single one.
         """
         from portfolio_toolkit.position.open.open_position_list import OpenPositionList
 
-        return OpenPositionList.from_portfolio(self.assets, date)
+        return OpenPositionList.from_portfolio_at(self.assets, dates, self.cost_basis)
 
     def get_closed_positions(
         self, from_date: str, to_date: str
     ) -> "ClosedPositionList":
         """
         Returns ClosedPositionList for the given date.
+
+        Results are cached per asset like get_open_positions.
         """
-        from portfolio_toolkit.position.closed.closed_position_list import (
+        from portfolio_toolkit.position.closed import (
+            ClosedPositionArrays,
             ClosedPositionList,
         )
+        from portfolio_toolkit.position.closed.list_from_portfolio import (
+            get_asset_closed_position_arrays,
+        )
+
+        method = self.cost_basis
+        asset_arrays = self._get_asset_results(
+            (
+                "closed",
+                None if from_date is None else to_datetime64(from_date),
+                None if to_date is None else to_datetime64(to_date),
+                method,
+            ),
+            lambda asset: get_asset_closed_position_arrays(
+                asset, from_date, to_date, method
+            ),
+        )
+        return ClosedPositionList.from_arrays(
+            ClosedPositionArrays.concatenate(asset_arrays)
+        )
+
+    def get_realized_profit(self, from_date: str, to_date: str) -> float:
+        """
+        Returns the realized profit of the sells within [from_date, to_date].
+
+        Uses the same cached lot replay as get_closed_positions, so queries for
+        different windows do not replay the ledgers again.
+        """
+        from portfolio_toolkit.position.closed.list_from_portfolio import (
+            get_realized_profit,
+        )
 
-        return ClosedPositionList.from_portfolio(self.assets, from_date, to_date)
+        return get_realized_profit(self.assets, from_date, to_date, self.cost_basis)
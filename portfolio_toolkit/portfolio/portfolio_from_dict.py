@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from portfolio_toolkit.account.account import Account
 from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.portfolio.asset_from_dict import create_portfolio_assets
 from portfolio_toolkit.data_provider.data_provider import DataProvider
+from portfolio_toolkit.utils.dates import to_datetime64_array
 
 from .portfolio import Portfolio
 
@@ -44,6 +46,7 @@ def portfolio_from_dict(data: dict, data_provider: DataProvider) -> Portfolio:
         account=account,
         start_date=start_date,
         data_provider=data_provider,
+        cost_basis=data.get("cost_basis", "fifo"),
     )
 
 
@@ -66,16 +69,16 @@ def process_transactions(
         dict: Cash account with all cash transactions.
         datetime: Calculated portfolio start date.
     """
-    assets_dict = {}
+    asset_transactions = {}
     transaction_dates = []
 
     cash_account = Account(name="Cash Account", currency=portfolio_currency)
 
-    # Process all transactions
+    # First pass, without provider calls: validate and group the transactions
     for transaction in transactions:
         validate_transaction(transaction)
 
-        transaction_dates.append(datetime.strptime(transaction["date"], "%Y-%m-%d"))
+        transaction_dates.append(transaction["date"])
 
         ticker = get_transaction_ticker(transaction, portfolio_currency)
 
@@ -84,25 +87,29 @@ def process_transactions(
             cash_account.add_transaction_from_dict(transaction)
         else:
             # Real asset
-            if ticker not in assets_dict:
-                assets_dict[ticker] = PortfolioAsset.from_ticker(
-                    data_provider, ticker, portfolio_currency
-                )
-            assets_dict[ticker].add_transaction_from_dict(transaction)
+            asset_transactions.setdefault(ticker, []).append(transaction)
 
             # Create synthetic cash transaction for asset purchases/sales
             if transaction["type"] in ["buy", "sell", "dividend"]:
                 cash_account.add_transaction_from_assets_dict(transaction)
 
-    # Process splits
-    for split in splits:
-        ticker = split["ticker"]
-        if ticker in assets_dict:
-            remaining_amount = assets_dict[ticker].add_split(split)
-            if remaining_amount > 0.01:
-                cash_account.add_transaction_from_split_dict(split, remaining_amount)
+    # Then all assets are created at once, so ticker information is fetched
+    # concurrently rather than while walking the transactions
+    assets_dict = create_portfolio_assets(
+        data_provider, asset_transactions, portfolio_currency
+    )
+    for ticker, ticker_transactions in asset_transactions.items():
+        for transaction in ticker_transactions:
+            assets_dict[ticker].add_transaction_from_dict(transaction)
+
+    process_splits(splits, assets_dict, cash_account)
 
-    start_date = min(transaction_dates) if transaction_dates else None
+    # All dates are parsed at once; invalid dates raise ValueError
+    start_date = (
+        to_datetime64_array(transaction_dates).min().astype("datetime64[us]").item()
+        if transaction_dates
+        else None
+    )
 
     # Convert assets dictionary to list
     assets = list(assets_dict.values())
@@ -110,6 +117,32 @@ def process_transactions(
     return assets, cash_account, start_date
 
 
+def process_splits(
+    splits: List[dict], assets_dict: Dict[str, PortfolioAsset], cash_account: Account
+):
+    """
+    Applies stock splits to the assets, with one lot replay per ticker.
+
+    Cash from fractional shares sold by a split is added to the account.
+    Splits of tickers not in ``assets_dict`` are ignored.
+
+    Args:
+        splits (list): List of split dictionaries.
+        assets_dict (dict): Assets by ticker.
+        cash_account (Account): Account receiving the fractional share cash.
+    """
+    splits_by_ticker = {}
+    for split in splits:
+        if split["ticker"] in assets_dict:
+            splits_by_ticker.setdefault(split["ticker"], []).append(split)
+
+    for ticker, ticker_splits in splits_by_ticker.items():
+        remaining_amounts = assets_dict[ticker].add_splits(ticker_splits)
+        for split, remaining_amount in zip(ticker_splits, remaining_amounts):
+            if remaining_amount > 0.01:
+                cash_account.add_transaction_from_split_dict(split, remaining_amount)
+
+
 def get_transaction_ticker(transaction, portfolio_currency):
     """
     Returns the ticker for a transaction. If the transaction does not have a ticker,
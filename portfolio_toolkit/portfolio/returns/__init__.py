@@ -0,0 +1,3 @@
+from .portfolio_returns import PortfolioReturns
+
+__all__ = ["PortfolioReturns"]
@@ -0,0 +1,308 @@
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.account.transaction import ACCOUNT_TRANSACTION_TYPES
+from portfolio_toolkit.math.get_irr import get_irr
+from portfolio_toolkit.utils.dates import (
+    calendar_periods,
+    to_datetime64,
+    to_datetime64_array,
+    today,
+)
+
+from ..portfolio import Portfolio
+
+# Account entries that move money in or out of the portfolio when the ledger
+# records them; otherwise the assets alone are measured and the entries
+# created for their buys, sells and dividends are the flows (see from_portfolio)
+EXTERNAL_FLOW_TYPES = ("deposit", "withdrawal")
+ASSET_FLOW_TYPES = ("buy", "sell", "income")
+
+
+@dataclass(eq=False)
+class PortfolioReturns:
+    """
+    Daily portfolio value and external cash flows, with time-weighted (TWR)
+    and money-weighted (MWR) returns over arbitrary windows.
+
+    ``dates`` is a daily calendar whose first day only provides the opening
+    value of windows starting on the second day. ``values`` holds the value
+    at the end of each day and ``flows`` the net external flow of each day
+    (positive when money comes in).
+
+    Daily returns are Modified Dietz returns with inflows counted from the
+    start of the day and outflows at its end. They are chain-linked once
+    into a growth index, so the TWR of any window is a ratio of two entries.
+    The MWR of a window is the rate that discounts its opening value, flows
+    and closing value to zero; many windows are solved together.
+
+    Attributes:
+        dates (np.ndarray): Calendar days (datetime64[D]).
+        values (np.ndarray): Portfolio value at the end of each day.
+        flows (np.ndarray): Net external flow of each day.
+    """
+
+    dates: np.ndarray
+    values: np.ndarray
+    flows: np.ndarray
+    daily_returns: np.ndarray = field(init=False)
+    growth: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        previous = np.concatenate(([0.0], self.values[:-1]))
+        capital = previous + np.maximum(self.flows, 0.0)
+        gain = self.values - previous - self.flows
+        returns = np.divide(gain, capital, out=np.zeros_like(gain), where=capital > 0)
+        # The first day has no opening value in the series
+        returns[:1] = 0.0
+        self.daily_returns = returns
+        self.growth = np.cumprod(1.0 + returns)
+
+    @classmethod
+    def from_portfolio(
+        cls,
+        portfolio: Portfolio,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> "PortfolioReturns":
+        """
+        Builds the daily value and flow series of a portfolio.
+
+        If the account records deposits or withdrawals, the value is the
+        assets plus the cash balance and those entries are the external
+        flows. Otherwise only the assets are measured: their buys are
+        inflows, and sells, dividends and split cash are outflows.
+
+        Args:
+            portfolio (Portfolio): Portfolio to measure.
+            start_date (str, optional): First day windows may start on.
+                Defaults to the first transaction.
+            end_date (str, optional): Last day. Defaults to today.
+
+        Returns:
+            PortfolioReturns: The series, starting the day before ``start_date``.
+
+        Raises:
+            ValueError: If the portfolio has no transactions and no start date.
+        """
+        from portfolio_toolkit.position.open.list_from_portfolio import (
+            get_asset_position_states,
+        )
+
+        ledger = portfolio.account.transactions
+        if start_date is not None:
+            start = to_datetime64(start_date)
+        else:
+            firsts = [table.dates[0] for table in _tables(portfolio) if len(table)]
+            if not firsts:
+                raise ValueError("The portfolio has no transactions.")
+            start = min(firsts)
+        end = to_datetime64(end_date) if end_date is not None else today()
+        dates = np.arange(start - 1, end + 1, dtype="datetime64[D]")
+
+        values = np.zeros(len(dates))
+        for asset in portfolio.assets:
+            quantities, _, prices = get_asset_position_states(
+                asset, dates, portfolio.cost_basis
+            )
+            values += quantities * prices
+
+        types, amounts = ledger.types, ledger.amounts
+        external = np.isin(types, _type_codes(EXTERNAL_FLOW_TYPES))
+        if external.any():
+            values += portfolio.account.get_amounts_at(dates)
+            rows, signs = external, 1.0
+        else:
+            rows, signs = np.isin(types, _type_codes(ASSET_FLOW_TYPES)), -1.0
+
+        flows = np.zeros(len(dates))
+        offsets = (ledger.dates[rows] - dates[0]).astype("int64")
+        inside = (offsets >= 0) & (offsets < len(dates))
+        np.add.at(flows, offsets[inside], signs * amounts[rows][inside])
+        return cls(dates=dates, values=values, flows=flows)
+
+    def twr(self, start_date, end_date, annualized: bool = False) -> float:
+        """
+        Returns the time-weighted return of the window [start_date, end_date].
+
+        Args:
+            start_date: First day of the window.
+            end_date: Last day of the window (inclusive).
+            annualized (bool): If True, scale the return to a 365-day year.
+        """
+        return float(self.twrs([start_date], [end_date], annualized)[0])
+
+    def twrs(
+        self, start_dates: Iterable, end_dates: Iterable, annualized: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the time-weighted return of many windows at once.
+
+        Args:
+            start_dates (Iterable): First day of each window.
+            end_dates (Iterable): Last day of each window (inclusive).
+            annualized (bool): If True, scale the returns to a 365-day year.
+
+        Returns:
+            np.ndarray: One return per window (0.05 is 5%).
+        """
+        first, last = self._window_rows(start_dates, end_dates)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = self.growth[last] / self.growth[first - 1] - 1.0
+        return _annualize(returns, last - first + 1) if annualized else returns
+
+    def mwr(self, start_date, end_date, annualized: bool = False) -> float:
+        """
+        Returns the money-weighted return (IRR) of the window [start_date, end_date].
+
+        Args:
+            start_date: First day of the window.
+            end_date: Last day of the window (inclusive).
+            annualized (bool): If True, return the annual rate instead of the
+                rate over the window.
+        """
+        return float(self.mwrs([start_date], [end_date], annualized)[0])
+
+    def mwrs(
+        self, start_dates: Iterable, end_dates: Iterable, annualized: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the money-weighted return of many windows at once.
+
+        The opening value is invested at the start of the window and the
+        closing value withdrawn at its end; flows are timed like the daily
+        returns (inflows at the start of their day, outflows at the end).
+
+        Args:
+            start_dates (Iterable): First day of each window.
+            end_dates (Iterable): Last day of each window (inclusive).
+            annualized (bool): If True, return annual rates instead of rates
+                over each window.
+
+        Returns:
+            np.ndarray: One return per window, NaN where nothing was invested.
+        """
+        first, last = self._window_rows(start_dates, end_dates)
+        days = last - first + 1
+
+        # Flow days of every window, padded to the longest one with zeros
+        flow_rows = np.flatnonzero(self.flows)
+        begins = np.searchsorted(flow_rows, first)
+        counts = np.searchsorted(flow_rows, last, side="right") - begins
+        width = int(counts.max()) if len(counts) else 0
+        if width:
+            valid = np.arange(width) < counts[:, None]
+            rows = flow_rows[
+                np.minimum(begins[:, None] + np.arange(width), len(flow_rows) - 1)
+            ]
+            flows = np.where(valid, self.flows[rows], 0.0)
+            # Times as a fraction of the window, so the rate is per window
+            elapsed = rows - first[:, None] + (flows < 0)
+            times = np.where(valid, elapsed / days[:, None], 0.0)
+        else:
+            flows = times = np.zeros((len(first), 0))
+
+        amounts = np.column_stack((-self.values[first - 1], -flows, self.values[last]))
+        times = np.column_stack((np.zeros(len(first)), times, np.ones(len(first))))
+        returns = get_irr(amounts, times)
+        return _annualize(returns, days) if annualized else returns
+
+    def table(
+        self,
+        freq: str = "year",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns the TWR and MWR of every year, quarter or month of the series.
+
+        Periods are clipped to the series, so the first and last may be
+        partial. All windows are evaluated in one batch.
+
+        Args:
+            freq (str): "year", "quarter" or "month".
+            start_date (str, optional): Defaults to the first day of the series.
+            end_date (str, optional): Defaults to the last day of the series.
+
+        Returns:
+            pd.DataFrame: One row per period, indexed by label ("2024",
+            "2024Q1" or "2024-01"), with the columns start, end,
+            initial_value, final_value, net_flows, twr and mwr.
+
+        Raises:
+            ValueError: If the frequency is not supported.
+        """
+        low = to_datetime64(start_date) if start_date is not None else self.dates[1]
+        high = to_datetime64(end_date) if end_date is not None else self.dates[-1]
+        labels, starts, ends = calendar_periods(low, high, freq)
+        starts, ends = np.maximum(starts, low), np.minimum(ends, high)
+
+        first, last = self._window_rows(starts, ends)
+        cumulative = np.concatenate(([0.0], np.cumsum(self.flows)))
+        return pd.DataFrame(
+            {
+                "start": starts.astype(str),
+                "end": ends.astype(str),
+                "initial_value": self.values[first - 1],
+                "final_value": self.values[last],
+                "net_flows": cumulative[last + 1] - cumulative[first],
+                "twr": self.twrs(starts, ends),
+                "mwr": self.mwrs(starts, ends),
+            },
+            index=pd.Index(labels, name="period"),
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the daily series: value, flow, return and growth index.
+        """
+        return pd.DataFrame(
+            {
+                "Value": self.values,
+                "Flow": self.flows,
+                "Return": self.daily_returns,
+                "Growth": self.growth,
+            },
+            index=pd.DatetimeIndex(self.dates, name="Date"),
+        )
+
+    def _window_rows(
+        self, start_dates: Iterable, end_dates: Iterable
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the row of the first and last day of each window.
+
+        Raises:
+            ValueError: If a window is empty or not covered by the series.
+        """
+        first = (to_datetime64_array(start_dates) - self.dates[0]).astype("int64")
+        last = (to_datetime64_array(end_dates) - self.dates[0]).astype("int64")
+        if len(first) != len(last):
+            raise ValueError("start_dates and end_dates must have the same length.")
+        invalid = (first < 1) | (last < first) | (last >= len(self.dates))
+        if invalid.any():
+            row = int(np.argmax(invalid))
+            raise ValueError(
+                f"Window {self.dates[0] + first[row]} to {self.dates[0] + last[row]} "
+                f"is empty or outside the series "
+                f"({self.dates[1]} to {self.dates[-1]})."
+            )
+        return first, last
+
+
+def _annualize(returns: np.ndarray, days: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        return (1.0 + returns) ** (365.0 / days) - 1.0
+
+
+def _type_codes(names) -> np.ndarray:
+    return np.array([ACCOUNT_TRANSACTION_TYPES.index(name) for name in names])
+
+
+def _tables(portfolio: Portfolio):
+    yield portfolio.account.transactions
+    for asset in portfolio.assets:
+        yield asset.transactions
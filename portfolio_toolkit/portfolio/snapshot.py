@@ -0,0 +1,348 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from portfolio_toolkit.account.account import Account
+from portfolio_toolkit.account.ledger import AccountLedger
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.market.price_loader import PriceLoader
+from portfolio_toolkit.asset.portfolio.transaction_table import TransactionTable
+from portfolio_toolkit.data_provider.data_provider import DataProvider
+
+from .portfolio import Portfolio
+
+# Bumped whenever the layout changes; older snapshots are then ignored
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAGIC = b"PTKSNAP\x00"
+SNAPSHOT_SUFFIX = ".snapshot"
+
+# Arrays start on multiples of this, so memory-mapped views are aligned
+_ALIGNMENT = 64
+
+# Object columns stored as int32 codes into a list of distinct values kept in
+# the header (-1 for None): currencies and descriptions repeat a lot
+_ENCODED_COLUMNS = ("currency", "description")
+
+
+def snapshot_path(path: str) -> str:
+    """
+    Returns the default snapshot file of a portfolio JSON file.
+    """
+    return os.path.splitext(path)[0] + SNAPSHOT_SUFFIX
+
+
+def source_hash(path: str) -> str:
+    """
+    Returns the content hash of a portfolio JSON file, as stored in snapshots.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compile_portfolio(
+    path: str, data_provider: DataProvider, output: Optional[str] = None
+) -> Tuple[Portfolio, str]:
+    """
+    Loads a portfolio JSON file and writes its binary snapshot.
+
+    Args:
+        path (str): Portfolio JSON file.
+        data_provider (DataProvider): Provider of ticker information and prices.
+        output (str, optional): Snapshot file. Defaults to ``snapshot_path(path)``.
+
+    Returns:
+        Tuple[Portfolio, str]: The loaded portfolio and the snapshot file.
+    """
+    digest = source_hash(path)
+    with open(path, "r") as f:
+        portfolio = Portfolio.from_dict(json.load(f), data_provider)
+    output = output or snapshot_path(path)
+    write_snapshot(portfolio, output, digest)
+    return portfolio, output
+
+
+def load_portfolio(
+    path: str, data_provider: DataProvider, snapshot: Optional[str] = None
+) -> Portfolio:
+    """
+    Loads a portfolio JSON file, from its snapshot when the snapshot is current.
+
+    The snapshot is used only if its stored hash matches the content of the
+    JSON file; otherwise the JSON is parsed as usual. The snapshot is only a
+    cache, so an unreadable or damaged one is ignored as well.
+
+    Args:
+        path (str): Portfolio JSON file.
+        data_provider (DataProvider): Provider of ticker information and prices.
+        snapshot (str, optional): Snapshot file. Defaults to ``snapshot_path(path)``.
+
+    Returns:
+        Portfolio: The loaded portfolio.
+    """
+    snapshot = snapshot or snapshot_path(path)
+    if os.path.exists(snapshot):
+        digest = source_hash(path)
+        try:
+            portfolio = read_snapshot(snapshot, data_provider, digest)
+        except (OSError, ValueError):
+            portfolio = None
+        if portfolio is not None:
+            return portfolio
+    with open(path, "r") as f:
+        return Portfolio.from_dict(json.load(f), data_provider)
+
+
+def write_snapshot(portfolio: Portfolio, path: str, digest: str):
+    """
+    Writes a portfolio to a binary snapshot file.
+
+    The file holds a JSON header (names, currencies, resolved asset metadata
+    and the layout of every array) followed by the sorted columns of each
+    asset's transaction table and of the account ledger, with splits already
+    applied. Prices are not stored: they are fetched from the data provider
+    when the snapshot is read.
+
+    The file is written to a temporary name and renamed, so readers never see
+    a partial snapshot.
+
+    Args:
+        portfolio (Portfolio): Portfolio to write.
+        path (str): Snapshot file.
+        digest (str): Content hash of the source, see ``source_hash``.
+    """
+    blobs: List[np.ndarray] = []
+    offset = 0
+
+    def add_array(values: np.ndarray) -> Dict[str, Any]:
+        nonlocal offset
+        values = np.ascontiguousarray(values)
+        entry = {"offset": offset, "dtype": values.dtype.str, "count": len(values)}
+        blobs.append(values)
+        offset += _aligned(values.nbytes)
+        return entry
+
+    def add_store(store) -> Dict[str, Any]:
+        columns, values = {}, {}
+        for name in store.COLUMNS:
+            column = store.column(name)
+            if name in _ENCODED_COLUMNS:
+                codes, values[name] = _encode(column)
+                columns[name] = add_array(codes)
+            elif name == "lots":
+                # Only sells with the specific-lot method have lots
+                values[name] = {
+                    str(row): list(lots)
+                    for row, lots in enumerate(column.tolist())
+                    if lots is not None
+                }
+            else:
+                columns[name] = add_array(column)
+        return {"columns": columns, "values": values}
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "source_hash": digest,
+        "name": portfolio.name,
+        "currency": portfolio.currency,
+        "cost_basis": portfolio.cost_basis,
+        # Kept as text when the portfolio was built with a "YYYY-MM-DD" string
+        "start_date": _format_date(portfolio.start_date),
+        "start_date_is_text": isinstance(portfolio.start_date, str),
+        "account": {
+            "name": portfolio.account.name,
+            "currency": portfolio.account.currency,
+            "ledger": add_store(portfolio.account.transactions),
+        },
+        "assets": [
+            {
+                "ticker": asset.ticker,
+                "currency": asset.currency,
+                "info": asset.info,
+                "transactions": add_store(asset.transactions),
+            }
+            for asset in portfolio.assets
+        ],
+    }
+    encoded = json.dumps(header, default=str).encode("utf-8")
+    data_start = _aligned(len(SNAPSHOT_MAGIC) + 8 + len(encoded))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=SNAPSHOT_SUFFIX)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(len(encoded).to_bytes(8, "little"))
+            f.write(encoded)
+            f.write(b"\0" * (data_start - f.tell()))
+            for values in blobs:
+                f.write(values.tobytes())
+                f.write(b"\0" * (_aligned(values.nbytes) - values.nbytes))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def read_snapshot(
+    path: str, data_provider: DataProvider, digest: Optional[str] = None
+) -> Optional[Portfolio]:
+    """
+    Reads a portfolio from a binary snapshot file.
+
+    Numeric and date columns are memory-mapped and adopted by the tables
+    without copying; the first change to a table copies it. Prices are
+    fetched from the data provider on first use, as when the JSON is loaded.
+
+    Args:
+        path (str): Snapshot file.
+        data_provider (DataProvider): Provider of prices.
+        digest (str, optional): Expected source hash. If given and different
+            from the stored one, the snapshot is stale and None is returned.
+
+    Returns:
+        Optional[Portfolio]: The portfolio, or None if the snapshot is stale
+        or was written by another snapshot version.
+
+    Raises:
+        ValueError: If the file is not a portfolio snapshot, is truncated or
+            its header does not describe a portfolio.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is an empty snapshot.")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if buffer[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not a portfolio snapshot.")
+    position = len(SNAPSHOT_MAGIC)
+    length = int.from_bytes(buffer[position : position + 8], "little")
+    if position + 8 + length > len(buffer):
+        raise ValueError(f"{path} is a truncated snapshot.")
+    try:
+        header = json.loads(buffer[position + 8 : position + 8 + length])
+    except ValueError as error:
+        raise ValueError(f"{path} has a damaged snapshot header.") from error
+    try:
+        if header["version"] != SNAPSHOT_VERSION or (
+            digest is not None and header["source_hash"] != digest
+        ):
+            return None
+        return _portfolio_from_header(
+            path, header, buffer, _aligned(position + 8 + length), data_provider
+        )
+    except (KeyError, IndexError, TypeError, AttributeError) as error:
+        raise ValueError(f"{path} has a damaged snapshot header.") from error
+
+
+def _portfolio_from_header(
+    path: str,
+    header: Dict[str, Any],
+    buffer: mmap.mmap,
+    data_start: int,
+    data_provider: DataProvider,
+) -> Portfolio:
+    """
+    Builds the portfolio described by a snapshot header over the mapped data.
+
+    Args:
+        path (str): Snapshot file, for error messages.
+        header (Dict[str, Any]): Decoded snapshot header.
+        buffer (mmap.mmap): The mapped snapshot file.
+        data_start (int): Offset of the column data in the buffer.
+        data_provider (DataProvider): Provider of prices.
+
+    Returns:
+        Portfolio: The portfolio.
+    """
+
+    def read_store(store_class, stored):
+        columns = {}
+        for name, entry in stored["columns"].items():
+            dtype = np.dtype(entry["dtype"])
+            offset = data_start + entry["offset"]
+            if offset + entry["count"] * dtype.itemsize > len(buffer):
+                raise ValueError(f"{path} is a truncated snapshot.")
+            values = np.frombuffer(
+                buffer, dtype=dtype, count=entry["count"], offset=offset
+            )
+            if name in _ENCODED_COLUMNS:
+                values = _decode(values, stored["values"][name])
+            columns[name] = values
+        if "lots" in store_class.COLUMNS:
+            lots = np.full(len(columns["date"]), None, dtype=object)
+            for row, row_lots in stored["values"]["lots"].items():
+                lots[int(row)] = row_lots
+            columns["lots"] = lots
+        return store_class.from_columns(columns)
+
+    stored_account = header["account"]
+    account = Account(
+        name=stored_account["name"],
+        currency=stored_account["currency"],
+        transactions=read_store(AccountLedger, stored_account["ledger"]),
+    )
+    assets = [
+        PortfolioAsset(
+            ticker=stored["ticker"],
+            prices=PriceLoader(data_provider, stored["ticker"], stored["currency"]),
+            info=stored["info"],
+            currency=stored["currency"],
+            transactions=read_store(TransactionTable, stored["transactions"]),
+        )
+        for stored in header["assets"]
+    ]
+
+    start_date = header["start_date"]
+    if start_date and not header["start_date_is_text"]:
+        start_date = datetime.fromisoformat(start_date)
+    return Portfolio(
+        name=header["name"],
+        currency=header["currency"],
+        assets=assets,
+        data_provider=data_provider,
+        account=account,
+        start_date=start_date,
+        cost_basis=header["cost_basis"],
+    )
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _encode(values: np.ndarray) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Dictionary-encodes an object column: int32 codes and the distinct values.
+    """
+    distinct: Dict[Any, int] = {}
+    codes = np.array(
+        [
+            -1 if value is None else distinct.setdefault(value, len(distinct))
+            for value in values.tolist()
+        ],
+        dtype="int32",
+    )
+    return codes, list(distinct)
+
+
+def _decode(codes: np.ndarray, distinct: List[Any]) -> np.ndarray:
+    table = np.array(distinct + [None], dtype=object)
+    # Code -1 (None) picks the trailing None
+    return table[codes]
+
+
+def _format_date(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    return value.isoformat()
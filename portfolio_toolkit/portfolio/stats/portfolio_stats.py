@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 import pandas as pd
 
@@ -57,6 +57,46 @@ class PortfolioStats:
 
         return stats_from_portfolio(portfolio, year)
 
+    @classmethod
+    def for_years(
+        cls, portfolio: Portfolio, years: Iterable[str]
+    ) -> Dict[str, "PortfolioStats"]:
+        """
+        Builds PortfolioStats for several years in one sweep over the ledgers.
+
+        Equivalent to calling ``from_portfolio`` for each year, but open
+        positions at every year-end, closed positions and cash flows are each
+        computed once for all years.
+
+        Returns:
+            Dict[str, PortfolioStats]: Statistics keyed by year, in the order given.
+        """
+        from .stats_from_portfolio import stats_for_years
+
+        return stats_for_years(portfolio, list(years))
+
+    @classmethod
+    def for_periods(
+        cls, portfolio: Portfolio, start_date: str, end_date: str, freq: str = "year"
+    ) -> Dict[str, "PortfolioStats"]:
+        """
+        Builds PortfolioStats for every year, quarter or month between two
+        dates, in one sweep like ``for_years``.
+
+        Args:
+            portfolio (Portfolio): Portfolio to analyze.
+            start_date (str): A date in the first period (YYYY-MM-DD).
+            end_date (str): A date in the last period (YYYY-MM-DD).
+            freq (str): "year", "quarter" or "month".
+
+        Returns:
+            Dict[str, PortfolioStats]: Statistics keyed by period label
+            ("2024", "2024Q1" or "2024-01"), in date order.
+        """
+        from .stats_from_portfolio import stats_by_frequency
+
+        return stats_by_frequency(portfolio, start_date, end_date, freq)
+
     @property
     def total_profit(self) -> float:
         """Total profit including both realized and unrealized gains"""
@@ -1,4 +1,10 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
 from portfolio_toolkit.account.account import Account
+from portfolio_toolkit.utils.dates import calendar_periods, to_datetime64
 
 from ..portfolio import Portfolio
 from .portfolio_stats import PortfolioStats
@@ -15,26 +21,141 @@ def stats_from_portfolio(portfolio: Portfolio, year: str) -> PortfolioStats:
     Returns:
         PortfolioStats: Dataclass containing all portfolio metrics and data
     """
-    previous_year = int(year) - 1
-    previous_last_day = f"{previous_year}-12-31"
+    return stats_for_years(portfolio, [year])[str(year)]
+
+
+def stats_for_years(
+    portfolio: Portfolio, years: Sequence[str]
+) -> Dict[str, PortfolioStats]:
+    """
+    Calculate portfolio statistics for several years in one sweep.
+
+    Args:
+        portfolio (Portfolio): Portfolio object to analyze
+        years (Sequence[str]): Years for which to calculate statistics
+
+    Returns:
+        Dict[str, PortfolioStats]: Statistics keyed by year, in the order given
+    """
+    return stats_for_periods(
+        portfolio,
+        [(str(year), f"{int(year)}-01-01", f"{int(year)}-12-31") for year in years],
+    )
+
+
+def stats_by_frequency(
+    portfolio: Portfolio, start_date: str, end_date: str, freq: str = "year"
+) -> Dict[str, PortfolioStats]:
+    """
+    Calculate portfolio statistics for every calendar period between two dates.
+
+    Args:
+        portfolio (Portfolio): Portfolio object to analyze
+        start_date (str): A date in the first period (YYYY-MM-DD)
+        end_date (str): A date in the last period (YYYY-MM-DD)
+        freq (str): "year", "quarter" or "month"
+
+    Returns:
+        Dict[str, PortfolioStats]: Statistics keyed by period label ("2024",
+        "2024Q1" or "2024-01"), in date order
+
+    Raises:
+        ValueError: If the frequency is not supported.
+    """
+    labels, first_days, last_days = calendar_periods(start_date, end_date, freq)
+    return stats_for_periods(
+        portfolio,
+        list(
+            zip(labels, first_days.astype(str).tolist(), last_days.astype(str).tolist())
+        ),
+    )
+
+
+def stats_for_periods(
+    portfolio: Portfolio, periods: List[Tuple[str, str, str]]
+) -> Dict[str, PortfolioStats]:
+    """
+    Calculate portfolio statistics for several periods in one sweep.
+
+    Open positions are computed for every period boundary in one call, closed
+    positions once for the whole span and split by sell date, and cash flows
+    read from a single running balance, so each ledger is replayed once
+    however many periods are requested.
 
-    first_day = f"{year}-01-01"
-    last_day = f"{year}-12-31"
+    Args:
+        portfolio (Portfolio): Portfolio object to analyze
+        periods (List[Tuple[str, str, str]]): (label, first day, last day) of
+            each period; periods may be in any order and need not be contiguous
 
-    # Get positions
-    last_open_positions = portfolio.get_open_positions(previous_last_day)
-    open_positions = portfolio.get_open_positions(last_day)
-    closed_positions = portfolio.get_closed_positions(
-        from_date=first_day, to_date=last_day
+    Returns:
+        Dict[str, PortfolioStats]: Statistics keyed by label, in the order given
+    """
+    from portfolio_toolkit.position.closed import ClosedPositionList
+
+    if not periods:
+        return {}
+    labels = [label for label, _, _ in periods]
+    first_days = np.array([to_datetime64(first) for _, first, _ in periods])
+    last_days = np.array([to_datetime64(last) for _, _, last in periods])
+    previous_last_days = first_days - np.timedelta64(1, "D")
+
+    # Open positions at every boundary, valued once per distinct date
+    boundaries = np.unique(np.concatenate([previous_last_days, last_days]))
+    boundary_positions = dict(
+        zip(
+            boundaries.tolist(),
+            portfolio.get_open_positions_at(boundaries.astype(str).tolist()),
+        )
     )
 
-    # Convert to DataFrames
-    closed_positions_df = closed_positions.to_dataframe()
-    open_positions_df = open_positions.to_dataframe()
-    transactions_df = Account.export_to_dataframe(
-        portfolio.account, from_date=first_day, to_date=last_day
+    # Closed positions of the whole span, split by sell date below
+    closed_arrays = portfolio.get_closed_positions(
+        from_date=str(first_days.min()), to_date=str(last_days.max())
+    ).to_arrays()
+
+    # Running balance per transaction type; the change over a period gives the
+    # flows of each type without filtering the transaction list
+    balances = portfolio.account.get_balance_series(
+        str(boundaries[0]), str(boundaries[-1]), by_type=True
     )
+    opening_balances = balances.loc[pd.DatetimeIndex(previous_last_days)]
+    closing_balances = balances.loc[pd.DatetimeIndex(last_days)]
 
+    result = {}
+    for i, label in enumerate(labels):
+        first_day, last_day = first_days[i], last_days[i]
+        last_open_positions = boundary_positions[previous_last_days[i].item()]
+        open_positions = boundary_positions[last_day.item()]
+        sold = (closed_arrays.sell_dates >= first_day) & (
+            closed_arrays.sell_dates <= last_day
+        )
+        closed_positions = ClosedPositionList.from_arrays(closed_arrays.take(sold))
+        result[label] = _build_stats(
+            last_open_positions,
+            open_positions,
+            closed_positions,
+            Account.export_to_dataframe(
+                portfolio.account, str(first_day), str(last_day)
+            ),
+            opening_balances.iloc[i],
+            closing_balances.iloc[i],
+            str(last_day),
+        )
+    return result
+
+
+def _build_stats(
+    last_open_positions,
+    open_positions,
+    closed_positions,
+    transactions_df: pd.DataFrame,
+    opening: pd.Series,
+    closing: pd.Series,
+    last_day: str,
+) -> PortfolioStats:
+    """
+    Assembles the PortfolioStats of one period from its positions and balances.
+    """
     # Get detailed statistics
     closed_positions_stats = closed_positions.get_stats(last_day)
 
@@ -42,23 +163,22 @@ def stats_from_portfolio(portfolio: Portfolio, year: str) -> PortfolioStats:
     realized_profit = closed_positions_stats["total_profit"]
     open_positions_cost = sum(pos.cost for pos in open_positions)
     open_positions_valuation = sum(pos.value for pos in open_positions)
+    flows = closing - opening
 
     # Create and return PortfolioStats dataclass
     return PortfolioStats(
         realized_profit=realized_profit,
         unrealized_profit=open_positions_valuation - open_positions_cost,
-        initial_cash=portfolio.account.get_amount_at(previous_last_day),
-        final_cash=portfolio.account.get_amount_at(last_day),
+        initial_cash=float(opening["balance"]),
+        final_cash=float(closing["balance"]),
         initial_valuation=sum(pos.value for pos in last_open_positions),
         final_valuation=open_positions_valuation,
-        incomes=transactions_df[transactions_df["type"] == "income"]["amount"].sum(),
-        deposits=transactions_df[transactions_df["type"] == "deposit"]["amount"].sum(),
-        withdrawals=transactions_df[transactions_df["type"] == "withdrawal"][
-            "amount"
-        ].sum(),
+        incomes=float(flows["income"]),
+        deposits=float(flows["deposit"]),
+        withdrawals=float(flows["withdrawal"]),
         commission=0.0,
         closed_positions_stats=closed_positions_stats,
-        closed_positions=closed_positions_df,
-        open_positions=open_positions_df,
+        closed_positions=closed_positions.to_dataframe(),
+        open_positions=open_positions.to_dataframe(),
         transactions=transactions_df,
     )
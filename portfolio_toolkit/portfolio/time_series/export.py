@@ -0,0 +1,161 @@
+import sys
+from typing import Dict, Iterable, Optional, TextIO
+
+import numpy as np
+import pandas as pd
+
+from .portfolio_time_series import PortfolioTimeSeries
+
+EXPORT_FORMATS = ["table", "csv", "parquet"]
+
+# Width of numeric table cells: values below 1e7 with six decimals line up
+TABLE_NUMBER_WIDTH = 14
+
+
+def export_time_series(
+    portfolio: PortfolioTimeSeries,
+    output: Optional[str] = None,
+    fmt: str = "csv",
+    chunk_days: int = 31,
+) -> int:
+    """
+    Streams the portfolio time series to stdout or a file, chunk by chunk.
+
+    Rows are produced by PortfolioTimeSeries.iter_chunks() and written as soon as
+    each chunk is ready, so memory stays bounded by the chunk size instead of the
+    length of the whole series. The 'table' format uses column widths fixed
+    from the first chunk, so every chunk lines up with the header.
+
+    Args:
+        portfolio (PortfolioTimeSeries): Time series to export. Its window and
+            ticker selection are respected.
+        output (str, optional): Output file path. Writes to stdout if None.
+        fmt (str): One of 'table', 'csv' or 'parquet'.
+        chunk_days (int): Calendar days covered by each chunk.
+
+    Returns:
+        int: Number of rows written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"fmt must be one of {EXPORT_FORMATS}")
+
+    chunks = portfolio.iter_chunks(
+        portfolio.window_start,
+        portfolio.window_end,
+        portfolio.tickers,
+        chunk_days=chunk_days,
+    )
+
+    if fmt == "parquet":
+        if output is None:
+            raise ValueError("An output file is required for the parquet format.")
+        return write_parquet_chunks(chunks, output)
+
+    if output is None:
+        return _write_text_chunks(chunks, sys.stdout, fmt)
+
+    with open(output, "w", encoding="utf-8", newline="") as stream:
+        return _write_text_chunks(chunks, stream, fmt)
+
+
+def _write_text_chunks(chunks: Iterable[pd.DataFrame], stream: TextIO, fmt: str) -> int:
+    """
+    Writes chunks as CSV or as a plain text table to an open stream.
+    """
+    rows = 0
+    widths = None
+    for chunk in chunks:
+        if fmt == "csv":
+            chunk.to_csv(stream, header=rows == 0, index=False)
+        else:
+            if widths is None:
+                widths = _table_widths(chunk)
+                stream.write(
+                    " ".join(name.rjust(widths[name]) for name in chunk.columns)
+                )
+                stream.write("\n")
+            lines = _table_cells(chunk, widths)
+            if len(lines):
+                stream.write("\n".join(lines.tolist()))
+                stream.write("\n")
+        rows += len(chunk)
+    return rows
+
+
+def _table_widths(chunk: pd.DataFrame) -> Dict[str, int]:
+    """
+    Fixes the width of every table column from the first chunk, so all chunks
+    line up without the whole series being formatted at once.
+
+    Categorical columns share their categories across chunks, dates are
+    always ten characters and numbers get ``TABLE_NUMBER_WIDTH``.
+    """
+    widths = {}
+    for name, column in chunk.items():
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            width = max((len(str(value)) for value in column.cat.categories), default=0)
+        elif column.dtype.kind == "M":
+            width = 10
+        else:
+            width = TABLE_NUMBER_WIDTH
+        widths[name] = max(width, len(name))
+    return widths
+
+
+def _table_cells(chunk: pd.DataFrame, widths: Dict[str, int]) -> np.ndarray:
+    """
+    Formats the rows of a chunk as right-aligned, space-separated lines.
+    """
+    lines = None
+    for name, column in chunk.items():
+        if column.dtype.kind == "M":
+            cells = column.dt.strftime("%Y-%m-%d").to_numpy(dtype=str)
+        elif column.dtype.kind == "f":
+            # Six decimals like DataFrame.to_string, without trailing zeros
+            cells = np.char.rstrip(np.char.mod("%.6f", column.to_numpy()), "0")
+            cells = np.where(
+                np.char.endswith(cells, "."), np.char.add(cells, "0"), cells
+            )
+        else:
+            cells = column.astype(str).to_numpy(dtype=str)
+        cells = np.char.rjust(cells, widths[name])
+        lines = cells if lines is None else np.char.add(np.char.add(lines, " "), cells)
+    return lines if lines is not None else np.empty(0, dtype=str)
+
+
+def write_parquet_chunks(chunks: Iterable[pd.DataFrame], output: str) -> int:
+    """
+    Writes chunks to a Parquet file, one row group per chunk.
+
+    Requires the optional ``pyarrow`` dependency.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Parquet export requires pyarrow. "
+            "Install it with: pip install portfolio-toolkit[parquet]"
+        )
+
+    rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            # Quantities may be int32 in one chunk and float in the next, so
+            # integers are widened to keep one schema for every row group
+            integers = chunk.select_dtypes("integer").columns
+            chunk = chunk.astype({column: "float64" for column in integers})
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(output, table.schema)
+            else:
+                table = pa.Table.from_pandas(
+                    chunk, schema=writer.schema, preserve_index=False
+                )
+            writer.write_table(table)
+            rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
@@ -1,12 +1,21 @@
 from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from portfolio_toolkit.asset.market.price_index import PriceIndex
 from portfolio_toolkit.plot.line_chart_data import LineChartData
-from portfolio_toolkit.position.open.list_from_portfolio import get_asset_open_positions
+from portfolio_toolkit.utils.dates import to_datetime64
 
 from ..portfolio import Portfolio
-from .utils import create_date_series_from_intervals, get_ticker_holding_intervals
+from .utils import (
+    PositionCursor,
+    clip_date_series,
+    date_index_from_intervals,
+    get_asset_holding_intervals,
+)
 
 
 @dataclass
@@ -15,104 +24,301 @@ class PortfolioTimeSeries(Portfolio):
     DataFrame with the following structure:
 
     Columns:
-    - Date (str): Date of the transaction or calculation.
-    - Ticker (str): Asset symbol (including synthetic cash tickers like __EUR).
-    - Quantity (int): Accumulated quantity of shares/units on the date.
+    - Date (datetime64): Date of the transaction or calculation.
+    - Ticker (category): Asset symbol (including synthetic cash tickers like __EUR).
+    - Quantity (int32 or float): Accumulated quantity of shares/units on the date.
     - Price (float): Share price on the date in original currency (1.0 for cash tickers).
     - Price_Base (float): Share price converted to portfolio base currency, including fees for purchase transactions.
     - Value (float): Total value of the shares/units on the date (Quantity * Price).
     - Value_Base (float): Total value in portfolio base currency (Quantity * Price_Base).
     - Cost (float): Total accumulated cost of the shares/units on the date in base currency.
-    - Sector (str): Sector to which the asset belongs (Cash for synthetic tickers).
-    - Country (str): Country to which the asset belongs.
+    - Sector (category): Sector to which the asset belongs (Cash for synthetic tickers).
+    - Country (category): Country to which the asset belongs.
 
     Each row represents the state of an asset on a specific date.
-    Cash transactions use synthetic tickers (e.g., __EUR) with constant price of 1.0.
+    When include_cash is set, the account balance is added under a synthetic
+    ticker (e.g., __EUR) with constant price of 1.0.
+
+    The DataFrame is built lazily on first access and only covers the
+    [window_start, window_end] window and the selected tickers. Other windows
+    can be computed on demand with get_window(). Float columns use float_dtype,
+    which can be set to "float32" to halve their memory footprint.
     """
 
-    portfolio_timeseries: pd.DataFrame = field(init=False)
+    window_start: Optional[str] = None
+    window_end: Optional[str] = None
+    tickers: Optional[List[str]] = None
+    float_dtype: str = "float64"
+    include_cash: bool = False
+    _portfolio_timeseries: Optional[pd.DataFrame] = field(
+        init=False, default=None, repr=False
+    )
 
     def __post_init__(self):
         # super().__post_init__()
-        self.portfolio_timeseries = self._build_portfolio_timeseries()
+        pass
 
-    def _build_portfolio_timeseries(self) -> pd.DataFrame:
+    @property
+    def portfolio_timeseries(self) -> pd.DataFrame:
+        """
+        Time series for the configured window, computed on first access.
         """
-        Preprocesses portfolio data to generate a structured DataFrame, including cost calculation.
+        if self._portfolio_timeseries is None:
+            self._portfolio_timeseries = self.get_window(
+                self.window_start, self.window_end, self.tickers
+            )
+        return self._portfolio_timeseries
+
+    def get_window(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Computes the time series for a date window and a subset of tickers.
+
+        Each asset is seeded with its position state at the start of the window
+        and rolled forward day by day, so short windows on long-lived portfolios
+        only pay for the days they cover.
 
         Args:
-            assets (list): List of assets with their transactions.
-            start_date (datetime): Portfolio start date.
-            data_provider (DataProvider): Data provider to obtain historical prices.
+            start_date (str, optional): First date of the window (YYYY-MM-DD).
+                Defaults to the start of the holding history.
+            end_date (str, optional): Last date of the window (YYYY-MM-DD).
+                Defaults to today.
+            tickers (List[str], optional): Tickers to include. Defaults to all.
 
         Returns:
             pd.DataFrame: Structured DataFrame with the portfolio evolution.
         """
+        chunks = list(self.iter_chunks(start_date, end_date, tickers, chunk_days=None))
+        if not chunks:
+            return pd.DataFrame()
+        return chunks[0]
 
-        records = []
+    def iter_chunks(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        chunk_days: Optional[int] = 31,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yields the time series in date-ordered chunks.
+
+        Only one chunk is held in memory at a time and the position of every
+        asset is carried over from one chunk to the next, so the whole series
+        can be streamed without being materialized.
+
+        Args:
+            start_date (str, optional): First date of the window (YYYY-MM-DD).
+            end_date (str, optional): Last date of the window (YYYY-MM-DD).
+            tickers (List[str], optional): Tickers to include. Defaults to all.
+            chunk_days (int, optional): Calendar days covered by each chunk.
+                If None, the whole window is returned as a single chunk.
 
+        Yields:
+            pd.DataFrame: Rows of the time series, sorted by date within and
+            across chunks.
+        """
+        # One (ticker, sector, country, dates, get_columns) source per series
+        sources = []
         for ticker_asset in self.assets:
-            dates = []
-            historical_prices = []
             ticker = ticker_asset.ticker
-            if ticker.startswith("__"):
-                dates = pd.date_range(
-                    start=self.start_date, end=pd.Timestamp.now(), freq="D"
+            if tickers is not None and ticker not in tickers:
+                continue
+
+            dates = clip_date_series(
+                date_index_from_intervals(*get_asset_holding_intervals(ticker_asset)),
+                start_date,
+                end_date,
+            )
+            if dates.empty:
+                continue
+
+            if ticker_asset.currency == self.currency:
+                # Shares the asset's prices, loading only the window if lazy
+                price_index = ticker_asset.get_price_index(
+                    to_datetime64(dates[0]), to_datetime64(dates[-1])
                 )
-                historical_prices = pd.Series(1.0, index=dates)
             else:
-                interval = get_ticker_holding_intervals(self.assets, ticker)
-                dates = create_date_series_from_intervals(interval)
-                historical_prices = self.data_provider.get_price_series_converted(
-                    ticker, self.currency
+                price_index = PriceIndex(
+                    self.data_provider.get_price_series_converted(ticker, self.currency)
                 )
+            sources.append(
+                (
+                    ticker,
+                    ticker_asset.sector,
+                    ticker_asset.country,
+                    dates,
+                    partial(
+                        self._get_asset_columns,
+                        price_index=price_index,
+                        cursor=PositionCursor(ticker_asset, self.cost_basis),
+                    ),
+                )
+            )
 
-            latest_price = 0
-            for date in dates:
-                current_quantity = 0
-                current_cost = 0
-
-                # Calculate cost using the modularized function
-                date_string = date.strftime("%Y-%m-%d")
-                cost_info = get_asset_open_positions(ticker_asset, date_string)
-                current_quantity = cost_info.quantity
-                current_cost = cost_info.cost
+        cash_ticker = f"__{self.currency}"
+        if self.include_cash and (tickers is None or cash_ticker in tickers):
+            source = self._get_cash_source(cash_ticker, start_date, end_date)
+            if source is not None:
+                sources.append(source)
 
-                # cost_info = calculate_cost(date, ticker_asset.transactions)
+        if not sources:
+            return
 
-                # current_quantity = cost_info["quantity"]
-                # current_cost = cost_info["total_cost"]
+        first_date = min(source[3][0] for source in sources)
+        last_date = max(source[3][-1] for source in sources)
+        if chunk_days is None:
+            blocks = [(first_date, last_date)]
+        else:
+            step = pd.Timedelta(days=chunk_days)
+            blocks = [
+                (block_start, min(block_start + step - pd.Timedelta(days=1), last_date))
+                for block_start in pd.date_range(first_date, last_date, freq=step)
+            ]
 
-                if date in historical_prices.index:
-                    price = historical_prices.loc[date].item()
-                    latest_price = price
-                else:
-                    price = latest_price
+        # Shared categories keep the dtypes identical across chunks
+        tickers_categories = [source[0] for source in sources]
+        sector_categories = sorted({source[1] for source in sources})
+        country_categories = sorted({source[2] for source in sources})
+        sector_codes = {sector: i for i, sector in enumerate(sector_categories)}
+        country_codes = {country: i for i, country in enumerate(country_categories)}
 
-                value = current_quantity * price
+        for block_start, block_end in blocks:
+            parts = []
+            for position, (_, sector, country, dates, get_columns) in enumerate(
+                sources
+            ):
+                block_dates = dates[
+                    dates.searchsorted(block_start) : dates.searchsorted(
+                        block_end, side="right"
+                    )
+                ]
+                if not block_dates.empty:
+                    columns = get_columns(block_dates)
+                    columns["Ticker"] = position
+                    columns["Sector"] = sector_codes[sector]
+                    columns["Country"] = country_codes[country]
+                    parts.append(columns)
 
-                records.append(
+            if parts:
+                yield self._build_frame(
+                    parts,
                     {
-                        "Date": date,
-                        "Ticker": ticker,
-                        "Quantity": current_quantity,
-                        "Price": 0,
-                        "Price_Base": price,
-                        "Value": 0,
-                        "Value_Base": value,
-                        "Cost": current_cost,
-                        "Sector": ticker_asset.sector,
-                        "Country": ticker_asset.country,
-                    }
+                        "Ticker": tickers_categories,
+                        "Sector": sector_categories,
+                        "Country": country_categories,
+                    },
+                    sort_by_date=chunk_days is not None,
                 )
 
-        # Convert records to DataFrame
-        return pd.DataFrame(records)
+    def _get_cash_source(self, cash_ticker, start_date, end_date):
+        """
+        Builds the synthetic cash series from the account daily balance.
+        """
+        if not self.account.transactions:
+            return None
+
+        balance = self.account.get_balance_series(start_date, end_date)
+        dates = pd.DatetimeIndex(balance.index)
+        if dates.empty:
+            return None
+
+        def get_columns(block_dates):
+            quantity = balance.reindex(block_dates).to_numpy(dtype="float64")
+            return {
+                "Date": block_dates.values,
+                "Quantity": quantity,
+                "Price_Base": np.ones(len(block_dates)),
+                "Value_Base": quantity,
+                "Cost": quantity,
+            }
+
+        return cash_ticker, "Cash", "Unknown", dates, get_columns
+
+    def _get_asset_columns(self, dates, price_index, cursor):
+        """
+        Computes the numeric time series columns of a single asset.
+        """
+        # As-of price for every date, carrying the last known price forward
+        prices = price_index.get_prices_at(dates.values, default=0.0)
+        quantities, costs = cursor.states_at(dates)
+
+        return {
+            "Date": dates.values,
+            "Quantity": quantities,
+            "Price_Base": prices,
+            "Value_Base": quantities * prices,
+            "Cost": costs,
+        }
+
+    def _build_frame(self, parts, categories, sort_by_date: bool) -> pd.DataFrame:
+        """
+        Assembles per-asset column arrays into a compact DataFrame.
+
+        The frame is built column by column: string columns become categoricals,
+        quantities are stored as int32 when they are all whole numbers that fit,
+        and the remaining numeric columns use ``float_dtype``.
+        """
+        lengths = [len(part["Date"]) for part in parts]
+        dates = np.concatenate([part["Date"] for part in parts])
+        order = np.argsort(dates, kind="stable") if sort_by_date else slice(None)
+
+        def numeric(name):
+            return np.concatenate([part[name] for part in parts])[order]
+
+        def categorical(name):
+            codes = np.repeat(
+                np.array([part[name] for part in parts], dtype="int32"), lengths
+            )
+            return pd.Categorical.from_codes(codes[order], categories[name])
+
+        quantity = numeric("Quantity")
+        if (
+            quantity.size
+            and np.all(quantity == np.round(quantity))
+            and np.abs(quantity).max() <= np.iinfo(np.int32).max
+        ):
+            quantity = quantity.astype("int32")
+        else:
+            quantity = quantity.astype(self.float_dtype)
+
+        zeros = np.zeros(len(dates), dtype=self.float_dtype)
+
+        return pd.DataFrame(
+            {
+                "Date": dates[order],
+                "Ticker": categorical("Ticker"),
+                "Quantity": quantity,
+                "Price": zeros,
+                "Price_Base": numeric("Price_Base").astype(self.float_dtype),
+                "Value": zeros.copy(),
+                "Value_Base": numeric("Value_Base").astype(self.float_dtype),
+                "Cost": numeric("Cost").astype(self.float_dtype),
+                "Sector": categorical("Sector"),
+                "Country": categorical("Country"),
+            },
+            copy=False,
+        )
 
     @classmethod
-    def from_portfolio(cls, portfolio: "Portfolio") -> "PortfolioTimeSeries":
+    def from_portfolio(
+        cls,
+        portfolio: "Portfolio",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        tickers: Optional[List[str]] = None,
+        float_dtype: str = "float64",
+        include_cash: bool = False,
+    ) -> "PortfolioTimeSeries":
         """
         Alternate constructor that builds PortfolioTimeSeries from a Portfolio.
+
+        The time series is not computed until it is first accessed, and then
+        only for the [start_date, end_date] window and the requested tickers.
         """
         return PortfolioTimeSeries(
             name=portfolio.name,
@@ -121,6 +327,12 @@ class PortfolioTimeSeries(Portfolio):
             data_provider=portfolio.data_provider,
             account=portfolio.account,
             start_date=portfolio.start_date,
+            cost_basis=portfolio.cost_basis,
+            window_start=start_date,
+            window_end=end_date,
+            tickers=tickers,
+            float_dtype=float_dtype,
+            include_cash=include_cash,
         )
 
     def print(self) -> None:
@@ -128,6 +340,11 @@ class PortfolioTimeSeries(Portfolio):
 
         print_data_frame(self)
 
+    def export(self, output: Optional[str] = None, fmt: str = "csv") -> int:
+        from .export import export_time_series
+
+        return export_time_series(self, output=output, fmt=fmt)
+
     def plot_evolution(self) -> LineChartData:
         from .plot_evolution import plot_portfolio_evolution
 
@@ -1,19 +1,24 @@
+import sys
+
+from .export import export_time_series
 from .portfolio_time_series import PortfolioTimeSeries
 
 
 def print_data_frame(portfolio: PortfolioTimeSeries):
     """
     Prints the portfolio DataFrame in a readable format for debugging purposes.
+
+    Rows are streamed in date order, one chunk at a time, as a fixed-width
+    table whose column widths are set from the first chunk, instead of building
+    the whole table as a single string.
     """
     print(
         f"Portfolio '{portfolio.name}' initialized with {len(portfolio.assets)} assets."
     )
     print(f"Portfolio currency: {portfolio.currency}")
-    if portfolio.portfolio_timeseries is not None:
-        temp = portfolio.portfolio_timeseries.sort_values(by=["Date"], ascending=True)
-        print(temp.to_string())
-        print(
-            f"Portfolio DataFrame initialized with {len(portfolio.portfolio_timeseries)} records."
-        )
+    sys.stdout.flush()
+    rows = export_time_series(portfolio, fmt="table")
+    if rows:
+        print(f"Portfolio DataFrame initialized with {rows} records.")
     else:
         print("No DataFrame available - portfolio not properly initialized.")
@@ -1,7 +1,15 @@
+import numpy as np
 import pandas as pd
 
+from portfolio_toolkit.utils.dates import (
+    expand_day_ranges,
+    to_datetime64,
+    to_datetime64_array,
+    today,
+)
 
-def get_ticker_holding_intervals(assets, ticker):  # noqa: C901
+
+def get_ticker_holding_intervals(assets, ticker):
     """
     Returns the date intervals where a specific ticker was held in the portfolio.
 
@@ -15,56 +23,48 @@ def get_ticker_holding_intervals(assets, ticker):  # noqa: C901
     Example:
         [('2025-06-01', '2025-06-10'), ('2025-06-20', '2025-07-03')]
     """
-    # Find the asset with the given ticker
-    asset_transactions = None
     for asset in assets:
         if asset.ticker == ticker:
-            asset_transactions = asset.transactions
-            break
-
-    if not asset_transactions:
-        return []
+            starts, ends = get_asset_holding_intervals(asset)
+            return list(zip(starts.astype(str).tolist(), ends.astype(str).tolist()))
+    return []
 
-    # Sort transactions by date
-    sorted_transactions = sorted(asset_transactions, key=lambda x: x.date)
 
-    intervals = []
-    current_quantity = 0
-    holding_start = None
+def get_asset_holding_intervals(asset, method: str = "fifo"):
+    """
+    Returns the intervals where an asset was held, as datetime64[D] arrays.
 
-    for transaction in sorted_transactions:
-        date = transaction.date
-        transaction_type = transaction.transaction_type
-        quantity = transaction.quantity
+    The open quantity comes from the asset's lot engine, which never lets a
+    position go below zero, so oversold ledgers and splits are handled the
+    same way as by the open position queries.
 
-        # Calculate new quantity after transaction
-        if transaction_type == "buy":
-            new_quantity = current_quantity + quantity
-        elif transaction_type == "sell":
-            new_quantity = current_quantity - quantity
-        else:
-            continue  # Skip other transaction types
+    Args:
+        asset (PortfolioAsset): The asset to analyze.
+        method (str): Cost-basis method of the lot engine to read.
 
-        # Check if we're starting to hold
-        if current_quantity == 0 and new_quantity > 0:
-            holding_start = date
+    Returns:
+        tuple: Arrays of interval start and end dates. An interval still open
+        ends today.
+    """
+    table = asset.transactions
+    if not table:
+        empty = np.empty(0, dtype="datetime64[D]")
+        return empty, empty
 
-        # Check if we stopped holding
-        elif current_quantity > 0 and new_quantity == 0:
-            if holding_start:
-                intervals.append((holding_start, date))
-                holding_start = None
+    # Quantity held after each transaction (the table is already date-sorted)
+    _, states, _ = asset.get_lot_engine(method).position_states()
+    held = states > 0
+    previous = np.concatenate(([False], held[:-1]))
+    dates = table.dates
 
-        current_quantity = new_quantity
+    starts = dates[~previous & held]
+    ends = dates[previous & ~held]
 
     # If we're still holding at the end, add interval until today
-    if current_quantity > 0 and holding_start:
-        from datetime import datetime
-
-        today = datetime.now().strftime("%Y-%m-%d")
-        intervals.append((holding_start, today))
+    if held[-1]:
+        ends = np.append(ends, today())
 
-    return intervals
+    return starts, ends
 
 
 def create_date_series_from_intervals(intervals):
@@ -77,12 +77,105 @@ def create_date_series_from_intervals(intervals):
     Returns:
         pd.DatetimeIndex: Series with all dates from the intervals
     """
-    all_dates = []
+    starts = to_datetime64_array(start for start, _ in intervals)
+    ends = to_datetime64_array(end for _, end in intervals)
+    return date_index_from_intervals(starts, ends)
+
+
+def date_index_from_intervals(starts, ends):
+    """
+    Like create_date_series_from_intervals, for datetime64[D] start and end
+    arrays such as those of get_asset_holding_intervals.
+    """
+    days = expand_day_ranges(starts, ends)
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"))
+
+
+def clip_date_series(dates, start_date=None, end_date=None):
+    """
+    Restricts a date series to the [start_date, end_date] window.
+
+    Args:
+        dates (pd.DatetimeIndex): Dates to restrict.
+        start_date (str, optional): First date of the window (YYYY-MM-DD).
+        end_date (str, optional): Last date of the window (YYYY-MM-DD).
+
+    Returns:
+        pd.DatetimeIndex: Dates inside the window.
+    """
+    if start_date is not None:
+        dates = dates[dates >= to_datetime64(start_date)]
+    if end_date is not None:
+        dates = dates[dates <= to_datetime64(end_date)]
+    return dates
+
 
-    for start_date, end_date in intervals:
-        date_range = pd.date_range(start=start_date, end=end_date, freq="D")
-        all_dates.extend(date_range)
+class PositionCursor:
+    """
+    Looks up the open position of an asset on arbitrary dates.
+
+    The asset's transactions are replayed once by its lot engine; every lookup
+    afterwards is a binary search on the transaction dates, so a sequence of
+    dates (for example consecutive chunks of a time series) costs one replay in
+    total.
+    """
+
+    def __init__(self, asset, method: str = "fifo"):
+        self.dates = asset.transactions.dates
+        _, held, costs = asset.get_lot_engine(method).position_states()
+        # Prepend the empty state for dates before the first transaction
+        self.quantities = np.concatenate(([0.0], held))
+        self.costs = np.concatenate(([0.0], costs))
+
+    def advance(self, date):
+        """
+        Returns the position on the given date.
+
+        Args:
+            date: Date to look up ("YYYY-MM-DD" string, date or datetime64).
+
+        Returns:
+            tuple: The (quantity, cost) state on that date.
+        """
+        position = int(np.searchsorted(self.dates, to_datetime64(date), side="right"))
+        return float(self.quantities[position]), float(self.costs[position])
+
+    def states_at(self, dates):
+        """
+        Returns the position on each of the given dates.
+
+        Args:
+            dates (pd.DatetimeIndex): Dates to look up.
+
+        Returns:
+            tuple: Arrays of quantities and costs, one entry per date.
+        """
+        positions = np.searchsorted(
+            self.dates, np.asarray(dates, dtype="datetime64[D]"), side="right"
+        )
+        return self.quantities[positions], self.costs[positions]
+
+
+def get_asset_position_states(asset, dates, cursor=None, method="fifo"):
+    """
+    Returns the open quantity and cost of an asset on each of the given dates.
+
+    The transactions are replayed once and every date is resolved with a binary
+    search, so the work is proportional to the window and not to the number of
+    days since the first transaction.
+
+    Args:
+        asset (PortfolioAsset): The asset containing transactions.
+        dates (pd.DatetimeIndex): Dates to evaluate.
+        cursor (PositionCursor, optional): Cursor to reuse. A new one is
+            created when not provided.
+        method (str): Cost-basis method used for a new cursor.
+
+    Returns:
+        list: List of (quantity, cost) tuples, one per date.
+    """
+    if cursor is None:
+        cursor = PositionCursor(asset, method)
 
-    # Remove duplicates and sort
-    unique_dates = pd.DatetimeIndex(sorted(set(all_dates)))
-    return unique_dates
+    quantities, costs = cursor.states_at(dates)
+    return list(zip(quantities.tolist(), costs.tolist()))
@@ -0,0 +1,77 @@
+from typing import Any, Iterator, List, Optional
+
+
+class ArrayBackedList:
+    """
+    List of positions stored either as objects or as a columnar arrays object.
+
+    Lists built from arrays (see ``from_arrays``) do not create one object per
+    position: iterating or indexing builds the requested rows on the fly, and
+    ``positions`` materializes the whole list only when it is first accessed.
+    Aggregates and DataFrame exports read the arrays directly.
+
+    Subclasses set ``ARRAYS_CLASS`` to a class providing ``from_positions``,
+    ``row(i)``, ``to_dataframe()`` and ``__len__``.
+    """
+
+    ARRAYS_CLASS: Any = None
+
+    def __init__(self, positions: Optional[List[Any]] = None, arrays=None):
+        if positions is None and arrays is None:
+            positions = []
+        self._positions = positions
+        self._arrays = arrays
+
+    @classmethod
+    def from_arrays(cls, arrays) -> "ArrayBackedList":
+        """
+        Creates a list backed by ``arrays``, without creating position objects.
+        """
+        return cls(arrays=arrays)
+
+    @property
+    def positions(self) -> List[Any]:
+        if self._positions is None:
+            self._positions = [self._arrays.row(i) for i in range(len(self._arrays))]
+            # The objects may now be edited, so the arrays are no longer current
+            self._arrays = None
+        return self._positions
+
+    @positions.setter
+    def positions(self, positions: List[Any]):
+        self._positions = positions
+        self._arrays = None
+
+    def to_arrays(self):
+        """
+        Returns the columnar view of the positions.
+
+        Lists built from arrays return them as they are. Once the position
+        objects exist they are the source of truth, since ``positions`` and
+        its items may be edited in place, so the view is rebuilt from them.
+        """
+        if self._positions is not None:
+            return self.ARRAYS_CLASS.from_positions(self._positions)
+        return self._arrays
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._positions is not None:
+            return iter(self._positions)
+        arrays = self._arrays
+        return (arrays.row(i) for i in range(len(arrays)))
+
+    def __len__(self) -> int:
+        if self._positions is not None:
+            return len(self._positions)
+        return len(self._arrays)
+
+    def __getitem__(self, idx):
+        if self._positions is not None:
+            return self._positions[idx]
+        if isinstance(idx, slice):
+            return [self._arrays.row(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._arrays.row(idx)
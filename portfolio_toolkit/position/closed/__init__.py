@@ -1,4 +1,5 @@
 from .closed_position import ClosedPosition
+from .closed_position_arrays import ClosedPositionArrays
 from .closed_position_list import ClosedPositionList
 
-__all__ = ["ClosedPosition", "ClosedPositionList"]
+__all__ = ["ClosedPosition", "ClosedPositionArrays", "ClosedPositionList"]
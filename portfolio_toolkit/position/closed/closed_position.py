@@ -1,22 +1,25 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List
 
 import pandas as pd
 
+from portfolio_toolkit.utils.slots import slotted_dataclass
+
 from ..position import Position
 
 
-@dataclass
+@slotted_dataclass
 class ClosedPosition(Position):
     buy_date: str
     sell_price: float
     sell_date: str
+    sector: str = "Unknown"
     value: float = field(init=False)
     profit: float = field(init=False)
     return_percentage: float = field(init=False)
 
     def __post_init__(self):
-        super().__post_init__()  # Calcula `cost` desde Position
+        Position.__post_init__(self)  # Calcula `cost` desde Position
         self.value = self.sell_price * self.quantity
         self.profit = self.value - self.cost
         self.return_percentage = (
@@ -0,0 +1,293 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.utils.dates import to_datetime64_array
+
+from .closed_position import ClosedPosition
+
+# Holding period buckets in days, as (label, first day, last day)
+HOLDING_PERIOD_BUCKETS = (
+    ("<= 30 days", 0, 30),
+    ("31-90 days", 31, 90),
+    ("91-365 days", 91, 365),
+    ("> 1 year", 366, None),
+)
+
+# Constructor arguments of ClosedPositionArrays
+_INPUT_FIELDS = (
+    "tickers",
+    "sectors",
+    "buy_dates",
+    "sell_dates",
+    "quantities",
+    "buy_prices",
+    "sell_prices",
+)
+
+# Keys accepted by ClosedPositionArrays.aggregate
+GROUP_KEYS = ("week", "month", "quarter", "year", "ticker", "sector")
+
+
+@dataclass(eq=False)
+class ClosedPositionArrays:
+    """
+    Columnar view of closed positions: one numpy array per field.
+
+    Aggregates over the arrays are vectorized, so statistics over hundreds of
+    thousands of closed lots do not touch ClosedPosition objects.
+
+    Attributes:
+        tickers (np.ndarray): Ticker of each position (object).
+        sectors (np.ndarray): Sector of each position (object).
+        buy_dates (np.ndarray): Buy dates (datetime64[D]).
+        sell_dates (np.ndarray): Sell dates (datetime64[D]).
+        quantities (np.ndarray): Quantity closed.
+        buy_prices (np.ndarray): Unit cost.
+        sell_prices (np.ndarray): Unit sell price.
+        costs, values, profits, returns (np.ndarray): Derived like the
+            ClosedPosition fields of the same name (returns in percent).
+        holding_days (np.ndarray): Days between buy and sell (int64).
+    """
+
+    tickers: np.ndarray
+    sectors: np.ndarray
+    buy_dates: np.ndarray
+    sell_dates: np.ndarray
+    quantities: np.ndarray
+    buy_prices: np.ndarray
+    sell_prices: np.ndarray
+    costs: np.ndarray = field(init=False)
+    values: np.ndarray = field(init=False)
+    profits: np.ndarray = field(init=False)
+    returns: np.ndarray = field(init=False)
+    holding_days: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.costs = self.buy_prices * self.quantities
+        self.values = self.sell_prices * self.quantities
+        self.profits = self.values - self.costs
+        self.returns = (
+            np.divide(
+                self.profits,
+                self.costs,
+                out=np.zeros_like(self.profits),
+                where=self.costs != 0,
+            )
+            * 100
+        )
+        self.holding_days = (self.sell_dates - self.buy_dates).astype("int64")
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_positions(
+        cls, positions: Iterable[ClosedPosition]
+    ) -> "ClosedPositionArrays":
+        """
+        Builds the arrays in a single pass over ClosedPosition objects.
+        """
+        positions = list(positions)
+        return cls(
+            tickers=np.array([p.ticker for p in positions], dtype=object),
+            sectors=np.array([p.sector for p in positions], dtype=object),
+            buy_dates=to_datetime64_array(p.buy_date for p in positions),
+            sell_dates=to_datetime64_array(p.sell_date for p in positions),
+            quantities=np.array([p.quantity for p in positions], dtype="float64"),
+            buy_prices=np.array([p.buy_price for p in positions], dtype="float64"),
+            sell_prices=np.array([p.sell_price for p in positions], dtype="float64"),
+        )
+
+    @classmethod
+    def concatenate(
+        cls, parts: Sequence["ClosedPositionArrays"]
+    ) -> "ClosedPositionArrays":
+        """
+        Joins several arrays objects (for example one per asset) in order.
+        """
+        if not parts:
+            return cls.from_positions([])
+        return cls(
+            **{
+                name: np.concatenate([getattr(part, name) for part in parts])
+                for name in _INPUT_FIELDS
+            }
+        )
+
+    def take(self, rows) -> "ClosedPositionArrays":
+        """
+        Returns the positions at ``rows`` (indices or a boolean mask), in order.
+        """
+        return type(self)(**{name: getattr(self, name)[rows] for name in _INPUT_FIELDS})
+
+    def row(self, i: int) -> ClosedPosition:
+        """
+        Builds the ClosedPosition object of one row.
+        """
+        return ClosedPosition(
+            ticker=self.tickers[i],
+            buy_price=self.buy_prices[i].item(),
+            quantity=self.quantities[i].item(),
+            buy_date=str(self.buy_dates[i]),
+            sell_price=self.sell_prices[i].item(),
+            sell_date=str(self.sell_dates[i]),
+            sector=self.sectors[i],
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the columns of ClosedPosition.to_dataframe, built column-wise.
+        """
+        if not len(self):
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "buy_date": self.buy_dates.astype(str).astype(object),
+                "buy_price": self.buy_prices,
+                "quantity": self.quantities,
+                "cost": self.costs,
+                "sell_date": self.sell_dates.astype(str).astype(object),
+                "sell_price": self.sell_prices,
+                "value": self.values,
+                "profit": self.profits,
+                "return_percentage": self.returns,
+            }
+        )
+
+    @classmethod
+    def of(cls, positions) -> "ClosedPositionArrays":
+        """
+        Returns the arrays of a ClosedPositionList (cached there) or builds
+        them from any iterable of ClosedPosition objects.
+        """
+        to_arrays = getattr(positions, "to_arrays", None)
+        return to_arrays() if to_arrays is not None else cls.from_positions(positions)
+
+    def profit_factor(self) -> float:
+        """
+        Returns gross profit divided by gross loss: infinite if there are
+        gains but no losses, and 0.0 if there are no gains.
+        """
+        gross_profit = float(self.profits[self.profits > 0].sum())
+        gross_loss = float(-self.profits[self.profits < 0].sum())
+        if gross_loss == 0:
+            return float("inf") if gross_profit > 0 else 0.0
+        return gross_profit / gross_loss
+
+    def return_percentiles(
+        self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)
+    ) -> Dict[float, float]:
+        """
+        Returns the given percentiles of the return percentage.
+        """
+        return self._percentiles(self.returns, percentiles)
+
+    def holding_day_percentiles(
+        self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)
+    ) -> Dict[float, float]:
+        """
+        Returns the given percentiles of the holding period in days.
+        """
+        return self._percentiles(self.holding_days, percentiles)
+
+    def holding_period_counts(self) -> Dict[str, int]:
+        """
+        Returns the number of positions in each HOLDING_PERIOD_BUCKETS bucket.
+        """
+        edges = [first for _, first, _ in HOLDING_PERIOD_BUCKETS[1:]]
+        counts = np.bincount(
+            np.searchsorted(edges, self.holding_days, side="right"),
+            minlength=len(HOLDING_PERIOD_BUCKETS),
+        )
+        return {
+            label: int(count)
+            for (label, _, _), count in zip(HOLDING_PERIOD_BUCKETS, counts)
+        }
+
+    def profit_by_ticker(self) -> pd.Series:
+        """
+        Returns the total profit of each ticker, sorted by ticker.
+        """
+        return self.aggregate("ticker")
+
+    def profit_by_month(self) -> pd.Series:
+        """
+        Returns the total profit of each sell month ("YYYY-MM"), in order.
+        """
+        return self.aggregate("month")
+
+    def aggregate(self, by: str = "month", value: str = "profit") -> pd.Series:
+        """
+        Sums a value over groups of positions with a single bincount.
+
+        Args:
+            by (str): Grouping key, one of GROUP_KEYS. Date keys use the sell
+                date: "week" (labelled by its Monday, "YYYY-MM-DD"), "month"
+                ("YYYY-MM"), "quarter" ("YYYY-Qn") or "year" ("YYYY").
+            value (str): "profit", "cost", "value", "quantity" or "count".
+
+        Returns:
+            pd.Series: Total per group, indexed by label in sorted order.
+        """
+        if value == "count":
+            weights = None
+        elif value in ("profit", "cost", "value", "quantity"):
+            weights = getattr(
+                self, "quantities" if value == "quantity" else value + "s"
+            )
+        else:
+            raise ValueError(f"Unknown value to aggregate: {value}")
+
+        codes, labels = self._group_codes(by)
+        totals = np.bincount(codes, weights=weights, minlength=len(labels))
+        return pd.Series(
+            totals,
+            index=pd.Index(labels, dtype=object),
+            name=value,
+            dtype="int64" if weights is None else "float64",
+        )
+
+    def _group_codes(self, by: str) -> Tuple[np.ndarray, List[str]]:
+        """
+        Returns the group code of every position and the label of every code.
+        """
+        if by == "ticker":
+            keys = self.tickers
+        elif by == "sector":
+            keys = self.sectors
+        elif by == "week":
+            days = self.sell_dates.view("int64")
+            # 1970-01-01 was a Thursday: shift every day back to its Monday
+            keys = (days - (days + 3) % 7).view("datetime64[D]")
+        elif by == "month":
+            keys = self.sell_dates.astype("datetime64[M]")
+        elif by == "quarter":
+            months = self.sell_dates.astype("datetime64[M]").view("int64")
+            keys = months // 3
+        elif by == "year":
+            keys = self.sell_dates.astype("datetime64[Y]")
+        else:
+            raise ValueError(
+                f"Unknown grouping key: {by}. Expected one of {', '.join(GROUP_KEYS)}"
+            )
+
+        codes, uniques = pd.factorize(keys, sort=True)
+        uniques = np.asarray(uniques)
+        # Only the distinct groups are formatted
+        if by == "quarter":
+            labels = [f"{1970 + q // 4}-Q{q % 4 + 1}" for q in uniques.tolist()]
+        elif by in ("ticker", "sector"):
+            labels = [str(key) for key in uniques.tolist()]
+        else:
+            labels = uniques.astype(keys.dtype).astype(str).tolist()
+        return codes, labels
+
+    @staticmethod
+    def _percentiles(values: np.ndarray, percentiles: Sequence[float]):
+        if not len(values):
+            return {q: 0.0 for q in percentiles}
+        return dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
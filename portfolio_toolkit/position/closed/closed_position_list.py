@@ -1,45 +1,55 @@
-from typing import Any, Dict, Iterator, List
+from typing import Any, Dict, List, Sequence
 
 import pandas as pd
 
 from portfolio_toolkit.asset import PortfolioAsset
 
+from ..array_backed_list import ArrayBackedList
 from .closed_position import ClosedPosition
+from .closed_position_arrays import ClosedPositionArrays
 
 
-class ClosedPositionList:
-    def __init__(self, positions: List[ClosedPosition]):
-        self.positions = positions
+class ClosedPositionList(ArrayBackedList):
+    """
+    List of closed positions, possibly backed by a ClosedPositionArrays
+    (see ArrayBackedList).
+    """
 
-    def __iter__(self) -> Iterator[ClosedPosition]:
-        return iter(self.positions)
-
-    def __len__(self) -> int:
-        return len(self.positions)
-
-    def __getitem__(self, idx):
-        return self.positions[idx]
+    ARRAYS_CLASS = ClosedPositionArrays
 
     @classmethod
     def from_portfolio(
-        cls, portfolio: List[PortfolioAsset], from_date: str, to_date: str
+        cls,
+        portfolio: List[PortfolioAsset],
+        from_date: str,
+        to_date: str,
+        method: str = "fifo",
     ) -> "ClosedPositionList":
         """
         Create ClosedPositionList from a portfolio.
         """
         from .list_from_portfolio import get_closed_positions
 
-        return get_closed_positions(portfolio, from_date, to_date)
+        return get_closed_positions(portfolio, from_date, to_date, method)
 
     def get_stats(self, date: str) -> Dict[str, Any]:
         from .get_closed_positions_stats import get_closed_positions_stats
 
         return get_closed_positions_stats(self, date)
 
+    def get_distribution_stats(
+        self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)
+    ) -> Dict[str, Any]:
+        from .get_closed_positions_stats import get_closed_positions_distribution
+
+        return get_closed_positions_distribution(self, percentiles)
+
     def to_list(self) -> List[dict]:
         """Convert to a list of dictionaries."""
         return ClosedPosition.to_list(self.positions)
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to a pandas DataFrame."""
+        if self._positions is None:
+            return self._arrays.to_dataframe()
         return ClosedPosition.to_dataframe(self.positions)
@@ -1,5 +1,8 @@
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
+import numpy as np
+
+from .closed_position_arrays import ClosedPositionArrays
 from .closed_position_list import ClosedPositionList
 
 
@@ -40,30 +43,15 @@ def get_closed_positions_stats(
             "worst_ticker": "",
         }
 
-    total_profit = 0
-    winning_positions = 0
-    losing_positions = 0
-    best_return = float("-inf")
-    worst_return = float("inf")
-    best_ticker = ""
-    worst_ticker = ""
-
-    for position in positions:
-        return_percentage = position.return_percentage
-        total_profit += position.profit
-
-        if return_percentage > 0:
-            winning_positions += 1
-        elif return_percentage < 0:
-            losing_positions += 1
-
-        if return_percentage > best_return:
-            best_return = return_percentage
-            best_ticker = position.ticker
-
-        if return_percentage < worst_return:
-            worst_return = return_percentage
-            worst_ticker = position.ticker
+    arrays = ClosedPositionArrays.of(positions)
+    returns = arrays.returns
+    best = int(np.argmax(returns))
+    worst = int(np.argmin(returns))
+    winning_positions = int(np.count_nonzero(returns > 0))
+    losing_positions = int(np.count_nonzero(returns < 0))
+    total_profit = float(arrays.profits.sum())
+    best_return, best_ticker = float(returns[best]), arrays.tickers[best]
+    worst_return, worst_ticker = float(returns[worst]), arrays.tickers[worst]
 
     win_rate = (winning_positions / len(positions)) * 100
 
@@ -81,6 +69,37 @@ def get_closed_positions_stats(
     }
 
 
+def get_closed_positions_distribution(
+    positions: ClosedPositionList, percentiles: Sequence[float] = (5, 25, 50, 75, 95)
+) -> Dict[str, Any]:
+    """
+    Calculates the distribution of closed position results, vectorized over
+    the columnar view of the positions.
+
+    Args:
+        positions (ClosedPositionList): Closed positions to summarize.
+        percentiles (Sequence[float]): Percentiles to report (0-100).
+
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - profit_factor: Gross profit / gross loss
+            - return_percentiles: Return percentage at each percentile
+            - holding_day_percentiles: Holding period in days at each percentile
+            - holding_periods: Number of positions per holding period bucket
+            - profit_by_ticker: pd.Series of total profit per ticker
+            - profit_by_month: pd.Series of total profit per sell month
+    """
+    arrays = ClosedPositionArrays.of(positions)
+    return {
+        "profit_factor": arrays.profit_factor(),
+        "return_percentiles": arrays.return_percentiles(percentiles),
+        "holding_day_percentiles": arrays.holding_day_percentiles(percentiles),
+        "holding_periods": arrays.holding_period_counts(),
+        "profit_by_ticker": arrays.profit_by_ticker(),
+        "profit_by_month": arrays.profit_by_month(),
+    }
+
+
 def print_closed_positions_summary(positions: ClosedPositionList, date: str) -> None:
     """
     Prints a summary of closed positions with key metrics only.
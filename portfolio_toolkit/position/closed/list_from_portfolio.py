@@ -1,111 +1,100 @@
 from typing import List
 
+import numpy as np
+
 from portfolio_toolkit.asset import PortfolioAsset
 
 from .closed_position import ClosedPosition
+from .closed_position_arrays import ClosedPositionArrays
 from .closed_position_list import ClosedPositionList
 
 
 def get_closed_positions(
-    assets: List[PortfolioAsset], from_date: str, to_date: str
+    assets: List[PortfolioAsset], from_date: str, to_date: str, method: str = "fifo"
 ) -> ClosedPositionList:
     """
-    Calculates all closed positions for multiple assets using FIFO logic up to a specific date.
+    Calculates all closed positions for multiple assets up to a specific date.
+
+    The list is backed by the lot arrays of every asset, so no ClosedPosition
+    object is created until positions are iterated or indexed.
 
     Args:
         assets (List[PortfolioAsset]): List of PortfolioAsset objects containing transactions.
         date (str): The date up to which closed positions are calculated (YYYY-MM-DD).
+        method (str): Cost-basis method used to match sells against lots (default FIFO).
 
     Returns:
         ClosedPositionList: List of all ClosedPosition objects from all assets.
     """
-    all_closed_positions: List[ClosedPosition] = []
-
-    for asset in assets:
-        asset_closed_positions = get_asset_closed_positions(asset, from_date, to_date)
-        all_closed_positions.extend(asset_closed_positions)
-
-    return ClosedPositionList(all_closed_positions)
+    return ClosedPositionList.from_arrays(
+        ClosedPositionArrays.concatenate(
+            [
+                get_asset_closed_position_arrays(asset, from_date, to_date, method)
+                for asset in assets
+            ]
+        )
+    )
 
 
 def get_asset_closed_positions(
-    asset: PortfolioAsset, from_date: str, to_date: str
+    asset: PortfolioAsset, from_date: str, to_date: str, method: str = "fifo"
 ) -> List[ClosedPosition]:
     """
-    Calculates all closed positions for an asset using FIFO logic up to a specific date.
-    Each 'sell' transaction closes positions from the oldest 'buy' transactions.
+    Calculates all closed positions for an asset up to a specific date.
+    Each 'sell' transaction closes lots in the order given by the cost-basis
+    method; with FIFO (the default) the oldest 'buy' transactions go first.
 
     Args:
         asset (dict): Asset dictionary containing transactions.
         date (str): The date up to which closed positions are calculated (YYYY-MM-DD).
+        method (str): Cost-basis method used to match sells against lots.
 
     Returns:
         List[ClosedPosition]: List of ClosedPosition objects representing closed positions.
     """
-    transactions = sorted(
-        [tx for tx in asset.transactions if tx.date <= to_date], key=lambda x: x.date
+    arrays = get_asset_closed_position_arrays(asset, from_date, to_date, method)
+    return [arrays.row(i) for i in range(len(arrays))]
+
+
+def get_asset_closed_position_arrays(
+    asset: PortfolioAsset, from_date: str, to_date: str, method: str = "fifo"
+) -> ClosedPositionArrays:
+    """
+    Like get_asset_closed_positions, as a ClosedPositionArrays.
+    """
+    # Sells up to to_date only match lots bought before them, so the replay of
+    # the whole ledger is shared by every window
+    closed = asset.get_lot_engine(method).closed_lots()
+    window = closed.between(from_date, to_date)
+    count = window.stop - window.start
+
+    return ClosedPositionArrays(
+        tickers=np.full(count, asset.ticker, dtype=object),
+        sectors=np.full(count, asset.sector, dtype=object),
+        buy_dates=asset.transactions.dates[closed.buy_rows[window]],
+        sell_dates=closed.sell_dates[window],
+        quantities=closed.quantities[window],
+        buy_prices=closed.buy_prices[window],
+        sell_prices=closed.sell_prices[window],
+    )
+
+
+def get_realized_profit(
+    assets: List[PortfolioAsset], from_date: str, to_date: str, method: str = "fifo"
+) -> float:
+    """
+    Calculates the realized profit of the sells within [from_date, to_date].
+
+    Args:
+        assets (List[PortfolioAsset]): List of PortfolioAsset objects containing transactions.
+        from_date (str): First sell date included (YYYY-MM-DD).
+        to_date (str): Last sell date included (YYYY-MM-DD).
+        method (str): Cost-basis method used to match sells against lots.
+
+    Returns:
+        float: Sum of (sell price - buy price) * quantity over the closed lots.
+    """
+    return sum(
+        asset.get_lot_engine(method).closed_lots().realized_profit(from_date, to_date)
+        for asset in assets
     )
-    ticker = asset.ticker
-
-    # Stack to track open buy positions (FIFO)
-    open_positions = []
-    closed_positions: List[ClosedPosition] = []
-
-    for transaction in transactions:
-        if transaction.transaction_type == "buy":
-            # Add to open positions
-            open_positions.append(
-                {
-                    "date": transaction.date,
-                    "quantity": transaction.quantity,
-                    "total_base": transaction.total_base,
-                    "price": (
-                        transaction.total_base / transaction.quantity
-                        if transaction.quantity > 0
-                        else 0
-                    ),
-                }
-            )
-
-        elif transaction.transaction_type == "sell":
-            # Close positions using FIFO
-            remaining_to_sell = transaction.quantity
-            sell_price = (
-                transaction.total_base / transaction.quantity
-                if transaction.quantity > 0
-                else 0
-            )
-
-            while remaining_to_sell > 0 and open_positions:
-                oldest_position = open_positions[0]
-
-                # Determine how much to close from this position
-                quantity_to_close = min(remaining_to_sell, oldest_position["quantity"])
-
-                # Create ClosedPosition object
-                closed_position = ClosedPosition(
-                    ticker=ticker,
-                    buy_price=oldest_position["price"],
-                    quantity=quantity_to_close,
-                    buy_date=oldest_position["date"],
-                    sell_price=sell_price,
-                    sell_date=transaction.date,
-                )
-
-                # Add to closed positions list
-                closed_positions.append(closed_position)
-
-                # Update remaining quantities
-                remaining_to_sell -= quantity_to_close
-                oldest_position["quantity"] -= quantity_to_close
-
-                # Remove position if fully closed
-                if oldest_position["quantity"] == 0:
-                    open_positions.pop(0)
-
-    # Filter closed positions by from_date
-    filtered_closed_positions = [
-        pos for pos in closed_positions if pos.sell_date >= from_date
-    ]
-
-    return filtered_closed_positions
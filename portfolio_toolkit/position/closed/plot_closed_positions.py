@@ -1,45 +1,45 @@
-from collections import defaultdict
-from datetime import datetime
 from typing import List
 
 from portfolio_toolkit.plot.bar_chart_data import BarChartData
 
 from .closed_position import ClosedPosition
+from .closed_position_arrays import ClosedPositionArrays
 
+# Title and x-axis label of the profit chart for each grouping key
+_GROUP_TITLES = {
+    "week": ("Weekly Profit from Closed Positions", "Week"),
+    "month": ("Monthly Profit from Closed Positions", "Month"),
+    "quarter": ("Quarterly Profit from Closed Positions", "Quarter"),
+    "year": ("Yearly Profit from Closed Positions", "Year"),
+    "ticker": ("Profit by Ticker (Closed Positions)", "Ticker"),
+    "sector": ("Profit by Sector (Closed Positions)", "Sector"),
+}
 
-def plot_closed_positions(closed_positions: List[ClosedPosition]) -> BarChartData:
-    """Plot closed positions grouped by month of sale"""
 
-    # Group by month and sum profits
-    monthly_profits = defaultdict(float)
-
-    for pos in closed_positions:
-        # Parse sell_date and extract year-month
-        if isinstance(pos.sell_date, str):
-            # Assuming date format is YYYY-MM-DD
-            sell_date = datetime.strptime(pos.sell_date, "%Y-%m-%d")
-        else:
-            sell_date = pos.sell_date
-
-        # Create month key (YYYY-MM format)
-        month_key = sell_date.strftime("%Y-%m")
-        monthly_profits[month_key] += pos.profit
+def plot_closed_positions(
+    closed_positions: List[ClosedPosition], group_by: str = "month"
+) -> BarChartData:
+    """
+    Plot the profit of closed positions grouped by period of sale (week,
+    month, quarter, year), ticker or sector.
 
-    # Sort months chronologically
-    sorted_months = sorted(monthly_profits.keys())
+    Groups are reduced with a single bincount over the closed position
+    arrays; periods are shown chronologically, tickers and sectors sorted.
+    """
+    profits = ClosedPositionArrays.of(closed_positions).aggregate(group_by)
+    title, xlabel = _GROUP_TITLES[group_by]
 
-    # Prepare data for plotting
-    labels = sorted_months
-    values = [monthly_profits[month] for month in sorted_months]
+    labels = profits.index.tolist()
+    values = profits.tolist()
 
     # Color bars: green for positive profits, red for negative
     colors = ["green" if profit >= 0 else "red" for profit in values]
 
     bar_data = BarChartData(
-        title="Monthly Profit from Closed Positions",
+        title=title,
         labels=labels,
         values=values,
-        xlabel="Month",
+        xlabel=xlabel,
         ylabel="Profit ($)",
         colors=colors,
     )
@@ -52,17 +52,12 @@ def plot_closed_positions_by_ticker(
 ) -> BarChartData:
     """Plot closed positions grouped by ticker"""
 
-    # Group by ticker and sum profits
-    ticker_profits = defaultdict(float)
-
-    for pos in closed_positions:
-        ticker_profits[pos.ticker] += pos.profit
-
     # Sort by profit (descending)
-    sorted_tickers = sorted(ticker_profits.items(), key=lambda x: x[1], reverse=True)
+    profits = ClosedPositionArrays.of(closed_positions).aggregate("ticker")
+    profits = profits.sort_values(ascending=False, kind="stable")
 
-    labels = [ticker for ticker, _ in sorted_tickers]
-    values = [profit for _, profit in sorted_tickers]
+    labels = profits.index.tolist()
+    values = profits.tolist()
 
     # Color bars: green for positive profits, red for negative
     colors = ["green" if profit >= 0 else "red" for profit in values]
@@ -80,34 +75,21 @@ def plot_closed_positions_by_ticker(
 
 
 def plot_closed_positions_count_by_month(
-    closed_positions: List[ClosedPosition],
+    closed_positions: List[ClosedPosition], group_by: str = "month"
 ) -> BarChartData:
-    """Plot count of closed positions by month"""
-
-    # Group by month and count positions
-    monthly_counts = defaultdict(int)
-
-    for pos in closed_positions:
-        # Parse sell_date and extract year-month
-        if isinstance(pos.sell_date, str):
-            sell_date = datetime.strptime(pos.sell_date, "%Y-%m-%d")
-        else:
-            sell_date = pos.sell_date
-
-        month_key = sell_date.strftime("%Y-%m")
-        monthly_counts[month_key] += 1
+    """Plot count of closed positions by month (or any other grouping key)"""
 
-    # Sort months chronologically
-    sorted_months = sorted(monthly_counts.keys())
+    counts = ClosedPositionArrays.of(closed_positions).aggregate(group_by, "count")
+    xlabel = _GROUP_TITLES[group_by][1]
 
-    labels = sorted_months
-    values = [monthly_counts[month] for month in sorted_months]
+    labels = counts.index.tolist()
+    values = counts.tolist()
 
     bar_data = BarChartData(
-        title="Number of Positions Closed by Month",
+        title=f"Number of Positions Closed by {xlabel}",
         labels=labels,
         values=values,
-        xlabel="Month",
+        xlabel=xlabel,
         ylabel="Number of Positions",
         colors=["steelblue"] * len(values),
     )
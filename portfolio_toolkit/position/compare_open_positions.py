@@ -6,6 +6,14 @@ from portfolio_toolkit.portfolio.portfolio import Portfolio
 from portfolio_toolkit.utils.period import Period
 
 
+def _format_quantity(quantity) -> str:
+    """
+    Formats a quantity in full, without the trailing ".0" of whole quantities.
+    """
+    quantity = float(quantity)
+    return str(int(quantity)) if quantity.is_integer() else str(quantity)
+
+
 def _calculate_asset_values_for_display(
     asset: str, periods: List[Period], period_positions: dict
 ) -> List[str]:
@@ -24,7 +32,9 @@ def _calculate_asset_values_for_display(
     for period in periods:
         if asset in period_positions[period.label]:
             position = period_positions[period.label][asset]
-            asset_values.append(f"{position.value:.2f} ({position.quantity})")
+            asset_values.append(
+                f"{position.value:.2f} ({_format_quantity(position.quantity)})"
+            )
         else:
             asset_values.append("-")
     return asset_values
@@ -143,9 +153,9 @@ def compare_open_positions(
     period_positions = {}
     all_assets = set()
 
-    for period in periods:
-        end_date_str = period.end_date.strftime("%Y-%m-%d")
-        positions = portfolio.get_open_positions(end_date_str)
+    # Every period end in a single sweep over each asset's ledger
+    snapshots = portfolio.get_open_positions_at([period.end_date for period in periods])
+    for period, positions in zip(periods, snapshots):
         period_positions[period.label] = {pos.ticker: pos for pos in positions}
         all_assets.update(pos.ticker for pos in positions)
 
@@ -164,10 +174,15 @@ def compare_open_positions(
 
         comparison_data[asset] = asset_values
 
+    # Cash balance at every period end, resolved in one vectorized lookup
+    period_cash = portfolio.account.get_amounts_at(
+        [period.end_date for period in periods]
+    )
+
     # Add CASH row
     cash_values = []
     for i, period in enumerate(periods):
-        cash_amount = portfolio.account.get_amount_at(period.end_date)
+        cash_amount = period_cash[i]
 
         if display == "value":
             cash_values.append(f"{cash_amount:.2f}")
@@ -175,8 +190,7 @@ def compare_open_positions(
             if i == 0:
                 cash_values.append("-")
             else:
-                prev_period = periods[i - 1]
-                prev_cash = portfolio.account.get_amount_at(prev_period.end_date)
+                prev_cash = period_cash[i - 1]
                 if prev_cash > 0:
                     cash_return = ((cash_amount - prev_cash) / prev_cash) * 100
                     cash_values.append(f"{cash_return:.2f}%")
@@ -194,7 +208,7 @@ def compare_open_positions(
             if asset in period_positions[period.label]:
                 portfolio_value += period_positions[period.label][asset].value
 
-        cash_amount = portfolio.account.get_amount_at(period.end_date)
+        cash_amount = period_cash[i]
         total_value = portfolio_value + cash_amount
 
         if display == "value":
@@ -212,7 +226,7 @@ def compare_open_positions(
                             asset
                         ].value
 
-                prev_cash = portfolio.account.get_amount_at(prev_period.end_date)
+                prev_cash = period_cash[i - 1]
                 prev_total = prev_portfolio_value + prev_cash
 
                 if prev_total > 0:
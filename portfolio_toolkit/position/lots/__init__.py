@@ -0,0 +1,25 @@
+from .engine import ClosedLots, LotEngine, LotSnapshot
+from .methods import (
+    COST_BASIS_METHODS,
+    AverageBook,
+    FifoBook,
+    HifoBook,
+    LifoBook,
+    Lot,
+    LotBook,
+    SpecificLotBook,
+)
+
+__all__ = [
+    "COST_BASIS_METHODS",
+    "Lot",
+    "LotBook",
+    "FifoBook",
+    "LifoBook",
+    "HifoBook",
+    "AverageBook",
+    "SpecificLotBook",
+    "LotEngine",
+    "LotSnapshot",
+    "ClosedLots",
+]
@@ -0,0 +1,455 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from portfolio_toolkit.asset.portfolio.transaction_table import (
+    ASSET_TRANSACTION_TYPES,
+    SPLIT,
+    TransactionTable,
+)
+from portfolio_toolkit.utils.dates import to_datetime64, to_datetime64_array
+
+from .methods import Lot, LotBook, get_lot_book_class
+
+SELL = ASSET_TRANSACTION_TYPES.index("sell")
+# Transaction types that open lots / take quantity out of them
+OPEN_CODES = (
+    ASSET_TRANSACTION_TYPES.index("buy"),
+    ASSET_TRANSACTION_TYPES.index("deposit"),
+)
+CLOSE_CODES = (SELL, ASSET_TRANSACTION_TYPES.index("withdrawal"))
+
+# Default spacing of checkpoints, in transactions
+CHECKPOINT_EVERY = 256
+
+
+@dataclass(frozen=True)
+class LotSnapshot:
+    """
+    Immutable copy of a LotEngine's state, taken after ``next_row`` transactions.
+    """
+
+    next_row: int
+    lots: Tuple[Tuple[int, float, float], ...]
+    closed_count: int
+
+
+@dataclass
+class ClosedLots:
+    """
+    Lots closed by sell transactions, as parallel arrays in sell order.
+
+    Attributes:
+        buy_rows (np.ndarray): Table position of the buy that opened each lot.
+        sell_rows (np.ndarray): Table position of the sell that closed it.
+        quantities (np.ndarray): Quantity closed.
+        buy_prices (np.ndarray): Unit cost of the lot.
+        sell_prices (np.ndarray): Unit price of the sell.
+        sell_dates (np.ndarray): Sell dates (datetime64[D]), sorted ascending.
+    """
+
+    buy_rows: np.ndarray
+    sell_rows: np.ndarray
+    quantities: np.ndarray
+    buy_prices: np.ndarray
+    sell_prices: np.ndarray
+    sell_dates: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.sell_rows)
+
+    def between(self, from_date=None, to_date=None) -> slice:
+        """
+        Returns the lots sold within [from_date, to_date], found by binary search.
+        """
+        dates = self.sell_dates
+        start = (
+            0
+            if from_date is None
+            else int(np.searchsorted(dates, to_datetime64(from_date), side="left"))
+        )
+        stop = (
+            len(dates)
+            if to_date is None
+            else int(np.searchsorted(dates, to_datetime64(to_date), side="right"))
+        )
+        return slice(start, max(start, stop))
+
+    def realized_profit(self, from_date=None, to_date=None) -> float:
+        """
+        Returns the realized profit of the lots sold within [from_date, to_date].
+        """
+        window = self.between(from_date, to_date)
+        return float(
+            np.sum(
+                (self.sell_prices[window] - self.buy_prices[window])
+                * self.quantities[window]
+            )
+        )
+
+
+class LotEngine:
+    """
+    Replays an asset's transactions, matching sells against open lots.
+
+    The order in which lots are consumed is given by the cost-basis method
+    ("fifo", "lifo", "hifo", "average" or "specific", see COST_BASIS_METHODS).
+    Open and closed positions both come from this one replay, so they always
+    agree. Buys and deposits open lots; sells close them and record closed
+    lots, withdrawals remove quantity without realizing a profit. Splits
+    adjust the open lots in place (see ``_split``).
+
+    The engine can be advanced in steps, snapshotted and resumed, so queries for
+    different windows share one replay instead of starting from scratch.
+
+    While replaying, it keeps checkpoints (snapshots taken every
+    ``checkpoint_every`` transactions, or at each month boundary with "M").
+    When the table is edited, ``sync`` rewinds to the last checkpoint before
+    the first changed row and replays from there only, and ``at`` answers
+    as-of queries from the nearest checkpoint.
+    """
+
+    def __init__(
+        self,
+        table: TransactionTable,
+        method: str = "fifo",
+        checkpoint_every: Union[int, str] = CHECKPOINT_EVERY,
+    ):
+        if checkpoint_every != "M" and (
+            not isinstance(checkpoint_every, int) or checkpoint_every <= 0
+        ):
+            raise ValueError(
+                "checkpoint_every must be a positive number of transactions "
+                f"or 'M', got {checkpoint_every!r}"
+            )
+        self.table = table
+        self.method = method
+        self.checkpoint_every = checkpoint_every
+        # Table version the replay was made against; rows may move when it changes
+        self.table_version = table.version
+        self._book_class = get_lot_book_class(method)
+        self.lots: LotBook = self._book_class()
+        self.next_row = 0
+        self.quantity = 0.0
+        self.cost = 0.0
+
+        # Closed lots and per-row states recorded by this engine; the offsets
+        # count what was replayed before it was restored from a snapshot
+        self._closed: List[Tuple[int, int, float, float, float]] = []
+        self._closed_offset = 0
+        self._state_quantities: List[float] = []
+        self._state_costs: List[float] = []
+        self._states_start = 0
+        self._closed_arrays: Optional[ClosedLots] = None
+        self._state_arrays: Optional[Tuple[int, np.ndarray, np.ndarray]] = None
+
+        # Checkpoints in replay order, and their next_row for binary search
+        self.checkpoints: List[LotSnapshot] = []
+        self._checkpoint_rows: List[int] = []
+        # Transactions replayed since the engine was created
+        self.replayed_rows = 0
+        # (row, cash for fractional shares) of each split replayed
+        self._split_adjustments: List[Tuple[int, float]] = []
+
+    @classmethod
+    def resume(
+        cls,
+        table: TransactionTable,
+        snapshot: LotSnapshot,
+        method: str = "fifo",
+        checkpoint_every: Union[int, str] = CHECKPOINT_EVERY,
+    ) -> "LotEngine":
+        """
+        Creates an engine in the state captured by ``snapshot``.
+        """
+        engine = cls(table, method, checkpoint_every)
+        engine.restore(snapshot)
+        return engine
+
+    def snapshot(self) -> LotSnapshot:
+        """
+        Captures the current state (open lots and replay position).
+        """
+        return LotSnapshot(
+            next_row=self.next_row,
+            lots=tuple((lot.row, lot.quantity, lot.price) for lot in self.lots),
+            closed_count=self._closed_offset + len(self._closed),
+        )
+
+    def restore(self, snapshot: LotSnapshot):
+        """
+        Puts the engine in the state captured by ``snapshot``.
+
+        When rewinding, what was recorded after the snapshot is discarded. An
+        engine restored from a snapshot of another engine only records closed
+        lots and position states from that point on.
+        """
+        self.lots = self._book_class.from_lots([Lot(*lot) for lot in snapshot.lots])
+        self.quantity = sum(lot.quantity for lot in self.lots)
+        self.cost = sum(lot.quantity * lot.price for lot in self.lots)
+        self.next_row = snapshot.next_row
+
+        kept = snapshot.closed_count - self._closed_offset
+        if 0 <= kept <= len(self._closed):
+            del self._closed[kept:]
+        else:
+            self._closed = []
+            self._closed_offset = snapshot.closed_count
+
+        kept = snapshot.next_row - self._states_start
+        if 0 <= kept <= len(self._state_quantities):
+            del self._state_quantities[kept:]
+            del self._state_costs[kept:]
+        else:
+            self._state_quantities = []
+            self._state_costs = []
+            self._states_start = snapshot.next_row
+
+        adjustments = self._split_adjustments
+        while adjustments and adjustments[-1][0] >= snapshot.next_row:
+            adjustments.pop()
+
+        kept = bisect_right(self._checkpoint_rows, snapshot.next_row)
+        del self.checkpoints[kept:]
+        del self._checkpoint_rows[kept:]
+
+        self._closed_arrays = None
+        self._state_arrays = None
+
+    def sync(self) -> "LotEngine":
+        """
+        Brings the replay up to date with the table after it was edited.
+
+        Only what follows the first changed row is replayed again: the engine
+        rewinds to the last checkpoint before that row, or to the start if
+        there is none, then advances through the whole table.
+
+        Returns:
+            LotEngine: The engine itself.
+        """
+        table = self.table
+        changed = table.changed_since(self.table_version)
+        self.table_version = table.version
+        if changed is not None and changed < self.next_row:
+            kept = bisect_right(self._checkpoint_rows, changed)
+            self.restore(
+                self.checkpoints[kept - 1]
+                if kept
+                else LotSnapshot(next_row=0, lots=(), closed_count=0)
+            )
+        return self.advance()
+
+    def at(self, date) -> "LotEngine":
+        """
+        Returns a new engine replayed through the transactions dated on or
+        before ``date``, started from the nearest checkpoint.
+
+        This engine is not modified, apart from being synced with the table.
+        The returned engine only records closed lots and position states
+        after its starting checkpoint.
+        """
+        self.sync()
+        stop = self.table.count_until(date)
+        kept = bisect_right(self._checkpoint_rows, stop)
+        start = (
+            self.checkpoints[kept - 1]
+            if kept
+            else LotSnapshot(next_row=0, lots=(), closed_count=0)
+        )
+        engine = type(self).resume(
+            self.table, start, self.method, self.checkpoint_every
+        )
+        return engine.advance(date)
+
+    def _checkpoint_rows_between(self, start: int, stop: int) -> List[int]:
+        """
+        Returns the rows in [start, stop) before which a checkpoint is due.
+        """
+        first = max(start, 1)
+        if first >= stop:
+            return []
+        every = self.checkpoint_every
+        if every == "M":
+            months = self.table.dates[first - 1 : stop].astype("datetime64[M]")
+            rows = (np.nonzero(months[1:] != months[:-1])[0] + first).tolist()
+        else:
+            rows = list(range(-(-first // every) * every, stop, every))
+        last = self._checkpoint_rows[-1] if self._checkpoint_rows else 0
+        return [row for row in rows if row > last]
+
+    def advance(self, to_date=None) -> "LotEngine":
+        """
+        Replays the pending transactions dated on or before ``to_date``.
+
+        Args:
+            to_date (optional): Last date to replay. Replays everything if None.
+
+        Returns:
+            LotEngine: The engine itself.
+        """
+        table = self.table
+        stop = len(table) if to_date is None else table.count_until(to_date)
+        if stop <= self.next_row:
+            return self
+
+        start = self.next_row
+        types = table.types[start:stop].tolist()
+        quantities = table.quantities[start:stop].tolist()
+        totals_base = table.totals_base[start:stop].tolist()
+        selections = (
+            table.column("lots")[start:stop].tolist()
+            if self.method == "specific"
+            else None
+        )
+        state_quantities = self._state_quantities
+        state_costs = self._state_costs
+        due = self._checkpoint_rows_between(start, stop)
+        due.append(stop)
+        next_due = 0
+
+        for i, (code, quantity, total_base) in enumerate(
+            zip(types, quantities, totals_base)
+        ):
+            row = start + i
+            if row == due[next_due]:
+                self.next_row = row
+                self.checkpoints.append(self.snapshot())
+                self._checkpoint_rows.append(row)
+                next_due += 1
+            price = total_base / quantity if quantity > 0 else 0
+            if code in OPEN_CODES:
+                self.lots.add(Lot(row, quantity, price))
+                self.quantity += quantity
+                self.cost += quantity * price
+            elif code in CLOSE_CODES:
+                if selections is not None and selections[i]:
+                    self.lots.prefer(self._selected_rows(row, selections[i]))
+                self._consume(row, quantity, price, record=code == SELL)
+                self.lots.prefer(None)
+            elif code == SPLIT:
+                self._split(row, quantity)
+            state_quantities.append(self.quantity)
+            state_costs.append(self.cost)
+
+        self.replayed_rows += stop - start
+        self.next_row = stop
+        return self
+
+    def _selected_rows(self, row: int, buy_dates) -> List[int]:
+        """
+        Returns the rows of the buys dated ``buy_dates`` before ``row``.
+        """
+        dates = self.table.dates[:row]
+        wanted = to_datetime64_array(buy_dates)
+        candidates = np.nonzero(np.isin(dates, wanted))[0]
+        order = {date: i for i, date in enumerate(wanted.tolist())}
+        return sorted(
+            candidates.tolist(),
+            key=lambda candidate: order[dates[candidate].astype(object)],
+        )
+
+    def _consume(self, row: int, quantity: float, price: float, record: bool):
+        lots = self.lots
+        closed = self._closed
+        remaining = quantity
+        while remaining > 0 and lots:
+            lot = lots.next_lot()
+            closed_quantity = min(remaining, lot.quantity)
+            if record:
+                closed.append((lot.row, row, closed_quantity, lot.price, price))
+            remaining -= closed_quantity
+            lot.quantity -= closed_quantity
+            self.quantity -= closed_quantity
+            self.cost -= closed_quantity * lot.price
+            if lot.quantity == 0:
+                lots.remove_next()
+
+        if not lots:
+            # Avoid carrying rounding residue once the position is closed
+            self.quantity = 0.0
+            self.cost = 0.0
+
+    def _split(self, row: int, factor: float):
+        """
+        Applies a stock split: every open lot keeps its buy row, its quantity
+        is multiplied and its unit cost divided by ``factor``. Only whole
+        shares are kept; the fraction is taken from the lots in the method's
+        order and its cost reported by ``split_adjustments`` as cash.
+        """
+        if not self.lots:
+            self._split_adjustments.append((row, 0.0))
+            return
+
+        self.lots.rescale(factor)
+        self.quantity *= factor
+
+        fraction = self.quantity - int(self.quantity)
+        cost = self.cost
+        if fraction > 0:
+            self._consume(row, fraction, 0.0, record=False)
+        self._split_adjustments.append((row, cost - self.cost))
+
+    def split_adjustments(self) -> List[Tuple[int, float]]:
+        """
+        Returns the row of every split replayed so far, with the cash (in base
+        currency, at cost) paid for the fractional shares it removed.
+        """
+        return list(self._split_adjustments)
+
+    def open_lots(self) -> List[Lot]:
+        """
+        Returns the lots still open, in the order the method would sell them
+        for FIFO/LIFO/specific, or in heap order for HIFO.
+        """
+        return self.lots.lots()
+
+    def open_quantity_and_cost(self) -> Tuple[float, float]:
+        """
+        Returns the total quantity and cost of the open lots.
+        """
+        return self.quantity, self.cost
+
+    def position_states(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        """
+        Returns the open quantity and cost after each replayed transaction.
+
+        Returns:
+            Tuple[int, np.ndarray, np.ndarray]: The first row covered, then the
+            quantities and costs after that row and each following one.
+        """
+        cached = self._state_arrays
+        if cached is None or len(cached[1]) != len(self._state_quantities):
+            cached = self._state_arrays = (
+                self._states_start,
+                np.array(self._state_quantities, dtype="float64"),
+                np.array(self._state_costs, dtype="float64"),
+            )
+        return cached
+
+    def closed_lots(self) -> ClosedLots:
+        """
+        Returns the lots closed so far as parallel arrays.
+        """
+        cached = self._closed_arrays
+        if cached is not None and len(cached) == len(self._closed):
+            return cached
+
+        if self._closed:
+            buy_rows, sell_rows, quantities, buy_prices, sell_prices = map(
+                np.array, zip(*self._closed)
+            )
+        else:
+            buy_rows = sell_rows = np.empty(0, dtype="int64")
+            quantities = buy_prices = sell_prices = np.empty(0, dtype="float64")
+
+        self._closed_arrays = ClosedLots(
+            buy_rows=buy_rows,
+            sell_rows=sell_rows,
+            quantities=quantities.astype("float64"),
+            buy_prices=buy_prices.astype("float64"),
+            sell_prices=sell_prices.astype("float64"),
+            sell_dates=self.table.dates[sell_rows],
+        )
+        return self._closed_arrays
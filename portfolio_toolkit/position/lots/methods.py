@@ -0,0 +1,284 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence, Type
+
+
+class Lot:
+    """
+    Quantity still open from one buy transaction.
+
+    Attributes:
+        row (int): Position of the buy transaction in the asset's table.
+        quantity (float): Quantity not sold yet.
+        price (float): Unit cost in base currency.
+    """
+
+    __slots__ = ("row", "quantity", "price")
+
+    def __init__(self, row: int, quantity: float, price: float):
+        self.row = row
+        self.quantity = quantity
+        self.price = price
+
+    def __repr__(self):
+        return f"Lot(row={self.row}, quantity={self.quantity}, price={self.price})"
+
+
+class LotBook(ABC):
+    """
+    Open lots of one asset, ordered by the cost-basis method.
+
+    Sells consume ``next_lot()`` repeatedly; the engine calls ``remove_next()``
+    once that lot is fully consumed. ``lots()`` lists the open lots in the
+    book's internal order, which ``from_lots`` restores as-is.
+    """
+
+    @abstractmethod
+    def add(self, lot: Lot):
+        """
+        Adds a lot opened by a buy.
+        """
+        pass
+
+    @abstractmethod
+    def next_lot(self) -> Lot:
+        """
+        Returns the lot the next sell consumes, without removing it.
+        """
+        pass
+
+    @abstractmethod
+    def remove_next(self):
+        """
+        Removes the lot returned by ``next_lot`` once it is fully consumed.
+        """
+        pass
+
+    @abstractmethod
+    def lots(self) -> List[Lot]:
+        """
+        Returns the open lots in the book's internal order.
+        """
+        pass
+
+    def rescale(self, factor: float):
+        """
+        Applies a split to every open lot: quantities are multiplied and unit
+        costs divided by ``factor``. Books ordered by cost re-key their lots.
+        """
+        for lot in self.lots():
+            lot.quantity *= factor
+            lot.price /= factor
+
+    def prefer(self, rows: Optional[Sequence[int]]):
+        """
+        Asks the book to consume the lots opened at ``rows`` first, for the
+        current sell. Only the specific-lot method honours it.
+        """
+
+    def __len__(self) -> int:
+        return len(self.lots())
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Lot]:
+        return iter(self.lots())
+
+    @classmethod
+    def from_lots(cls, lots: Sequence[Lot]) -> "LotBook":
+        book = cls()
+        for lot in lots:
+            book.add(lot)
+        return book
+
+
+class FifoBook(LotBook):
+    """First in, first out: a deque, oldest lot at the left."""
+
+    def __init__(self):
+        self._lots = deque()
+
+    def add(self, lot: Lot):
+        self._lots.append(lot)
+
+    def next_lot(self) -> Lot:
+        return self._lots[0]
+
+    def remove_next(self):
+        self._lots.popleft()
+
+    def lots(self) -> List[Lot]:
+        return list(self._lots)
+
+    def __len__(self) -> int:
+        return len(self._lots)
+
+
+class LifoBook(LotBook):
+    """Last in, first out: a stack, newest lot on top."""
+
+    def __init__(self):
+        self._lots: List[Lot] = []
+
+    def add(self, lot: Lot):
+        self._lots.append(lot)
+
+    def next_lot(self) -> Lot:
+        return self._lots[-1]
+
+    def remove_next(self):
+        self._lots.pop()
+
+    def lots(self) -> List[Lot]:
+        return list(self._lots)
+
+    def __len__(self) -> int:
+        return len(self._lots)
+
+
+class HifoBook(LotBook):
+    """
+    Highest in, first out: a heap keyed by unit cost (oldest lot first on
+    ties), so each sale is O(log n) whatever the number of lots.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+
+    def add(self, lot: Lot):
+        heapq.heappush(self._heap, (-lot.price, lot.row, lot))
+
+    def next_lot(self) -> Lot:
+        return self._heap[0][2]
+
+    def remove_next(self):
+        heapq.heappop(self._heap)
+
+    def lots(self) -> List[Lot]:
+        return [entry[2] for entry in self._heap]
+
+    def rescale(self, factor: float):
+        super().rescale(factor)
+        # The heap keys hold the old unit costs
+        self._heap = [(-lot.price, lot.row, lot) for _, _, lot in self._heap]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @classmethod
+    def from_lots(cls, lots: Sequence[Lot]) -> "HifoBook":
+        book = cls()
+        book._heap = [(-lot.price, lot.row, lot) for lot in lots]
+        heapq.heapify(book._heap)
+        return book
+
+
+class AverageBook(LotBook):
+    """
+    Average cost: all open quantity is pooled into one lot whose price is the
+    weighted average cost. The pool keeps the row of its first buy.
+    """
+
+    def __init__(self):
+        self._pool: Optional[Lot] = None
+
+    def add(self, lot: Lot):
+        pool = self._pool
+        if pool is None:
+            self._pool = lot
+            return
+        quantity = pool.quantity + lot.quantity
+        if quantity > 0:
+            pool.price = (
+                pool.quantity * pool.price + lot.quantity * lot.price
+            ) / quantity
+        pool.quantity = quantity
+
+    def next_lot(self) -> Lot:
+        return self._pool
+
+    def remove_next(self):
+        self._pool = None
+
+    def lots(self) -> List[Lot]:
+        return [] if self._pool is None else [self._pool]
+
+    def __len__(self) -> int:
+        return 0 if self._pool is None else 1
+
+
+class SpecificLotBook(LotBook):
+    """
+    Specific identification: a sell consumes the lots it names (by the buy
+    rows passed to ``prefer``) first, then falls back to FIFO.
+
+    Lots consumed out of order are removed lazily from the FIFO queue.
+    """
+
+    def __init__(self):
+        self._queue = deque()
+        self._size = 0
+        self._preferred: List[Lot] = []
+
+    def add(self, lot: Lot):
+        self._queue.append(lot)
+        self._size += 1
+
+    def prefer(self, rows: Optional[Sequence[int]]):
+        if not rows:
+            self._preferred = []
+            return
+        order = {row: i for i, row in enumerate(rows)}
+        self._preferred = sorted(
+            (lot for lot in self._queue if lot.row in order and lot.quantity > 0),
+            key=lambda lot: order[lot.row],
+        )
+
+    def _drop_closed(self):
+        while self._queue and self._queue[0].quantity <= 0:
+            self._queue.popleft()
+        while self._preferred and self._preferred[0].quantity <= 0:
+            self._preferred.pop(0)
+
+    def next_lot(self) -> Lot:
+        self._drop_closed()
+        return self._preferred[0] if self._preferred else self._queue[0]
+
+    def remove_next(self):
+        # The engine only removes a lot once it is fully consumed
+        self._size -= 1
+        self._drop_closed()
+
+    def lots(self) -> List[Lot]:
+        return [lot for lot in self._queue if lot.quantity > 0]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+COST_BASIS_METHODS: Dict[str, Type[LotBook]] = {
+    "fifo": FifoBook,
+    "lifo": LifoBook,
+    "hifo": HifoBook,
+    "average": AverageBook,
+    "specific": SpecificLotBook,
+}
+
+
+def get_lot_book_class(method: str) -> Type[LotBook]:
+    """
+    Returns the LotBook class implementing a cost-basis method.
+
+    Raises:
+        ValueError: If the method is not one of COST_BASIS_METHODS.
+    """
+    try:
+        return COST_BASIS_METHODS[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown cost basis method: {method}. "
+            f"Expected one of {', '.join(COST_BASIS_METHODS)}"
+        ) from None
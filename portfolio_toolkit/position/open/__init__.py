@@ -1,4 +1,5 @@
 from .open_position import OpenPosition
+from .open_position_arrays import OpenPositionArrays
 from .open_position_list import OpenPositionList
 
-__all__ = ["OpenPosition", "OpenPositionList"]
+__all__ = ["OpenPosition", "OpenPositionArrays", "OpenPositionList"]
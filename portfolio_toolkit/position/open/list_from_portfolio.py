@@ -1,45 +1,87 @@
-from datetime import datetime
-from typing import List
+from typing import Iterable, List, Tuple
+
+import numpy as np
 
 from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.utils.dates import to_datetime64_array
 
 from .open_position import OpenPosition
+from .open_position_arrays import OpenPositionArrays
 from .open_position_list import OpenPositionList
 
 
-def get_open_positions(assets: List[PortfolioAsset], date: str) -> OpenPositionList:
+def get_open_positions(
+    assets: List[PortfolioAsset], date: str, method: str = "fifo"
+) -> OpenPositionList:
     """
     Gets the open positions of a portfolio as of a given date and returns them as an OpenPositionList.
 
     Args:
         assets (List[PortfolioAsset]): List of PortfolioAsset objects containing transactions.
         date (str): The date up to which the positions are calculated (YYYY-MM-DD).
+        method (str): Cost-basis method used to match sells against lots.
 
     Returns:
         OpenPositionList: A list-like object representing open positions.
     """
-    positions: List[OpenPosition] = []
-
-    for asset in assets:
-        ticker = asset.ticker
-        position = get_asset_open_positions(asset, date)
-
-        if position.quantity != 0:  # Only include positions with non-zero quantity
-            open_position = OpenPosition(
-                ticker=ticker,
-                sector=asset.sector,
-                country=asset.country,
-                buy_price=position.buy_price,
-                quantity=position.quantity,
-                current_price=position.current_price,
-            )
-            positions.append(open_position)
+    return get_open_positions_at(assets, [date], method)[0]
+
+
+def get_open_positions_at(
+    assets: List[PortfolioAsset], dates: Iterable, method: str = "fifo"
+) -> List[OpenPositionList]:
+    """
+    Gets the open positions of a portfolio on several dates in one pass.
+
+    Each asset's transactions are replayed once and every date is resolved by
+    binary search, so many snapshots cost about the same as a single one.
+
+    Args:
+        assets (List[PortfolioAsset]): List of PortfolioAsset objects containing transactions.
+        dates (Iterable): Snapshot dates (YYYY-MM-DD strings or date objects), in any order.
+        method (str): Cost-basis method used to match sells against lots.
 
-    return OpenPositionList(positions)
+    Returns:
+        List[OpenPositionList]: One OpenPositionList per date, in the same order.
+    """
+    dates = to_datetime64_array(dates)
+    assets = list(assets)
+
+    # One row per asset, one column per date
+    shape = (len(assets), len(dates))
+    quantities = np.zeros(shape)
+    costs = np.zeros(shape)
+    prices = np.zeros(shape)
+    for i, asset in enumerate(assets):
+        quantities[i], costs[i], prices[i] = get_asset_position_states(
+            asset, dates, method
+        )
+
+    tickers = np.array([asset.ticker for asset in assets], dtype=object)
+    sectors = np.array([asset.sector for asset in assets], dtype=object)
+    countries = np.array([asset.country for asset in assets], dtype=object)
+
+    snapshots = []
+    for j in range(len(dates)):
+        # Only include positions with non-zero quantity
+        held = np.nonzero(quantities[:, j] != 0)[0]
+        snapshots.append(
+            OpenPositionList.from_arrays(
+                _open_position_arrays(
+                    tickers[held],
+                    sectors[held],
+                    countries[held],
+                    quantities[held, j],
+                    costs[held, j],
+                    prices[held, j],
+                )
+            )
+        )
+    return snapshots
 
 
-def get_asset_open_positions(  # noqa: C901
-    asset: PortfolioAsset, date: str
+def get_asset_open_positions(
+    asset: PortfolioAsset, date: str, method: str = "fifo"
 ) -> OpenPosition:
     """
     Computes the open position of an asset as of a given date.
@@ -47,66 +89,84 @@ def get_asset_open_positions(  # noqa: C901
     Args:
         asset (PortfolioAsset): The asset containing transactions.
         date (str): The date up to which the position is calculated (YYYY-MM-DD).
+        method (str): Cost-basis method used to match sells against lots.
 
     Returns:
         ValuedPosition: An object representing the open position with valuation.
     """
+    return get_asset_open_positions_at(asset, [date], method)[0]
+
+
+def get_asset_open_positions_at(
+    asset: PortfolioAsset, dates: Iterable, method: str = "fifo"
+) -> List[OpenPosition]:
+    """
+    Computes the open position of an asset on several dates.
+
+    Args:
+        asset (PortfolioAsset): The asset containing transactions.
+        dates (Iterable): Dates on which the position is calculated.
+        method (str): Cost-basis method used to match sells against lots.
 
-    transactions = sorted(
-        [tx for tx in asset.transactions if tx.date <= date],
-        key=lambda x: x.date,
+    Returns:
+        List[OpenPosition]: One position per date, in the same order.
+    """
+    dates = to_datetime64_array(dates)
+    quantities, costs, prices = get_asset_position_states(asset, dates, method)
+    arrays = _open_position_arrays(
+        np.full(len(dates), asset.ticker, dtype=object),
+        np.full(len(dates), asset.sector, dtype=object),
+        np.full(len(dates), asset.country, dtype=object),
+        quantities,
+        costs,
+        prices,
     )
+    return [arrays.row(i) for i in range(len(arrays))]
+
 
-    quantity = 0
-    cost = 0
-
-    for tx in transactions:
-        if tx.transaction_type == "buy" or tx.transaction_type == "deposit":
-            quantity += tx.quantity
-            cost += tx.total_base
-        elif tx.transaction_type == "sell" or tx.transaction_type == "withdrawal":
-            quantity_to_deduct = min(quantity, tx.quantity)
-            average_price = cost / quantity if quantity > 0 else 0
-            cost -= quantity_to_deduct * average_price
-            quantity -= quantity_to_deduct
-
-    average_price = cost / quantity if quantity > 0 else 0
-
-    # Calculate market value if asset has price data
-    current_price = 0
-
-    if quantity > 0 and asset.prices is not None:
-        try:
-            # Convert date string to datetime for price lookup
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
-            prices_series = asset.prices
-
-            # Find the closest available price date (on or before target date)
-            available_dates = [
-                d.date() for d in prices_series.index if d.date() <= target_date
-            ]
-
-            if available_dates:
-                closest_date = max(available_dates)
-                # Find the corresponding datetime index
-                matching_datetime = None
-                for dt in prices_series.index:
-                    if dt.date() == closest_date:
-                        matching_datetime = dt
-                        break
-
-                if matching_datetime is not None:
-                    current_price = float(prices_series.loc[matching_datetime])
-        except (ValueError, KeyError, IndexError, TypeError):
-            # If there's any error getting the price, current_price remains 0
-            pass
-
-    # Create and return a OpenPosition object
-    return OpenPosition(
-        ticker=asset.ticker,
-        sector=asset.sector,
-        country=asset.country,
-        buy_price=average_price,
-        quantity=quantity,
-        current_price=current_price,
+def get_asset_position_states(
+    asset: PortfolioAsset, dates: Iterable, method: str = "fifo"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the open quantity, total cost and price of an asset on each date.
+
+    Args:
+        asset (PortfolioAsset): The asset containing transactions.
+        dates (Iterable): Dates on which the position is calculated.
+        method (str): Cost-basis method used to match sells against lots.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Quantities, costs and
+        prices (0 where no price is known or nothing is held), one entry
+        per date.
+    """
+    dates = to_datetime64_array(dates)
+    table = asset.transactions
+
+    # Open quantity and cost after each transaction, with the empty state first
+    _, held, costs = asset.get_lot_engine(method).position_states()
+    held = np.concatenate(([0.0], held))
+    costs = np.concatenate(([0.0], costs))
+    counts = np.searchsorted(table.dates, dates, side="right")
+    quantities = held[counts]
+
+    # Prices are only needed (and fetched) on the dates something is held
+    prices = np.zeros(len(dates))
+    open_ = quantities != 0
+    if open_.any():
+        prices[open_] = asset.get_prices_at(dates[open_], default=0.0)
+    return quantities, costs[counts], prices
+
+
+def _open_position_arrays(
+    tickers, sectors, countries, quantities, costs, prices
+) -> OpenPositionArrays:
+    open_ = quantities > 0
+    return OpenPositionArrays(
+        tickers=tickers,
+        sectors=sectors,
+        countries=countries,
+        buy_prices=np.divide(costs, quantities, out=np.zeros_like(costs), where=open_),
+        quantities=quantities,
+        current_prices=np.where(open_, prices, 0.0),
     )
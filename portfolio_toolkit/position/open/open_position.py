@@ -1,12 +1,14 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List
 
 import pandas as pd
 
+from portfolio_toolkit.utils.slots import slotted_dataclass
+
 from ..position import Position
 
 
-@dataclass
+@slotted_dataclass
 class OpenPosition(Position):
     current_price: float
     sector: str
@@ -14,7 +16,7 @@ class OpenPosition(Position):
     value: float = field(init=False)
 
     def __post_init__(self):
-        super().__post_init__()  # Calcula cost
+        Position.__post_init__(self)  # Calcula cost
         self.value = self.current_price * self.quantity
 
     @classmethod
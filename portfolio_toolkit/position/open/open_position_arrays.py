@@ -0,0 +1,86 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .open_position import OpenPosition
+
+
+@dataclass(eq=False)
+class OpenPositionArrays:
+    """
+    Columnar view of open positions: one numpy array per field.
+
+    Attributes:
+        tickers, sectors, countries (np.ndarray): Asset descriptors (object).
+        buy_prices (np.ndarray): Average unit cost.
+        quantities (np.ndarray): Open quantity.
+        current_prices (np.ndarray): Unit price on the position date.
+        costs, values (np.ndarray): Derived like the OpenPosition fields.
+    """
+
+    tickers: np.ndarray
+    sectors: np.ndarray
+    countries: np.ndarray
+    buy_prices: np.ndarray
+    quantities: np.ndarray
+    current_prices: np.ndarray
+    costs: np.ndarray = field(init=False)
+    values: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        self.costs = self.buy_prices * self.quantities
+        self.values = self.current_prices * self.quantities
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[OpenPosition]) -> "OpenPositionArrays":
+        """
+        Builds the arrays in a single pass over OpenPosition objects.
+        """
+        positions = list(positions)
+        return cls(
+            tickers=np.array([p.ticker for p in positions], dtype=object),
+            sectors=np.array([p.sector for p in positions], dtype=object),
+            countries=np.array([p.country for p in positions], dtype=object),
+            buy_prices=np.array([p.buy_price for p in positions], dtype="float64"),
+            quantities=np.array([p.quantity for p in positions], dtype="float64"),
+            current_prices=np.array(
+                [p.current_price for p in positions], dtype="float64"
+            ),
+        )
+
+    def row(self, i: int) -> OpenPosition:
+        """
+        Builds the OpenPosition object of one row.
+        """
+        return OpenPosition(
+            ticker=self.tickers[i],
+            buy_price=self.buy_prices[i].item(),
+            quantity=self.quantities[i].item(),
+            current_price=self.current_prices[i].item(),
+            sector=self.sectors[i],
+            country=self.countries[i],
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the columns of OpenPosition.to_dataframe, built column-wise.
+        """
+        if not len(self):
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {
+                "ticker": self.tickers,
+                "buy_price": self.buy_prices,
+                "quantity": self.quantities,
+                "cost": self.costs,
+                "current_price": self.current_prices,
+                "value": self.values,
+                "sector": self.sectors,
+                "country": self.countries,
+            }
+        )
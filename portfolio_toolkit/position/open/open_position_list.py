@@ -1,36 +1,44 @@
-from typing import Iterator, List
+from typing import Iterable, List
 
 import pandas as pd
 
 from portfolio_toolkit.asset import PortfolioAsset
 from portfolio_toolkit.plot.pie_chart_data import PieChartData
 
+from ..array_backed_list import ArrayBackedList
 from .open_position import OpenPosition
+from .open_position_arrays import OpenPositionArrays
 
 
-class OpenPositionList:
-    def __init__(self, positions: List[OpenPosition]):
-        self.positions = positions
+class OpenPositionList(ArrayBackedList):
+    """
+    List of open positions, possibly backed by an OpenPositionArrays
+    (see ArrayBackedList).
+    """
 
-    def __iter__(self) -> Iterator[OpenPosition]:
-        return iter(self.positions)
-
-    def __len__(self) -> int:
-        return len(self.positions)
-
-    def __getitem__(self, idx):
-        return self.positions[idx]
+    ARRAYS_CLASS = OpenPositionArrays
 
     @classmethod
     def from_portfolio(
-        cls, portfolio: List[PortfolioAsset], date: str
+        cls, portfolio: List[PortfolioAsset], date: str, method: str = "fifo"
     ) -> "OpenPositionList":
         """
         Create OpenPositionList from a portfolio.
         """
         from .list_from_portfolio import get_open_positions
 
-        return get_open_positions(portfolio, date)
+        return get_open_positions(portfolio, date, method)
+
+    @classmethod
+    def from_portfolio_at(
+        cls, portfolio: List[PortfolioAsset], dates: Iterable, method: str = "fifo"
+    ) -> List["OpenPositionList"]:
+        """
+        Create one OpenPositionList per date, replaying each asset only once.
+        """
+        from .list_from_portfolio import get_open_positions_at
+
+        return get_open_positions_at(portfolio, dates, method)
 
     def get_pie_chart_data(self, group_by: str = "Ticker") -> PieChartData:
         from .pie_chart_data import get_pie_chart_data
@@ -43,4 +51,6 @@ class OpenPositionList:
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to a pandas DataFrame."""
+        if self._positions is None:
+            return self._arrays.to_dataframe()
         return OpenPosition.to_dataframe(self.positions)
@@ -1,10 +1,12 @@
-from dataclasses import dataclass, field
+from dataclasses import field
 from typing import List
 
 import pandas as pd
 
+from portfolio_toolkit.utils.slots import slotted_dataclass
 
-@dataclass
+
+@slotted_dataclass
 class Position:
     ticker: str
     buy_price: float
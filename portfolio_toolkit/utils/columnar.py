@@ -0,0 +1,246 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .dates import to_datetime64
+
+
+class SortedColumnStore(ABC):
+    """
+    Growable struct-of-arrays table kept sorted by its "date" column.
+
+    Each column is a numpy array with spare capacity, so appends are amortized
+    O(1) and rows dated on or after the last one (the usual case when loading a
+    ledger) never move existing data. Rows with equal dates keep their insertion
+    order.
+
+    Rows already stored are never rewritten in place: out-of-order inserts build
+    new arrays instead, so views returned by ``column`` (and DataFrames built on
+    them without copying) stay valid after later mutations.
+
+    Every mutation bumps ``version`` and records the first row it changed, so
+    consumers holding results derived from an older version can ask
+    ``changed_since`` which prefix of the table is still the same.
+
+    Subclasses declare their columns in ``COLUMNS`` (the first one must be
+    ``"date"`` with dtype ``datetime64[D]``) and implement ``_row_to_object`` to
+    provide the object view used by code that iterates over the table.
+    """
+
+    COLUMNS: Dict[str, str] = {"date": "datetime64[D]"}
+
+    # Change log entries kept before old ones are merged together
+    CHANGE_LOG_SIZE = 256
+
+    def __init__(self, capacity: int = 16):
+        self._size = 0
+        self._columns = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in self.COLUMNS.items()
+        }
+        self.version = 0
+        # (version, first changed row) per mutation, oldest first
+        self._change_log: List[Tuple[int, int]] = []
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray]) -> "SortedColumnStore":
+        """
+        Builds a store that adopts already sorted column arrays, without copying.
+
+        The arrays may be read-only (e.g. memory-mapped): they are only read
+        until the first mutation, which moves the data to new arrays since
+        the store starts without spare capacity.
+
+        Args:
+            columns (dict): Array for every column in COLUMNS, all the same
+                length, sorted by date and with the declared dtypes.
+
+        Returns:
+            SortedColumnStore: The new store.
+        """
+        store = cls()
+        store._columns = {name: columns[name] for name in cls.COLUMNS}
+        store._size = len(columns["date"])
+        return store
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(self._size):
+            yield self._row_to_object(position)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._row_to_object(i) for i in range(*idx.indices(self._size))]
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._row_to_object(idx)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, SortedColumnStore)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={self._size})"
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Returns a read-only view of a column, without copying.
+
+        Args:
+            name (str): Column name.
+
+        Returns:
+            np.ndarray: The first len(self) values of the column.
+        """
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def search(self, from_date=None, to_date=None) -> slice:
+        """
+        Finds the rows dated within [from_date, to_date] by binary search.
+
+        Args:
+            from_date (optional): First date to include. Unbounded if None.
+            to_date (optional): Last date to include. Unbounded if None.
+
+        Returns:
+            slice: Row positions of the matching range.
+        """
+        dates = self._columns["date"][: self._size]
+        start = (
+            0
+            if from_date is None
+            else int(np.searchsorted(dates, to_datetime64(from_date), side="left"))
+        )
+        stop = (
+            self._size
+            if to_date is None
+            else int(np.searchsorted(dates, to_datetime64(to_date), side="right"))
+        )
+        return slice(start, max(start, stop))
+
+    def changed_since(self, version: int) -> Optional[int]:
+        """
+        Returns the first row that may differ from the table at ``version``.
+
+        Rows before the returned position are guaranteed unchanged. Old log
+        entries are merged, so the answer can be earlier than strictly needed
+        for very old versions, but never later.
+
+        Args:
+            version (int): A value of ``version`` seen earlier.
+
+        Returns:
+            Optional[int]: First changed row, or None if nothing changed.
+        """
+        if version >= self.version:
+            return None
+        # A merged entry carries the newest version it covers, so it is never
+        # skipped for a version older than any of its mutations
+        return min(position for ver, position in self._change_log if ver > version)
+
+    def _record_change(self, position: int):
+        self.version += 1
+        log = self._change_log
+        log.append((self.version, position))
+        if len(log) > self.CHANGE_LOG_SIZE:
+            # Merge the older half into one conservative entry
+            half = len(log) // 2
+            merged = (log[half - 1][0], min(position for _, position in log[:half]))
+            log[:half] = [merged]
+
+    @abstractmethod
+    def _row_to_object(self, position: int) -> Any:
+        """
+        Builds the object view of the row at ``position``.
+        """
+        pass
+
+    def _reserve(self, extra: int):
+        """
+        Grows every column so that ``extra`` more rows fit without reallocating.
+        """
+        capacity = len(self._columns["date"])
+        needed = self._size + extra
+        if needed <= capacity:
+            return
+
+        new_capacity = max(needed, capacity * 2, 16)
+        for name, values in self._columns.items():
+            grown = np.empty(new_capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._columns[name] = grown
+
+    def _insert_row(self, row: Dict[str, Any]) -> int:
+        """
+        Inserts one row at its sorted position, after any rows with the same date.
+
+        Args:
+            row (dict): Value for every column. "date" must be a datetime64[D].
+
+        Returns:
+            int: Position where the row was inserted.
+        """
+        self._reserve(1)
+        size = self._size
+        dates = self._columns["date"]
+        position = size
+        if size and row["date"] < dates[size - 1]:
+            position = int(np.searchsorted(dates[:size], row["date"], side="right"))
+
+        for name, values in self._columns.items():
+            if position < size:
+                # Shift into a fresh array so earlier views stay unchanged
+                shifted = np.empty(len(values), dtype=values.dtype)
+                shifted[:position] = values[:position]
+                shifted[position + 1 : size + 1] = values[position:size]
+                self._columns[name] = values = shifted
+            values[position] = row[name]
+
+        self._size += 1
+        self._record_change(position)
+        return position
+
+    def _extend_columns(self, columns: Dict[str, np.ndarray]) -> Optional[int]:
+        """
+        Appends many rows at once and restores the date order if needed.
+
+        Args:
+            columns (dict): Array of values for every column, all the same length.
+
+        Returns:
+            Optional[int]: Position of the first row whose content changed, or
+            None if nothing was added.
+        """
+        count = len(columns["date"])
+        if count == 0:
+            return None
+
+        self._reserve(count)
+        size = self._size
+        for name, values in self._columns.items():
+            values[size : size + count] = columns[name]
+        self._size += count
+
+        dates = self._columns["date"][: self._size]
+        first_changed = size
+        if np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind="stable")
+            moved = np.nonzero(order != np.arange(self._size))[0]
+            first_changed = int(moved[0]) if len(moved) else size
+            for name, values in self._columns.items():
+                reordered = np.empty(len(values), dtype=values.dtype)
+                reordered[: self._size] = values[: self._size][order]
+                self._columns[name] = reordered
+
+        self._record_change(first_changed)
+        return first_changed
@@ -0,0 +1,126 @@
+from datetime import datetime
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+# Single conversion layer for dates: anything date-like ("YYYY-MM-DD" strings,
+# dates, datetimes, pd.Timestamps) is parsed once into datetime64[D], and hot
+# paths compare, search and subtract those arrays (or their int64 day numbers)
+# instead of re-parsing strings.
+
+# Calendar period frequencies accepted by calendar_periods, as pandas aliases
+PERIOD_FREQUENCIES = {"year": "Y", "quarter": "Q", "month": "M"}
+
+
+def to_datetime64(value) -> np.datetime64:
+    """
+    Converts a date-like value to a day-resolution numpy datetime64.
+
+    Args:
+        value: A "YYYY-MM-DD" string, date, datetime, pd.Timestamp or datetime64.
+
+    Returns:
+        np.datetime64: The date with day resolution.
+    """
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[D]")
+    return to_datetime64_array([value])[0]
+
+
+def to_datetime64_array(values: Iterable) -> np.ndarray:
+    """
+    Converts a sequence of date-like values to a datetime64[D] array.
+
+    Arrays, DatetimeIndex and Series that already hold datetimes are converted
+    without going through Python objects.
+
+    Args:
+        values (Iterable): "YYYY-MM-DD" strings, dates, datetimes or pd.Timestamps.
+
+    Returns:
+        np.ndarray: Array of dtype datetime64[D].
+    """
+    if getattr(getattr(values, "dtype", None), "kind", None) == "M":
+        values = np.asarray(values)
+        if values.dtype.kind == "M":
+            return values.astype("datetime64[D]")
+    return np.array(list(values), dtype="datetime64[D]")
+
+
+def to_day_numbers(values: Iterable) -> np.ndarray:
+    """
+    Converts date-like values to int64 day numbers (days since 1970-01-01).
+    """
+    return to_datetime64_array(values).view("int64")
+
+
+def today() -> np.datetime64:
+    """
+    Returns the current local date as a datetime64[D].
+    """
+    # np.datetime64("today") is the UTC date
+    return np.datetime64(datetime.now().date(), "D")
+
+
+def expand_day_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Returns every day covered by the inclusive [start, end] ranges.
+
+    Args:
+        starts (np.ndarray): First day of each range (datetime64[D]).
+        ends (np.ndarray): Last day of each range (datetime64[D]).
+
+    Returns:
+        np.ndarray: Sorted, unique datetime64[D] days.
+
+    Raises:
+        ValueError: If there are not as many starts as ends.
+    """
+    if len(starts) != len(ends):
+        raise ValueError(f"Got {len(starts)} range starts but {len(ends)} range ends.")
+    first = starts.astype("datetime64[D]").view("int64")
+    lengths = np.maximum(ends.astype("datetime64[D]").view("int64") - first + 1, 0)
+    # Offset of every day within its range, then shifted to the range start
+    positions = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    days = np.repeat(first, lengths) + positions
+    return np.unique(days).view("datetime64[D]")
+
+
+def calendar_periods(
+    start_date, end_date, freq: str = "year"
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Returns every calendar year, quarter or month between two dates.
+
+    Args:
+        start_date: A date in the first period.
+        end_date: A date in the last period.
+        freq (str): "year", "quarter" or "month".
+
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: The label of each period
+        ("2024", "2024Q1" or "2024-01"), then its first and last days as
+        datetime64[D] arrays.
+
+    Raises:
+        ValueError: If the frequency is not supported.
+    """
+    import pandas as pd
+
+    if freq not in PERIOD_FREQUENCIES:
+        raise ValueError(
+            f"Unsupported period frequency: {freq}. "
+            f"Expected one of {', '.join(PERIOD_FREQUENCIES)}."
+        )
+    periods = pd.period_range(
+        str(to_datetime64(start_date)),
+        str(to_datetime64(end_date)),
+        freq=PERIOD_FREQUENCIES[freq],
+    )
+    return (
+        periods.astype(str).tolist(),
+        to_datetime64_array(periods.start_time),
+        to_datetime64_array(periods.end_time),
+    )
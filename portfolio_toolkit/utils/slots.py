@@ -0,0 +1,22 @@
+import sys
+from dataclasses import dataclass
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+SLOTS_SUPPORTED = sys.version_info >= (3, 10)
+
+
+def slotted_dataclass(cls=None, /, **kwargs):
+    """
+    Like ``dataclass``, but the class gets ``__slots__`` instead of a
+    per-instance ``__dict__`` where the Python version supports it.
+
+    Slotted classes are recreated by ``dataclass``, so their methods cannot use
+    zero-argument ``super()``; call the base class explicitly instead.
+    """
+    if SLOTS_SUPPORTED:
+        kwargs["slots"] = True
+
+    def wrap(cls):
+        return dataclass(cls, **kwargs)
+
+    return wrap if cls is None else wrap(cls)
@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from portfolio_toolkit.asset import MarketAsset
@@ -30,31 +31,21 @@ def performance(assets: List[MarketAsset], periods: List[Period]) -> pd.DataFram
     # Create mapping from ticker to asset for easy lookup
     asset_map = {asset.ticker: asset for asset in assets}
 
-    # Get prices for each period end date
-    period_prices = {}
-
-    for period in periods:
-        end_date_str = period.end_date.strftime("%Y-%m-%d")
-        period_prices[period.label] = {}
-
-        for ticker in all_assets:
-            asset = asset_map[ticker]
-            # Get price at period end date (or closest available date)
-            if hasattr(asset, "prices") and asset.prices is not None:
-                # Find the closest date to period end date
-                available_dates = asset.prices.index
-                # Filter dates up to the period end date
-                valid_dates = available_dates[available_dates <= end_date_str]
-
-                if len(valid_dates) > 0:
-                    # Get the latest available price before or at period end
-                    closest_date = valid_dates.max()
-                    period_prices[period.label][ticker] = asset.prices.loc[closest_date]
-                else:
-                    # No price data available for this period
-                    period_prices[period.label][ticker] = None
-            else:
-                period_prices[period.label][ticker] = None
+    # Get prices for each period end date (or the closest earlier date), one
+    # vectorized as-of lookup per asset
+    end_dates = [period.end_date for period in periods]
+    period_prices = {period.label: {} for period in periods}
+
+    for ticker in all_assets:
+        asset = asset_map[ticker]
+        if getattr(asset, "prices", None) is not None:
+            prices = asset.get_prices_at(end_dates)
+        else:
+            prices = np.full(len(periods), np.nan)
+
+        for period, price in zip(periods, prices.tolist()):
+            # No price data available for this period
+            period_prices[period.label][ticker] = None if np.isnan(price) else price
 
     # Create comparison data (percentage changes)
     comparison_data = {}
@@ -43,3 +43,52 @@ def test_sort_transactions():
     acc.sort_transactions()
     assert acc.transactions[0].transaction_date == date(2024, 1, 1)
     assert acc.transactions[1].transaction_date == date(2024, 2, 1)
+
+
+def test_get_amounts_at():
+    acc = Account(name="Test Account", currency="USD")
+    acc.add_transaction(AccountTransaction(transaction_date="2024-02-01", transaction_type="sell", amount=-30.0))
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-01", transaction_type="deposit", amount=100.0))
+    amounts = acc.get_amounts_at(["2024-02-02", date(2023, 12, 31), "2024-01-15", "2024-02-01"])
+    assert list(amounts) == [70.0, 0.0, 100.0, 70.0]
+
+
+def test_get_amount_at_after_new_transaction():
+    acc = Account(name="Test Account", currency="USD")
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-01", transaction_type="deposit", amount=100.0))
+    assert acc.get_amount_at("2024-03-01") == 100.0
+    acc.add_transaction(AccountTransaction(transaction_date="2024-02-01", transaction_type="withdrawal", amount=-40.0))
+    assert acc.get_amount_at("2024-03-01") == 60.0
+    assert acc.get_amount_at("2024-01-31") == 100.0
+
+
+def test_get_balance_series_daily():
+    acc = Account(name="Test Account", currency="USD")
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-01", transaction_type="deposit", amount=100.0))
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-03", transaction_type="sell", amount=-30.0))
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-03", transaction_type="income", amount=5.0))
+    series = acc.get_balance_series(end_date="2024-01-04")
+    assert list(series.index.strftime("%Y-%m-%d")) == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert list(series) == [100.0, 100.0, 75.0, 75.0]
+    for day in series.index:
+        assert series[day] == acc.get_amount_at(day)
+
+
+def test_get_balance_series_by_type_and_opening_balance():
+    acc = Account(name="Test Account", currency="USD")
+    acc.add_transaction(AccountTransaction(transaction_date="2023-12-15", transaction_type="deposit", amount=100.0))
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-02", transaction_type="withdrawal", amount=-40.0))
+    frame = acc.get_balance_series("2024-01-01", "2024-01-02", by_type=True)
+    assert list(frame["deposit"]) == [100.0, 100.0]
+    assert list(frame["withdrawal"]) == [0.0, -40.0]
+    assert list(frame["balance"]) == [100.0, 60.0]
+
+
+def test_get_balance_series_calendar_aligned():
+    acc = Account(name="Test Account", currency="USD")
+    acc.add_transaction(AccountTransaction(transaction_date="2024-01-10", transaction_type="deposit", amount=100.0))
+    acc.add_transaction(AccountTransaction(transaction_date="2024-02-10", transaction_type="deposit", amount=50.0))
+    monthly = acc.get_balance_series("2024-01-01", "2024-03-31", freq="MS")
+    assert len(monthly) == 3
+    monthly = acc.get_balance_series("2024-01-01", "2024-03-31", freq="ME")
+    assert list(monthly) == [100.0, 150.0, 150.0]
@@ -0,0 +1,99 @@
+from datetime import date
+
+import numpy as np
+
+from portfolio_toolkit.account import Account, AccountLedger, AccountTransaction
+
+
+def make_tx(tx_date, tx_type="deposit", amount=100.0, description=None):
+    return AccountTransaction(
+        transaction_date=tx_date,
+        transaction_type=tx_type,
+        amount=amount,
+        description=description,
+    )
+
+
+def test_ledger_keeps_date_order_and_insertion_order_for_ties():
+    ledger = AccountLedger()
+    ledger.append(make_tx("2024-03-01", amount=1.0))
+    ledger.append(make_tx("2024-01-01", amount=2.0))
+    ledger.append(make_tx("2024-03-01", amount=3.0))
+    ledger.extend([make_tx("2024-02-01", amount=4.0), make_tx("2024-01-01", amount=5.0)])
+
+    assert list(ledger.amounts) == [2.0, 5.0, 4.0, 1.0, 3.0]
+    assert ledger[0].transaction_date == date(2024, 1, 1)
+    assert ledger[-1].amount == 3.0
+
+
+def test_ledger_views_survive_out_of_order_insert():
+    ledger = AccountLedger([make_tx("2024-01-01", amount=1.0), make_tx("2024-02-01", amount=2.0)])
+    df = ledger.to_dataframe()
+    ledger.append(make_tx("2023-12-01", amount=3.0))
+
+    assert list(df["amount"]) == [1.0, 2.0]
+    assert list(ledger.amounts) == [3.0, 1.0, 2.0]
+
+
+def test_ledger_search_returns_inclusive_slice():
+    ledger = AccountLedger([make_tx(f"2024-0{month}-15") for month in range(1, 7)])
+
+    assert ledger.search("2024-02-15", "2024-04-15") == slice(1, 4)
+    assert ledger.search("2024-02-16", None) == slice(2, 6)
+    assert ledger.search(None, "2023-12-31") == slice(0, 0)
+
+
+def test_ledger_mask_by_type_and_date():
+    ledger = AccountLedger(
+        [
+            make_tx("2024-01-01", "deposit", 1000.0),
+            make_tx("2024-02-01", "income", 10.0),
+            make_tx("2024-03-01", "income", 20.0),
+            make_tx("2024-04-01", "withdrawal", -50.0),
+        ]
+    )
+
+    assert list(ledger.mask(types=["income"])) == [False, True, True, False]
+    assert list(ledger.mask(types=["income"], to_date="2024-02-15")) == [False, True, False, False]
+
+
+def test_ledger_to_dataframe_columns():
+    ledger = AccountLedger([make_tx("2024-01-01", "deposit", 1000.0, "Initial")])
+    df = ledger.to_dataframe()
+
+    assert list(df.columns) == ["date", "type", "amount", "description"]
+    assert df["date"].iloc[0] == np.datetime64("2024-01-01")
+    assert df["type"].iloc[0] == "deposit"
+    assert df["description"].iloc[0] == "Initial"
+
+
+def test_account_accepts_transaction_list():
+    acc = Account(
+        name="Test Account",
+        currency="USD",
+        transactions=[make_tx("2024-02-01", amount=1.0), make_tx("2024-01-01", amount=2.0)],
+    )
+
+    assert isinstance(acc.transactions, AccountLedger)
+    assert acc.get_amount() == 3.0
+    assert acc.to_list()[0]["amount"] == 2.0
+
+
+def test_account_export_to_dataframe_filters_dates():
+    acc = Account(name="Test Account", currency="USD")
+    for month in range(1, 13):
+        acc.add_transaction(make_tx(f"2024-{month:02d}-01", "income", float(month)))
+
+    df = acc.export_to_dataframe(from_date="2024-03-01", to_date="2024-05-31")
+    assert list(df["amount"]) == [3.0, 4.0, 5.0]
+
+    income = acc.to_dataframe(types=["income"])
+    assert len(income) == 12
+
+
+def test_balance_series_ends_on_the_local_date(monkeypatch):
+    from portfolio_toolkit.account import account as account_module
+
+    monkeypatch.setattr(account_module, "today", lambda: np.datetime64("2025-03-01"))
+    account = Account(name="Cash", currency="USD", transactions=[make_tx("2025-02-27")])
+    assert account.get_balance_series().index[-1] == np.datetime64("2025-03-01")
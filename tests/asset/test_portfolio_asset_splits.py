@@ -0,0 +1,91 @@
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.portfolio.time_series.utils import get_ticker_holding_intervals
+from tests.helpers import make_tx
+
+
+def make_asset(transactions):
+    return PortfolioAsset(ticker="AAPL", prices=None, info={}, currency="USD", transactions=transactions)
+
+
+def test_forward_split_adjusts_lots_without_synthetic_trades():
+    asset = make_asset([
+        make_tx("2024-01-02", "buy", 10, 1000),
+        make_tx("2024-02-01", "buy", 10, 1200),
+    ])
+    assert asset.add_split({"date": "2024-03-01", "split_factor": 4.0}) == 0.0
+
+    assert [tx.transaction_type for tx in asset.transactions] == ["buy", "buy", "split"]
+    engine = asset.get_lot_engine()
+    # Lots keep their buy rows, with split-adjusted quantity and unit cost
+    assert [(lot.row, lot.quantity, lot.price) for lot in engine.open_lots()] == [(0, 40, 25), (1, 40, 30)]
+    assert engine.open_quantity_and_cost() == (80, 2200)
+    assert len(engine.closed_lots()) == 0
+
+
+def test_sell_after_split_closes_adjusted_lots():
+    asset = make_asset([
+        make_tx("2024-01-02", "buy", 10, 1000),
+        make_tx("2024-04-01", "sell", 20, 1200),
+    ])
+    asset.add_split({"date": "2024-03-01", "split_factor": 2.0})
+
+    closed = asset.get_lot_engine().closed_lots()
+    assert list(closed.buy_rows) == [0]
+    assert list(closed.quantities) == [20]
+    assert list(closed.buy_prices) == [50]
+    assert get_ticker_holding_intervals([asset], "AAPL") == [("2024-01-02", "2024-04-01")]
+
+
+def test_reverse_split_pays_fractional_shares_at_cost():
+    asset = make_asset([
+        make_tx("2024-01-02", "buy", 10, 100),
+        make_tx("2024-02-01", "buy", 5, 100),
+    ])
+    cash = asset.add_splits([
+        {"date": "2024-03-01", "split_factor": 0.25},
+        {"date": "2023-12-01", "split_factor": 2.0},
+    ])
+
+    # 15 shares become 3.75; the 0.75 fraction comes from the oldest lot
+    assert cash == [pytest.approx(30.0), 0.0]
+    engine = asset.get_lot_engine()
+    assert engine.open_quantity_and_cost() == pytest.approx((3, 170))
+    assert len(asset.transactions) == 3
+    assert asset.transactions.held_quantities().tolist() == [10, 15, 3]
+
+
+def test_splits_added_together_match_splits_added_one_by_one():
+    transactions = [
+        make_tx("2024-01-02", "buy", 7, 700),
+        make_tx("2024-03-05", "sell", 5, 600),
+        make_tx("2024-05-02", "buy", 3, 450),
+    ]
+    splits = [
+        {"date": "2024-02-01", "split_factor": 3.0},
+        {"date": "2024-04-01", "split_factor": 0.5},
+    ]
+    together, one_by_one = make_asset(transactions), make_asset(transactions)
+
+    cash_together = together.add_splits(splits)
+    cash_one_by_one = [one_by_one.add_split(split) for split in splits]
+
+    assert cash_together == pytest.approx(cash_one_by_one)
+    assert together.get_lot_engine().open_quantity_and_cost() == pytest.approx(
+        one_by_one.get_lot_engine().open_quantity_and_cost()
+    )
+
+
+def test_hifo_ranks_lots_by_split_adjusted_cost():
+    asset = make_asset([
+        make_tx("2024-01-02", "buy", 10, 1000),
+        make_tx("2024-03-01", "buy", 10, 600),
+        make_tx("2024-04-01", "sell", 10, 700),
+    ])
+    asset.add_split({"date": "2024-02-01", "split_factor": 2.0})
+
+    closed = asset.get_lot_engine("hifo").closed_lots()
+    # The new lot cost 60 a share, more than the 50 of the split-adjusted one
+    assert list(closed.buy_prices) == [60]
+    assert [(lot.quantity, lot.price) for lot in asset.get_lot_engine("hifo").open_lots()] == [(20, 50)]
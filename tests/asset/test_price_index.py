@@ -0,0 +1,52 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.asset import MarketAsset
+from portfolio_toolkit.asset.market import PriceIndex
+
+
+def make_prices():
+    index = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05", "2024-01-08"])
+    return pd.Series([10.0, np.nan, 12.0, 13.0], index=index)
+
+
+def test_price_index_as_of_lookups():
+    index = PriceIndex(make_prices())
+
+    assert index.get_price_at("2024-01-01") is None
+    assert index.get_price_at("2024-01-02") == 10.0
+    # NaN prices are skipped, so the last known price is carried forward
+    assert index.get_price_at("2024-01-04") == 10.0
+    assert index.get_price_at(date(2024, 1, 6)) == 12.0
+    assert index.get_price_at(pd.Timestamp("2030-01-01")) == 13.0
+
+
+def test_price_index_vectorized_lookup_keeps_input_order():
+    index = PriceIndex(make_prices())
+    prices = index.get_prices_at(["2024-01-08", "2023-12-31", "2024-01-05"], default=0.0)
+
+    assert list(prices) == [13.0, 0.0, 12.0]
+
+
+def test_price_index_handles_unsorted_and_tz_aware_series():
+    index = pd.DatetimeIndex(["2024-01-05", "2024-01-02"]).tz_localize("America/New_York")
+    price_index = PriceIndex(pd.Series([12.0, 10.0], index=index))
+
+    assert price_index.get_price_at("2024-01-03") == 10.0
+    assert price_index.get_price_at("2024-01-05") == 12.0
+
+
+def test_price_index_empty_series():
+    assert np.isnan(PriceIndex(None).get_prices_at(["2024-01-01"])[0])
+    assert PriceIndex(pd.Series(dtype=float)).get_price_at("2024-01-01", 0.0) == 0.0
+
+
+def test_market_asset_rebuilds_index_when_prices_change():
+    asset = MarketAsset(ticker="AAPL", prices=make_prices(), info={})
+    assert asset.get_price_at("2024-01-08") == 13.0
+
+    asset.prices = pd.Series([20.0], index=pd.to_datetime(["2024-01-08"]))
+    assert asset.get_price_at("2024-01-08") == 20.0
+    assert asset.get_price_at("2024-01-05") is None
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.market import PriceLoader
+from portfolio_toolkit.asset.market.price_loader import slice_price_series
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+from tests.helpers import StaticDataProvider, make_tx_dict
+
+
+class CountingDataProvider(StaticDataProvider):
+    def __init__(self):
+        index = pd.date_range("2024-01-01", "2025-03-31", freq="B")
+        prices = {
+            "AAPL": pd.Series(np.arange(len(index), dtype=float) + 100, index=index),
+            # No prices between mid-January and March 2025
+            "GAP": pd.Series(50.0, index=index[(index < "2025-01-15") | (index >= "2025-03-03")]),
+        }
+        super().__init__(prices, {ticker: {"sector": "Technology"} for ticker in prices})
+        self.full_calls = []
+        self.window_calls = []
+
+    def get_price_series_converted(self, ticker, target_currency, column="Close"):
+        self.full_calls.append(ticker)
+        return self.prices[ticker]
+
+    def get_price_series_converted_between(self, ticker, target_currency, start=None, end=None, column="Close"):
+        self.window_calls.append((ticker, start, end))
+        return slice_price_series(self.prices[ticker], start, end)
+
+
+def make_portfolio(provider, extra_transactions=()):
+    data = {
+        "name": "Lazy",
+        "currency": "USD",
+        "transactions": [make_tx_dict("2024-02-01", "AAPL", "buy", 10, 1000.0), make_tx_dict("2024-03-01", "GAP", "buy", 5, 250.0), *extra_transactions],
+    }
+    return portfolio_from_dict(data, provider)
+
+
+def test_loading_a_portfolio_fetches_no_prices():
+    provider = CountingDataProvider()
+    portfolio = make_portfolio(provider)
+
+    PortfolioAsset.to_dataframe(portfolio.assets)
+    assert provider.full_calls == [] and provider.window_calls == []
+    assert all(not asset.prices_loaded for asset in portfolio.assets)
+    assert "prices_length=not loaded" in repr(portfolio.assets[0])
+
+
+def test_lookups_load_only_the_requested_window():
+    provider = CountingDataProvider()
+    aapl = make_portfolio(provider).assets[0]
+    expected = provider.prices["AAPL"].asof(pd.Timestamp("2025-03-01"))
+
+    assert aapl.get_price_at("2025-03-01") == expected
+    assert aapl.get_price_at("2025-02-28") == expected
+    assert provider.full_calls == []
+    # The second date was inside the first window
+    assert len(provider.window_calls) == 1
+    assert not aapl.prices_loaded
+
+    # A date outside the window widens it
+    prices = aapl.get_prices_at(["2024-06-03", "2025-03-01"])
+    assert list(prices) == [provider.prices["AAPL"]["2024-06-03"], expected]
+    assert provider.window_calls[-1][1] < np.datetime64("2024-06-03")
+    assert provider.full_calls == []
+
+
+def test_window_without_earlier_price_falls_back_to_full_series():
+    provider = CountingDataProvider()
+    gap = make_portfolio(provider).assets[1]
+
+    assert gap.get_price_at("2025-02-20") == 50.0
+    assert provider.full_calls == ["GAP"]
+    assert gap.prices_loaded
+
+
+def test_reading_prices_loads_full_series_once():
+    provider = CountingDataProvider()
+    aapl = make_portfolio(provider).assets[0]
+
+    assert aapl.prices is provider.prices["AAPL"]
+    assert aapl.prices is provider.prices["AAPL"]
+    aapl.get_price_at("2024-06-03")
+    assert provider.full_calls == ["AAPL"]
+    assert provider.window_calls == []
+
+
+def test_open_positions_match_eager_prices_and_keep_cache():
+    provider = CountingDataProvider()
+    portfolio = make_portfolio(provider)
+    eager = make_portfolio(provider)
+    for asset in eager.assets:
+        asset.prices = provider.prices[asset.ticker]
+
+    lazy_values = [p.value for p in portfolio.get_open_positions("2024-12-31")]
+    assert lazy_values == [p.value for p in eager.get_open_positions("2024-12-31")]
+
+    calls = len(provider.window_calls)
+    portfolio.get_open_positions("2024-12-31")
+    assert len(provider.window_calls) == calls
+    assert provider.full_calls == []
+
+
+def test_flat_assets_fetch_no_prices():
+    provider = CountingDataProvider()
+    portfolio = make_portfolio(provider, [make_tx_dict("2024-05-02", "AAPL", "sell", 10, 1100.0)])
+
+    positions = portfolio.get_open_positions_at(["2024-12-31", "2025-03-20"])
+    assert [[p.ticker for p in snapshot] for snapshot in positions] == [["GAP"], ["GAP"]]
+    assert {ticker for ticker, _, _ in provider.window_calls} == {"GAP"}
+
+    # Held on the first date only: the window stops there
+    portfolio.get_open_positions_at(["2024-04-01", "2025-03-20"])
+    aapl_calls = [call for call in provider.window_calls if call[0] == "AAPL"]
+    assert len(aapl_calls) == 1 and aapl_calls[0][2] == np.datetime64("2024-04-01")
+    assert provider.full_calls == []
+
+
+def test_assigning_a_series_replaces_the_loader():
+    provider = CountingDataProvider()
+    asset = PortfolioAsset(ticker="AAPL", prices=PriceLoader(provider, "AAPL", "USD"), info={})
+    series = pd.Series([1.0], index=pd.to_datetime(["2024-01-02"]))
+
+    asset.prices = series
+    assert asset.prices_loaded and asset.price_source is series
+    assert asset.get_price_at("2024-01-03") == 1.0
+    assert provider.full_calls == [] and provider.window_calls == []
@@ -0,0 +1,60 @@
+import io
+
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAsset, PortfolioAssetTransaction
+from portfolio_toolkit.asset.portfolio.transaction_export import (
+    iter_transaction_frames,
+    write_transactions_csv,
+)
+from tests.helpers import make_tx
+
+
+def make_assets():
+    msft = PortfolioAsset(ticker="MSFT", prices=None, info={}, transactions=[
+        make_tx("2025-01-02", "buy", 5, 2000.0),
+        make_tx("2025-03-01", "sell", 2, 900.0),
+    ])
+    aapl = PortfolioAsset(ticker="AAPL", prices=None, info={}, transactions=[
+        make_tx("2025-03-01", "buy", 10, 1000.0),
+        make_tx("2024-12-31", "buy", 1, 90.0),
+    ])
+    return [msft, aapl]
+
+
+def reference_frame(assets):
+    frames = [PortfolioAssetTransaction.to_dataframe(list(asset.transactions), asset.ticker) for asset in assets]
+    data = pd.concat(frames, ignore_index=True)
+    return data.sort_values(by=["date", "ticker"], kind="stable").reset_index(drop=True)
+
+
+def test_to_dataframe_matches_row_by_row_construction():
+    assets = make_assets()
+    data = PortfolioAsset.to_dataframe(assets)
+
+    pd.testing.assert_frame_equal(data, reference_frame(assets), check_dtype=False)
+    assert list(zip(data["date"], data["ticker"])) == [
+        ("2024-12-31", "AAPL"), ("2025-01-02", "MSFT"), ("2025-03-01", "AAPL"), ("2025-03-01", "MSFT"),
+    ]
+    assert list(data["type"]) == ["buy", "buy", "buy", "sell"]
+
+
+def test_chunks_and_csv_cover_all_rows():
+    assets = make_assets()
+    chunks = list(iter_transaction_frames(assets, chunk_rows=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), PortfolioAsset.to_dataframe(assets))
+
+    stream = io.StringIO()
+    assert write_transactions_csv(assets, stream, chunk_rows=3) == 4
+    stream.seek(0)
+    pd.testing.assert_frame_equal(pd.read_csv(stream), reference_frame(assets), check_dtype=False)
+
+    with pytest.raises(ValueError):
+        list(iter_transaction_frames(assets, chunk_rows=0))
+
+
+def test_to_dataframe_without_assets_is_empty():
+    assert PortfolioAsset.to_dataframe([]).empty
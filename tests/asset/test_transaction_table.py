@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.portfolio import TransactionTable
+from portfolio_toolkit.portfolio.time_series.utils import get_ticker_holding_intervals
+from tests.helpers import make_tx
+
+
+def test_table_sorts_on_insert_and_returns_string_dates():
+    table = TransactionTable([make_tx("2024-03-01", "sell", 5, 60.0)])
+    table.append(make_tx("2024-01-01", "buy", 10, 100.0))
+    table.append(make_tx("2024-03-01", "buy", 1, 12.0))
+
+    assert [tx.date for tx in table] == ["2024-01-01", "2024-03-01", "2024-03-01"]
+    assert [tx.transaction_type for tx in table] == ["buy", "sell", "buy"]
+    assert table.dates.dtype == np.dtype("datetime64[D]")
+    assert table.types.dtype == np.int8
+
+
+def test_table_rejects_unknown_type():
+    with pytest.raises(ValueError, match="Unknown transaction type"):
+        TransactionTable([make_tx("2024-01-01", "swap", 1, 1.0)])
+
+
+def test_table_count_until():
+    table = TransactionTable(
+        [
+            make_tx("2024-01-01", "buy", 10, 100.0),
+            make_tx("2024-02-01", "buy", 10, 200.0),
+            make_tx("2024-03-01", "sell", 5, 100.0),
+        ]
+    )
+
+    assert table.count_until("2024-02-15") == 2
+    assert table.count_until("2024-03-01") == 3
+    assert table.count_until("2023-12-31") == 0
+
+
+def test_portfolio_asset_converts_transaction_list():
+    asset = PortfolioAsset(
+        ticker="AAPL",
+        prices=None,
+        info={},
+        transactions=[
+            make_tx("2024-02-01", "sell", 10, 120.0),
+            make_tx("2024-01-01", "buy", 10, 100.0),
+            make_tx("2024-03-01", "buy", 5, 50.0),
+        ],
+    )
+
+    assert isinstance(asset.transactions, TransactionTable)
+    assert asset.transactions[0].transaction_type == "buy"
+    assert get_ticker_holding_intervals([asset], "AAPL")[0] == ("2024-01-01", "2024-02-01")
@@ -0,0 +1,94 @@
+"""
+Builders shared by the tests: transactions, as objects or as portfolio JSON
+entries, an in-memory data provider and a small two-asset ledger.
+"""
+
+import pandas as pd
+
+from portfolio_toolkit.asset.portfolio import PortfolioAssetTransaction
+from portfolio_toolkit.data_provider.data_provider import DataProvider
+
+
+class StaticDataProvider(DataProvider):
+    """Data provider serving fixed price series and ticker info from memory."""
+
+    def __init__(self, prices, info=None):
+        self.prices = prices
+        self.info = info or {}
+
+    def get_price(self, ticker, date):
+        return self.prices[ticker].asof(pd.Timestamp(date))
+
+    def get_raw_data(self, ticker, period="5y"):
+        return self.prices[ticker].to_frame("Close")
+
+    def get_price_series(self, ticker, column="Close"):
+        return self.prices[ticker]
+
+    def get_price_series_converted(self, ticker, target_currency, column="Close"):
+        return self.prices[ticker]
+
+    def get_ticker_info(self, ticker):
+        return self.info.get(ticker, {})
+
+    def get_ticker_currency(self, ticker=None):
+        return "USD"
+
+
+def make_tx(date, transaction_type, quantity, total_base, **extra):
+    """A USD asset transaction whose unit price is total_base / quantity."""
+    return PortfolioAssetTransaction(
+        date=date,
+        transaction_type=transaction_type,
+        quantity=quantity,
+        price=total_base / quantity if quantity else 0.0,
+        currency="USD",
+        total=total_base,
+        exchange_rate=1.0,
+        subtotal_base=total_base,
+        fees_base=0.0,
+        total_base=total_base,
+        **extra,
+    )
+
+
+def make_tx_dict(date, ticker, transaction_type, quantity, total_base, **extra):
+    """The same transaction as a portfolio JSON entry."""
+    return dict(
+        date=date,
+        ticker=ticker,
+        type=transaction_type,
+        quantity=quantity,
+        price=total_base / quantity,
+        currency="USD",
+        total=total_base,
+        exchange_rate=1.0,
+        subtotal_base=total_base,
+        fees_base=0.0,
+        total_base=total_base,
+        **extra,
+    )
+
+
+def make_provider():
+    """AAPL at 100 and MSFT at 200 on every business day of 2025Q1."""
+    index = pd.date_range("2025-01-01", "2025-03-31", freq="B")
+    prices = {
+        "AAPL": pd.Series(100.0, index=index),
+        "MSFT": pd.Series(200.0, index=index),
+    }
+    return StaticDataProvider(
+        prices, {ticker: {"sector": "Technology"} for ticker in prices}
+    )
+
+
+# Ledger priced by make_provider(), with cash entries and an AAPL split
+TRANSACTIONS = [
+    make_tx_dict("2025-01-02", None, "deposit", 5000, 5000.0, description="Initial"),
+    make_tx_dict("2025-01-03", "AAPL", "buy", 10, 1000.0),
+    make_tx_dict("2025-01-10", "MSFT", "buy", 4, 800.0),
+    make_tx_dict("2025-02-03", "AAPL", "sell", 5, 600.0),
+    make_tx_dict("2025-02-10", "AAPL", "dividend", 1, 12.5),
+    make_tx_dict("2025-03-01", None, "withdrawal", 100, 100.0),
+]
+SPLITS = [{"date": "2025-02-05", "ticker": "AAPL", "split_factor": 2.0}]
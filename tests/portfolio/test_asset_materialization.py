@@ -0,0 +1,106 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.data_provider.data_provider import DataProvider
+from portfolio_toolkit.portfolio.ledger_import import import_ledger
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+
+TICKERS = ["MSFT", "AAPL", "NVDA", "AMZN", "META", "TSLA"]
+
+
+class SlowInfoProvider(DataProvider):
+    """Provider whose ticker information takes a while, tracking concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.info_calls = []
+
+    def get_price(self, ticker, date):
+        return 100.0
+
+    def get_raw_data(self, ticker, period="5y"):
+        raise NotImplementedError
+
+    def get_price_series(self, ticker, column="Close"):
+        raise NotImplementedError
+
+    def get_price_series_converted(self, ticker, target_currency, column="Close"):
+        raise AssertionError("prices are not needed to load a portfolio")
+
+    def get_ticker_info(self, ticker):
+        with self.lock:
+            self.info_calls.append(ticker)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if ticker == "BAD":
+            raise ValueError("unknown ticker BAD")
+        return {"sector": f"Sector {ticker}"}
+
+
+class BatchInfoProvider(SlowInfoProvider):
+    def __init__(self):
+        super().__init__(delay=0)
+        self.batches = []
+
+    def get_tickers_info(self, tickers, max_workers=8):
+        self.batches.append(list(tickers))
+        return {ticker: {"sector": "Batch"} for ticker in tickers}
+
+
+def buy(date, ticker):
+    return dict(date=date, ticker=ticker, type="buy", quantity=1, price=10.0, currency="USD", total=10.0, exchange_rate=1.0, subtotal_base=10.0, fees_base=0.0, total_base=10.0)
+
+
+def make_data(tickers=TICKERS):
+    # Every ticker appears twice, interleaved with the others
+    transactions = [buy(f"2025-01-{day:02d}", ticker) for day in (2, 3) for ticker in tickers]
+    return {"name": "Test", "currency": "USD", "transactions": transactions}
+
+
+def test_ticker_information_is_fetched_concurrently():
+    provider = SlowInfoProvider()
+    portfolio = portfolio_from_dict(make_data(), provider)
+
+    assert sorted(provider.info_calls) == sorted(TICKERS)
+    assert provider.max_active > 1
+    # Assets keep the order in which tickers first appear
+    assert [asset.ticker for asset in portfolio.assets] == TICKERS
+    assert [asset.sector for asset in portfolio.assets] == [f"Sector {t}" for t in TICKERS]
+    assert all(len(asset.transactions) == 2 for asset in portfolio.assets)
+    assert len(portfolio.account.transactions) == 2 * len(TICKERS)
+
+
+def test_batch_provider_is_called_once():
+    provider = BatchInfoProvider()
+    portfolio = portfolio_from_dict(make_data(), provider)
+
+    assert provider.batches == [TICKERS]
+    assert provider.info_calls == []
+    assert {asset.sector for asset in portfolio.assets} == {"Batch"}
+
+
+def test_ticker_information_errors_propagate():
+    with pytest.raises(ValueError, match="unknown ticker BAD"):
+        portfolio_from_dict(make_data(TICKERS + ["BAD"]), SlowInfoProvider(delay=0))
+
+
+def test_ledger_import_creates_each_chunks_new_tickers_together(tmp_path):
+    path = tmp_path / "ledger.csv"
+    pd.DataFrame(make_data()["transactions"]).to_csv(path, index=False)
+    provider = BatchInfoProvider()
+
+    portfolio, report = import_ledger(str(path), provider, "USD", chunk_rows=4)
+
+    assert report.imported == 2 * len(TICKERS)
+    # Chunks of four rows: only tickers not seen before are requested
+    assert provider.batches == [TICKERS[:4], TICKERS[4:]]
+    assert [asset.ticker for asset in portfolio.assets] == TICKERS
@@ -0,0 +1,81 @@
+import json
+
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.portfolio.ledger_import import import_ledger
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+from tests.helpers import SPLITS, TRANSACTIONS, make_provider, make_tx_dict
+
+
+def write_csv(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return str(path)
+
+
+def write_ndjson(path, lines):
+    path.write_text("\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines) + "\n")
+    return str(path)
+
+
+def assert_same_portfolio(imported, expected):
+    assert [asset.ticker for asset in imported.assets] == [asset.ticker for asset in expected.assets]
+    for asset, reference in zip(imported.assets, expected.assets):
+        assert list(asset.transactions) == list(reference.transactions)
+    pd.testing.assert_frame_equal(imported.account.to_dataframe(), expected.account.to_dataframe())
+    assert imported.start_date == expected.start_date
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_import_matches_json_loader(tmp_path, fmt):
+    if fmt == "csv":
+        path = write_csv(tmp_path / "ledger.csv", TRANSACTIONS)
+    else:
+        path = write_ndjson(tmp_path / "ledger.ndjson", TRANSACTIONS)
+    provider = make_provider()
+
+    portfolio, report = import_ledger(path, provider, "USD", splits=SPLITS, chunk_rows=4)
+    expected = portfolio_from_dict({"name": "ledger", "currency": "USD", "transactions": TRANSACTIONS, "splits": SPLITS}, provider)
+
+    assert (report.rows, report.rejected, report.errors) == (6, 0, [])
+    assert portfolio.name == "ledger"
+    assert_same_portfolio(portfolio, expected)
+    assert portfolio.get_open_positions("2025-03-31")[0].quantity == 10
+
+
+def test_invalid_rows_are_reported_by_line(tmp_path):
+    rows = TRANSACTIONS[:3] + [
+        make_tx_dict("2025-13-01", "AAPL", "buy", 1, 100.0),
+        dict(make_tx_dict("2025-01-20", "AAPL", "transfer", 1, 100.0), price="abc"),
+    ]
+    path = write_csv(tmp_path / "ledger.csv", rows)
+
+    with pytest.raises(ValueError, match="line 5, date"):
+        import_ledger(path, make_provider(), "USD")
+
+    portfolio, report = import_ledger(path, make_provider(), "USD", errors="skip", chunk_rows=2)
+    assert (report.rows, report.rejected, report.imported) == (5, 2, 3)
+    assert [(e.line, e.column, e.value) for e in report.errors] == [
+        (5, "date", "2025-13-01"), (6, "type", "transfer"), (6, "price", "abc"),
+    ]
+    assert list(report.to_dataframe().columns) == ["line", "column", "value", "message"]
+    assert sum(len(asset.transactions) for asset in portfolio.assets) == 2
+
+
+def test_ndjson_parse_errors_and_missing_fields(tmp_path):
+    missing = dict(TRANSACTIONS[1])
+    del missing["total_base"]
+    path = write_ndjson(tmp_path / "ledger.jsonl", [TRANSACTIONS[0], "{not json", "", "[1, 2]", missing])
+
+    _, report = import_ledger(path, make_provider(), "USD", errors="skip")
+
+    assert (report.rows, report.imported) == (4, 1)
+    assert [(e.line, e.column) for e in report.errors] == [(2, None), (4, None), (5, "total_base")]
+
+
+def test_missing_csv_columns_and_unknown_format(tmp_path):
+    path = write_csv(tmp_path / "ledger.csv", [{k: v for k, v in TRANSACTIONS[0].items() if k != "currency"}])
+    with pytest.raises(ValueError, match="missing columns: currency"):
+        import_ledger(path, make_provider(), "USD")
+    with pytest.raises(ValueError, match="Cannot infer"):
+        import_ledger(str(tmp_path / "ledger.xlsx"), make_provider(), "USD")
@@ -0,0 +1,67 @@
+from portfolio_toolkit.account import Account
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.portfolio import Portfolio
+from portfolio_toolkit.position.open import list_from_portfolio as open_queries
+from tests.helpers import make_tx
+
+
+def make_portfolio():
+    aapl = PortfolioAsset(ticker="AAPL", prices=None, info={}, transactions=[
+        make_tx("2025-01-02", "buy", 10, 1000),
+        make_tx("2025-02-10", "sell", 4, 480),
+    ])
+    msft = PortfolioAsset(ticker="MSFT", prices=None, info={}, transactions=[
+        make_tx("2025-01-05", "buy", 5, 2000),
+    ])
+    return Portfolio(name="Test", currency="USD", assets=[aapl, msft], data_provider=None, account=Account(name="Cash", currency="USD"), start_date="2025-01-02")
+
+
+def count_asset_queries(monkeypatch):
+    calls = []
+    original = open_queries.get_asset_open_positions
+
+    def counting(asset, date, method="fifo"):
+        calls.append(asset.ticker)
+        return original(asset, date, method)
+
+    monkeypatch.setattr(open_queries, "get_asset_open_positions", counting)
+    return calls
+
+
+def test_repeated_open_position_query_is_cached(monkeypatch):
+    portfolio = make_portfolio()
+    calls = count_asset_queries(monkeypatch)
+
+    first = portfolio.get_open_positions("2025-03-01")
+    second = portfolio.get_open_positions("2025-03-01")
+
+    assert calls == ["AAPL", "MSFT"]
+    assert [(p.ticker, p.quantity) for p in second] == [("AAPL", 6), ("MSFT", 5)]
+    assert second is not first
+
+
+def test_edit_invalidates_only_the_edited_asset(monkeypatch):
+    portfolio = make_portfolio()
+    aapl = portfolio.assets[0]
+    portfolio.get_open_positions("2025-03-01")
+    closed = portfolio.get_closed_positions("2025-01-01", "2025-12-31")
+    assert len(closed) == 1
+
+    version = aapl.ledger_version
+    aapl.add_transaction(make_tx("2025-02-20", "sell", 6, 900))
+    assert aapl.ledger_version > version
+
+    calls = count_asset_queries(monkeypatch)
+    positions = portfolio.get_open_positions("2025-03-01")
+    assert calls == ["AAPL"]
+    assert [(p.ticker, p.quantity) for p in positions] == [("MSFT", 5)]
+    assert len(portfolio.get_closed_positions("2025-01-01", "2025-12-31")) == 2
+
+
+def test_split_bumps_ledger_version():
+    portfolio = make_portfolio()
+    msft = portfolio.assets[1]
+    assert portfolio.get_open_positions("2025-03-01")[1].quantity == 5
+
+    msft.add_split({"date": "2025-02-01", "split_factor": 2.0})
+    assert portfolio.get_open_positions("2025-03-01")[1].quantity == 10
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.math.get_irr import get_irr, get_npv
+from portfolio_toolkit.portfolio import PortfolioReturns
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+from tests.helpers import StaticDataProvider, make_tx_dict
+
+
+def make_provider():
+    """AAPL at 100, then 120 from April and 90 from July 2024."""
+    index = pd.date_range("2023-12-01", "2024-12-31", freq="B")
+    prices = pd.Series(100.0, index=index)
+    prices[index >= "2024-04-01"] = 120.0
+    prices[index >= "2024-07-01"] = 90.0
+    return StaticDataProvider({"AAPL": prices})
+
+
+def make_returns(with_deposits=True):
+    transactions = [make_tx_dict("2024-01-02", "AAPL", "buy", 10, 1000.0), make_tx_dict("2024-05-01", "AAPL", "buy", 10, 1200.0)]
+    if with_deposits:
+        transactions += [make_tx_dict("2024-01-02", None, "deposit", 1000, 1000.0), make_tx_dict("2024-05-01", None, "deposit", 1200, 1200.0)]
+    data = {"name": "Returns", "currency": "USD", "transactions": transactions}
+    return portfolio_from_dict(data, make_provider()).get_returns(end_date="2024-12-31")
+
+
+@pytest.mark.parametrize("with_deposits", [True, False])
+def test_twr_ignores_deposits(with_deposits):
+    returns = make_returns(with_deposits)
+
+    # +20% in April, then -25% in July, whatever was invested in between
+    assert returns.twr("2024-01-02", "2024-12-31") == pytest.approx(-0.10)
+    assert returns.twr("2024-04-01", "2024-06-30") == pytest.approx(0.20)
+    assert returns.twr("2024-05-01", "2024-05-31") == pytest.approx(0.0)
+    assert returns.values[-1] == pytest.approx(1800.0)
+
+
+def test_mwr_weights_the_money_invested():
+    returns = make_returns()
+    mwr = returns.mwr("2024-01-02", "2024-12-31")
+
+    # More money was invested before the loss than before the gain
+    assert mwr < returns.twr("2024-01-02", "2024-12-31")
+    days = 365
+    times = [0.0, (np.datetime64("2024-05-01") - np.datetime64("2024-01-02")).astype(int) / days, 1.0]
+    assert get_npv([mwr], [[-1000.0, -1200.0, 1800.0]], [times])[0] == pytest.approx(0.0, abs=1e-6)
+    # Without flows inside the window both returns agree
+    assert returns.mwr("2024-06-01", "2024-12-31") == pytest.approx(returns.twr("2024-06-01", "2024-12-31"))
+
+
+def test_batch_windows_match_single_windows():
+    returns = make_returns()
+    starts = ["2024-01-02", "2024-02-15", "2024-04-01", "2024-06-30", "2024-09-01"]
+    ends = ["2024-12-31", "2024-05-10", "2024-04-30", "2024-07-01", "2024-09-30"]
+
+    twrs = returns.twrs(starts, ends)
+    mwrs = returns.mwrs(starts, ends, annualized=True)
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        assert twrs[i] == pytest.approx(returns.twr(start, end))
+        assert mwrs[i] == pytest.approx(returns.mwr(start, end, annualized=True))
+
+
+def test_period_table_chains_to_the_full_window():
+    returns = make_returns()
+    table = returns.table("quarter")
+
+    assert list(table.index) == ["2024Q1", "2024Q2", "2024Q3", "2024Q4"]
+    assert table.loc["2024Q1", "start"] == "2024-01-02"
+    assert list(table["net_flows"]) == [1000.0, 1200.0, 0.0, 0.0]
+    assert np.prod(1 + table["twr"]) - 1 == pytest.approx(returns.twr("2024-01-02", "2024-12-31"))
+    assert (table["final_value"].to_numpy()[:-1] == table["initial_value"].to_numpy()[1:]).all()
+    assert len(returns.table("month")) == 12
+    with pytest.raises(ValueError, match="Unsupported period frequency"):
+        returns.table("week")
+
+
+def test_windows_outside_the_series_are_rejected():
+    returns = make_returns()
+
+    with pytest.raises(ValueError, match="outside the series"):
+        returns.twr("2023-06-01", "2024-03-01")
+    with pytest.raises(ValueError, match="outside the series"):
+        returns.mwrs(["2024-03-01"], ["2024-02-01"])
+
+
+def test_irr_solver_handles_many_rows_and_no_solution():
+    amounts = [[-100.0, 0.0, 110.0], [-100.0, -50.0, 170.0], [100.0, 0.0, 50.0], [-100.0, 0.0, 1e6]]
+    times = [[0.0, 0.0, 1.0], [0.0, 0.5, 1.0], [0.0, 0.0, 1.0], [0.0, 0.0, 1.0]]
+    rates = get_irr(amounts, times)
+
+    assert rates[0] == pytest.approx(0.10)
+    assert get_npv(rates[1:2], [amounts[1]], [times[1]])[0] == pytest.approx(0.0, abs=1e-8)
+    # Every cash flow positive: no rate makes the NPV zero
+    assert np.isnan(rates[2])
+    assert rates[3] == pytest.approx(1e4 - 1)
+
+
+def test_daily_dataframe():
+    frame = make_returns().to_dataframe()
+
+    assert list(frame.columns) == ["Value", "Flow", "Return", "Growth"]
+    assert frame.index[0] == pd.Timestamp("2024-01-01")
+    assert frame["Flow"].sum() == pytest.approx(2200.0)
+    assert isinstance(make_returns(), PortfolioReturns)
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.portfolio import Portfolio, PortfolioStats
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+from tests.helpers import StaticDataProvider, make_tx_dict
+
+
+def make_provider():
+    index = pd.date_range("2022-01-03", "2025-06-30", freq="B")
+    prices = {
+        "AAPL": pd.Series(np.linspace(100, 200, len(index)), index=index),
+        "MSFT": pd.Series(np.linspace(300, 250, len(index)), index=index),
+    }
+    return StaticDataProvider(prices, {ticker: {"sector": "Technology"} for ticker in prices})
+
+
+def make_portfolio():
+    transactions = [
+        make_tx_dict("2022-01-10", None, "deposit", 20000, 20000.0),
+        make_tx_dict("2022-02-01", "AAPL", "buy", 40, 4200.0),
+        make_tx_dict("2022-06-15", "MSFT", "buy", 20, 5900.0),
+        make_tx_dict("2023-03-01", "AAPL", "sell", 10, 1400.0),
+        make_tx_dict("2023-09-12", "MSFT", "sell", 5, 1420.0),
+        make_tx_dict("2024-01-20", "AAPL", "dividend", 1, 30.0),
+        make_tx_dict("2024-05-02", "AAPL", "sell", 15, 2500.0),
+        make_tx_dict("2024-11-30", None, "withdrawal", 1000, 1000.0),
+        make_tx_dict("2025-02-03", "MSFT", "sell", 15, 3900.0),
+    ]
+    data = {"name": "Periods", "currency": "USD", "transactions": transactions}
+    return portfolio_from_dict(data, make_provider())
+
+
+def test_for_years_matches_direct_queries():
+    portfolio = make_portfolio()
+    stats = PortfolioStats.for_years(portfolio, ["2024", "2022", "2023"])
+
+    assert list(stats) == ["2024", "2022", "2023"]
+    for year, year_stats in stats.items():
+        first, last = f"{year}-01-01", f"{year}-12-31"
+        previous = f"{int(year) - 1}-12-31"
+        assert year_stats.realized_profit == pytest.approx(portfolio.get_realized_profit(first, last))
+        assert year_stats.initial_valuation == pytest.approx(sum(p.value for p in portfolio.get_open_positions(previous)))
+        assert year_stats.final_valuation == pytest.approx(sum(p.value for p in portfolio.get_open_positions(last)))
+        assert year_stats.final_cash == pytest.approx(portfolio.account.get_amount_at(last))
+        assert len(year_stats.closed_positions) == len(portfolio.get_closed_positions(first, last))
+        rows = portfolio.account.transactions.search(first, last)
+        assert len(year_stats.transactions) == rows.stop - rows.start
+
+    assert stats["2022"].deposits == 20000.0
+    assert stats["2024"].incomes == 30.0
+    # Withdrawals are stored as negative amounts
+    assert stats["2024"].withdrawals == -1000.0
+
+
+def test_for_years_matches_single_year_stats():
+    portfolio = make_portfolio()
+    stats = PortfolioStats.for_years(portfolio, ["2023", "2024"])
+
+    for year in ("2023", "2024"):
+        single = portfolio.get_stats(year).to_dict()
+        for key, value in stats[year].to_dict().items():
+            if isinstance(value, pd.DataFrame):
+                pd.testing.assert_frame_equal(value, single[key])
+            else:
+                assert value == single[key]
+
+
+def test_for_years_sweeps_positions_once(monkeypatch):
+    portfolio = make_portfolio()
+    calls = []
+    for name in ("get_open_positions_at", "get_closed_positions"):
+        original = getattr(Portfolio, name)
+
+        def counting(self, *args, _name=name, _original=original, **kwargs):
+            calls.append(_name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Portfolio, name, counting)
+
+    PortfolioStats.for_years(portfolio, ["2022", "2023", "2024", "2025"])
+    assert sorted(calls) == ["get_closed_positions", "get_open_positions_at"]
+
+
+def test_for_periods_by_quarter_and_month():
+    portfolio = make_portfolio()
+    quarters = PortfolioStats.for_periods(portfolio, "2024-01-01", "2024-12-31", "quarter")
+    months = PortfolioStats.for_periods(portfolio, "2024-01-15", "2024-12-01", "month")
+    year = PortfolioStats.for_years(portfolio, ["2024"])["2024"]
+
+    assert list(quarters) == ["2024Q1", "2024Q2", "2024Q3", "2024Q4"]
+    assert list(months)[0] == "2024-01" and list(months)[-1] == "2024-12" and len(months) == 12
+    for periods in (quarters, months):
+        values = list(periods.values())
+        assert sum(s.realized_profit for s in values) == pytest.approx(year.realized_profit)
+        assert sum(s.net_cash_flow for s in values) == pytest.approx(year.net_cash_flow)
+        assert values[0].initial_valuation == pytest.approx(year.initial_valuation)
+        assert values[-1].final_valuation == pytest.approx(year.final_valuation)
+        # Each period opens where the previous one closed
+        for before, after in zip(values, values[1:]):
+            assert after.initial_valuation == pytest.approx(before.final_valuation)
+            assert after.initial_cash == pytest.approx(before.final_cash)
+
+
+def test_for_periods_rejects_unknown_frequency():
+    with pytest.raises(ValueError, match="Unsupported period frequency"):
+        PortfolioStats.for_periods(make_portfolio(), "2024-01-01", "2024-12-31", "week")
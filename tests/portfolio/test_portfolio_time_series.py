@@ -0,0 +1,191 @@
+import pandas as pd
+
+from portfolio_toolkit.account import Account
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.portfolio import Portfolio
+from portfolio_toolkit.portfolio.time_series.utils import get_ticker_holding_intervals
+from tests.helpers import StaticDataProvider, make_tx
+
+
+def make_portfolio():
+    index = pd.date_range("2025-01-01", "2025-03-31", freq="B")
+    prices = {
+        "AAPL": pd.Series(range(100, 100 + len(index)), index=index, dtype=float),
+        "MSFT": pd.Series(200.0, index=index),
+    }
+    aapl = PortfolioAsset(ticker="AAPL", prices=prices["AAPL"], info={}, transactions=[
+        make_tx("2025-01-02", "buy", 10, 1000),
+        make_tx("2025-02-03", "sell", 5, 600),
+        make_tx("2025-02-10", "buy", 5, 550),
+        make_tx("2025-03-03", "sell", 10, 1300),
+    ])
+    msft = PortfolioAsset(ticker="MSFT", prices=prices["MSFT"], info={}, transactions=[
+        make_tx("2025-01-15", "buy", 2, 400),
+    ])
+    return Portfolio(
+        name="Test", currency="USD", assets=[aapl, msft],
+        data_provider=StaticDataProvider(prices),
+        account=Account(name="Cash", currency="USD"), start_date="2025-01-02",
+    )
+
+
+def test_time_series_is_lazy():
+    time_series = make_portfolio().get_time_series()
+    assert time_series._portfolio_timeseries is None
+    assert not time_series.portfolio_timeseries.empty
+    assert time_series._portfolio_timeseries is not None
+
+
+def test_time_series_window_matches_full_series():
+    portfolio = make_portfolio()
+    full = portfolio.get_time_series().portfolio_timeseries
+    window = portfolio.get_time_series("2025-02-01", "2025-02-28").portfolio_timeseries
+
+    expected = full[(full["Date"] >= "2025-02-01") & (full["Date"] <= "2025-02-28")]
+    pd.testing.assert_frame_equal(window.reset_index(drop=True), expected.reset_index(drop=True))
+
+
+def test_time_series_window_seeds_position_state():
+    window = make_portfolio().get_time_series("2025-02-05", "2025-02-05", tickers=["AAPL"]).portfolio_timeseries
+    assert list(window["Ticker"]) == ["AAPL"]
+    assert window.iloc[0]["Quantity"] == 5
+    assert window.iloc[0]["Cost"] == 500
+
+
+def test_time_series_ticker_subset():
+    time_series = make_portfolio().get_time_series()
+    window = time_series.get_window(tickers=["MSFT"])
+    assert set(window["Ticker"]) == {"MSFT"}
+    assert window.iloc[0]["Date"] == pd.Timestamp("2025-01-15")
+    assert window.iloc[0]["Value_Base"] == 400
+
+
+def test_time_series_chunks_are_date_ordered_and_complete():
+    time_series = make_portfolio().get_time_series(end_date="2025-03-31")
+    chunks = list(time_series.iter_chunks(end_date="2025-03-31", chunk_days=10))
+    assert len(chunks) > 1
+
+    streamed = pd.concat(chunks, ignore_index=True)
+    assert streamed["Date"].is_monotonic_increasing
+
+    full = time_series.portfolio_timeseries.sort_values(by=["Date", "Ticker"], ignore_index=True)
+    streamed = streamed.sort_values(by=["Date", "Ticker"], ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, full)
+
+
+def test_time_series_export_csv(tmp_path):
+    from portfolio_toolkit.portfolio.time_series.export import export_time_series
+
+    time_series = make_portfolio().get_time_series(end_date="2025-03-31")
+    output = tmp_path / "series.csv"
+    rows = export_time_series(time_series, output=str(output), fmt="csv", chunk_days=7)
+
+    exported = pd.read_csv(output)
+    assert rows == len(exported) == len(time_series.portfolio_timeseries)
+    assert list(exported.columns) == list(time_series.portfolio_timeseries.columns)
+
+
+def test_time_series_export_table_is_aligned(tmp_path):
+    from portfolio_toolkit.portfolio.time_series.export import export_time_series
+
+    time_series = make_portfolio().get_time_series(end_date="2025-03-31")
+    output = tmp_path / "series.txt"
+    rows = export_time_series(time_series, output=str(output), fmt="table", chunk_days=7)
+
+    lines = output.read_text().splitlines()
+    assert rows == len(lines) - 1 == len(time_series.portfolio_timeseries)
+    assert lines[0].split() == list(time_series.portfolio_timeseries.columns)
+    assert len({len(line) for line in lines}) == 1
+
+
+def test_time_series_export_table_streams_chunks():
+    import io
+
+    from portfolio_toolkit.portfolio.time_series.export import _write_text_chunks
+
+    chunks = list(make_portfolio().get_time_series(end_date="2025-03-31").iter_chunks(chunk_days=7))
+    stream = io.StringIO()
+    written = []
+
+    def produce():
+        for chunk in chunks:
+            # Everything before this chunk is already on the stream
+            written.append(stream.getvalue().count("\n"))
+            yield chunk
+
+    _write_text_chunks(produce(), stream, "table")
+    assert written == [0] + [1 + sum(map(len, chunks[:i])) for i in range(1, len(chunks))]
+
+
+def test_time_series_compact_dtypes():
+    frame = make_portfolio().get_time_series(end_date="2025-03-31").portfolio_timeseries
+    assert isinstance(frame["Ticker"].dtype, pd.CategoricalDtype)
+    assert isinstance(frame["Sector"].dtype, pd.CategoricalDtype)
+    assert isinstance(frame["Country"].dtype, pd.CategoricalDtype)
+    assert frame["Quantity"].dtype == "int32"
+    assert frame["Cost"].dtype == "float64"
+
+
+def test_time_series_float32_values():
+    frame = make_portfolio().get_time_series(end_date="2025-03-31", float_dtype="float32").portfolio_timeseries
+    assert frame["Value_Base"].dtype == "float32"
+    assert frame["Cost"].dtype == "float32"
+
+
+def test_time_series_include_cash():
+    from portfolio_toolkit.account import AccountTransaction
+
+    portfolio = make_portfolio()
+    portfolio.account.add_transaction(AccountTransaction(transaction_date="2025-01-01", transaction_type="deposit", amount=2000.0))
+    portfolio.account.add_transaction(AccountTransaction(transaction_date="2025-01-02", transaction_type="sell", amount=-1000.0))
+    frame = portfolio.get_time_series("2025-01-01", "2025-01-05", include_cash=True).portfolio_timeseries
+    cash = frame[frame["Ticker"] == "__USD"]
+    assert list(cash["Value_Base"]) == [2000.0, 1000.0, 1000.0, 1000.0, 1000.0]
+    assert set(cash["Sector"]) == {"Cash"}
+
+    without_cash = portfolio.get_time_series("2025-01-01", "2025-01-05").portfolio_timeseries
+    assert "__USD" not in set(without_cash["Ticker"])
+
+
+def make_single_asset_portfolio(transactions, splits=()):
+    index = pd.date_range("2025-01-01", "2025-03-31", freq="B")
+    prices = {"AAPL": pd.Series(100.0, index=index)}
+    aapl = PortfolioAsset(ticker="AAPL", prices=prices["AAPL"], info={}, transactions=transactions)
+    aapl.add_splits(list(splits))
+    return Portfolio(
+        name="Test", currency="USD", assets=[aapl],
+        data_provider=StaticDataProvider(prices),
+        account=Account(name="Cash", currency="USD"), start_date="2025-01-02",
+    )
+
+
+def test_time_series_oversold_ledger():
+    portfolio = make_single_asset_portfolio([
+        make_tx("2025-01-02", "buy", 10, 1000),
+        make_tx("2025-02-03", "sell", 12, 1200),
+        make_tx("2025-02-10", "buy", 2, 200),
+    ])
+    assert get_ticker_holding_intervals(portfolio.assets, "AAPL")[0] == ("2025-01-02", "2025-02-03")
+
+    series = portfolio.get_time_series().portfolio_timeseries
+    assert not (series["Date"].between("2025-02-04", "2025-02-07")).any()
+    assert series.iloc[-1]["Quantity"] == 2
+    assert sum(p.quantity for p in portfolio.get_open_positions("2025-03-31")) == 2
+
+
+def test_time_series_after_reverse_split():
+    portfolio = make_single_asset_portfolio(
+        [
+            make_tx("2025-01-02", "buy", 10, 1000),
+            make_tx("2025-02-03", "sell", 2, 800),
+            make_tx("2025-02-10", "buy", 4, 1600),
+        ],
+        splits=[{"date": "2025-01-20", "split_factor": 0.25}],
+    )
+    intervals = get_ticker_holding_intervals(portfolio.assets, "AAPL")
+    assert intervals[0] == ("2025-01-02", "2025-02-03")
+    assert intervals[1][0] == "2025-02-10"
+
+    series = portfolio.get_time_series().portfolio_timeseries
+    assert series[series["Date"] == "2025-01-21"].iloc[0]["Quantity"] == 2
+    assert series.iloc[-1]["Quantity"] == 4
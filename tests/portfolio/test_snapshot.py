@@ -0,0 +1,133 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAssetTransaction
+from portfolio_toolkit.portfolio import Portfolio
+from portfolio_toolkit.portfolio.snapshot import (
+    SNAPSHOT_MAGIC,
+    compile_portfolio,
+    load_portfolio,
+    read_snapshot,
+    snapshot_path,
+    source_hash,
+)
+from tests.helpers import SPLITS, TRANSACTIONS, make_provider
+
+
+def write_portfolio(path, transactions=TRANSACTIONS, cost_basis="fifo"):
+    lots_sell = dict(TRANSACTIONS[3], lots=["2025-01-03"])
+    data = {"name": "Snap", "currency": "USD", "cost_basis": cost_basis, "transactions": transactions + [lots_sell], "splits": SPLITS}
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = write_portfolio(tmp_path / "portfolio.json", cost_basis="specific")
+    provider = make_provider()
+
+    expected, output = compile_portfolio(path, provider)
+    assert output == str(tmp_path / "portfolio.snapshot")
+
+    loaded = read_snapshot(output, provider, source_hash(path))
+    assert (loaded.name, loaded.currency, loaded.cost_basis, loaded.start_date) == (expected.name, expected.currency, "specific", expected.start_date)
+    for asset, reference in zip(loaded.assets, expected.assets):
+        assert (asset.ticker, asset.currency, asset.sector, asset.info) == (reference.ticker, reference.currency, reference.sector, reference.info)
+        assert list(asset.transactions) == list(reference.transactions)
+    pd.testing.assert_frame_equal(loaded.account.to_dataframe(), expected.account.to_dataframe())
+    assert [p.quantity for p in loaded.get_open_positions("2025-03-31")] == [p.quantity for p in expected.get_open_positions("2025-03-31")]
+
+
+def test_snapshot_tables_are_memory_mapped_until_changed(tmp_path):
+    path = write_portfolio(tmp_path / "portfolio.json")
+    provider = make_provider()
+    compile_portfolio(path, provider)
+
+    asset = load_portfolio(path, provider).assets[0]
+    dates = asset.transactions.dates
+    assert not dates.flags.writeable and not dates.flags.owndata
+
+    asset.add_transaction(PortfolioAssetTransaction(date="2025-01-01", transaction_type="buy", quantity=1, price=90, currency="USD", total=90, exchange_rate=1, subtotal_base=90, fees_base=0, total_base=90))
+    assert asset.transactions.dates[0] == np.datetime64("2025-01-01")
+    assert len(dates) == len(asset.transactions) - 1
+
+
+def test_stale_snapshot_falls_back_to_json(tmp_path):
+    path = write_portfolio(tmp_path / "portfolio.json")
+    provider = make_provider()
+    compile_portfolio(path, provider)
+
+    write_portfolio(tmp_path / "portfolio.json", transactions=TRANSACTIONS[:3])
+    assert read_snapshot(snapshot_path(path), provider, source_hash(path)) is None
+    portfolio = Portfolio.from_file(path, provider)
+    expected = Portfolio.from_dict(json.loads((tmp_path / "portfolio.json").read_text()), provider)
+    assert [list(asset.transactions) for asset in portfolio.assets] == [list(asset.transactions) for asset in expected.assets]
+
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "portfolio.snapshot"
+    path.write_bytes(b"not a snapshot at all")
+    with pytest.raises(ValueError, match="not a portfolio snapshot"):
+        read_snapshot(str(path), make_provider())
+
+
+@pytest.mark.parametrize("damage", ["truncated_header", "truncated_data", "empty", "foreign"])
+def test_damaged_snapshot_falls_back_to_json(tmp_path, damage):
+    path = write_portfolio(tmp_path / "portfolio.json")
+    provider = make_provider()
+    expected, output = compile_portfolio(path, provider)
+
+    content = open(output, "rb").read()
+    damaged = {
+        "truncated_header": content[:40],
+        "truncated_data": content[: len(content) // 2 + 300],
+        "empty": b"",
+        "foreign": b"not a snapshot at all",
+    }[damage]
+    with open(output, "wb") as f:
+        f.write(damaged)
+
+    with pytest.raises(ValueError):
+        read_snapshot(output, provider, source_hash(path))
+    portfolio = load_portfolio(path, provider)
+    assert [list(asset.transactions) for asset in portfolio.assets] == [list(asset.transactions) for asset in expected.assets]
+
+
+def rewrite_header(output, change):
+    content = open(output, "rb").read()
+    start = len(SNAPSHOT_MAGIC) + 8
+    length = int.from_bytes(content[len(SNAPSHOT_MAGIC) : start], "little")
+    header = json.dumps(change(json.loads(content[start : start + length]))).encode()
+    with open(output, "wb") as f:
+        f.write(SNAPSHOT_MAGIC + len(header).to_bytes(8, "little") + header + content[start + length :])
+
+
+def drop_ledger(header):
+    del header["account"]["ledger"]
+    return header
+
+
+def bad_dtype(header):
+    header["assets"][0]["transactions"]["columns"]["quantity"]["dtype"] = "not a dtype"
+    return header
+
+
+@pytest.mark.parametrize("change", [
+    lambda header: {},
+    lambda header: [],
+    lambda header: dict(header, assets=5),
+    drop_ledger,
+    bad_dtype,
+], ids=["empty_object", "array", "assets_not_a_list", "missing_ledger", "bad_dtype"])
+def test_corrupted_header_falls_back_to_json(tmp_path, change):
+    path = write_portfolio(tmp_path / "portfolio.json")
+    provider = make_provider()
+    expected, output = compile_portfolio(path, provider)
+    rewrite_header(output, change)
+
+    with pytest.raises(ValueError, match="damaged snapshot header"):
+        read_snapshot(output, provider, source_hash(path))
+    portfolio = load_portfolio(path, provider)
+    assert [list(asset.transactions) for asset in portfolio.assets] == [list(asset.transactions) for asset in expected.assets]
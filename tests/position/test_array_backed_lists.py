@@ -0,0 +1,71 @@
+import pickle
+
+import pandas as pd
+import pytest
+
+from portfolio_toolkit.asset.portfolio import PortfolioAssetTransaction
+from portfolio_toolkit.position import ClosedPosition, OpenPosition
+from portfolio_toolkit.position.closed import ClosedPositionArrays, ClosedPositionList
+from portfolio_toolkit.position.open import OpenPositionArrays, OpenPositionList
+from portfolio_toolkit.utils.slots import SLOTS_SUPPORTED
+
+
+def make_closed():
+    return [
+        ClosedPosition(ticker="AAPL", buy_price=100, quantity=10, buy_date="2025-01-02", sell_price=120, sell_date="2025-01-20"),
+        ClosedPosition(ticker="MSFT", buy_price=200, quantity=5, buy_date="2024-01-02", sell_price=150, sell_date="2025-02-10"),
+    ]
+
+
+def make_open():
+    return [
+        OpenPosition(ticker="AAPL", buy_price=100, quantity=10, current_price=120, sector="Technology", country="United States"),
+        OpenPosition(ticker="SAP", buy_price=90, quantity=3, current_price=80, sector="Technology", country="Germany"),
+    ]
+
+
+@pytest.mark.skipif(not SLOTS_SUPPORTED, reason="dataclass slots need Python 3.10")
+def test_value_objects_have_no_instance_dict():
+    transaction = PortfolioAssetTransaction(date="2025-01-02", transaction_type="buy", quantity=1, price=1, currency="USD", total=1, exchange_rate=1, subtotal_base=1, fees_base=0, total_base=1)
+    for obj in make_closed() + make_open() + [transaction]:
+        assert not hasattr(obj, "__dict__")
+        assert pickle.loads(pickle.dumps(obj)) == obj
+
+
+@pytest.mark.parametrize(
+    "list_class, arrays_class, make_positions",
+    [(ClosedPositionList, ClosedPositionArrays, make_closed), (OpenPositionList, OpenPositionArrays, make_open)],
+)
+def test_array_backed_list_matches_object_list(list_class, arrays_class, make_positions):
+    positions = make_positions()
+    objects = list_class(positions)
+    backed = list_class.from_arrays(arrays_class.from_positions(positions))
+
+    assert backed._positions is None
+    assert len(backed) == len(objects)
+    assert list(backed) == positions
+    assert backed[-1] == positions[-1]
+    assert backed[:1] == positions[:1]
+    with pytest.raises(IndexError):
+        backed[2]
+    pd.testing.assert_frame_equal(backed.to_dataframe(), objects.to_dataframe(), check_dtype=False)
+    # Rows are built on demand until the object list is requested
+    assert backed._positions is None
+    assert backed.positions == positions
+
+
+def test_array_backed_closed_list_stats():
+    positions = make_closed()
+    backed = ClosedPositionList.from_arrays(ClosedPositionArrays.from_positions(positions))
+
+    assert backed.get_stats("2025-12-31") == ClosedPositionList(positions).get_stats("2025-12-31")
+    assert backed._positions is None
+
+
+def test_closed_list_stats_follow_in_place_edits():
+    first, second = make_closed()
+    for closed_list in (ClosedPositionList([first]), ClosedPositionList.from_arrays(ClosedPositionArrays.from_positions([first]))):
+        assert closed_list.get_stats("2025-12-31")["total_profit"] == pytest.approx(200)
+
+        closed_list.positions[0] = second
+        assert closed_list.get_stats("2025-12-31")["total_profit"] == pytest.approx(-250)
@@ -0,0 +1,48 @@
+import math
+
+import pytest
+
+from portfolio_toolkit.position.closed import ClosedPosition, ClosedPositionList
+
+
+def make_positions():
+    return ClosedPositionList([
+        ClosedPosition(ticker="AAPL", buy_price=100, quantity=10, buy_date="2025-01-02", sell_price=120, sell_date="2025-01-20"),
+        ClosedPosition(ticker="MSFT", buy_price=200, quantity=5, buy_date="2024-01-02", sell_price=150, sell_date="2025-02-10"),
+        ClosedPosition(ticker="AAPL", buy_price=110, quantity=4, buy_date="2025-01-05", sell_price=121, sell_date="2025-02-15"),
+        ClosedPosition(ticker="NVDA", buy_price=50, quantity=2, buy_date="2024-11-01", sell_price=50, sell_date="2025-03-01"),
+    ])
+
+
+def test_stats_match_position_objects():
+    positions = make_positions()
+    stats = positions.get_stats("2025-12-31")
+
+    assert stats["total_positions"] == 4
+    assert stats["winning_positions"] == 2
+    assert stats["losing_positions"] == 1
+    assert stats["win_rate"] == 50.0
+    assert stats["total_profit"] == pytest.approx(sum(p.profit for p in positions))
+    assert (stats["best_ticker"], stats["best_return"]) == ("AAPL", pytest.approx(20.0))
+    assert (stats["worst_ticker"], stats["worst_return"]) == ("MSFT", pytest.approx(-25.0))
+
+
+def test_distribution_stats():
+    distribution = make_positions().get_distribution_stats(percentiles=(0, 50, 100))
+
+    assert distribution["profit_factor"] == pytest.approx((200 + 44) / 250)
+    assert distribution["return_percentiles"] == {0: pytest.approx(-25.0), 50: pytest.approx(5.0), 100: pytest.approx(20.0)}
+    assert distribution["holding_day_percentiles"][0] == 18
+    assert distribution["holding_periods"] == {"<= 30 days": 1, "31-90 days": 1, "91-365 days": 1, "> 1 year": 1}
+    assert distribution["profit_by_ticker"].to_dict() == {"AAPL": pytest.approx(244.0), "MSFT": -250.0, "NVDA": 0.0}
+    assert distribution["profit_by_month"].to_dict() == {"2025-01": 200.0, "2025-02": pytest.approx(-206.0), "2025-03": 0.0}
+
+
+def test_distribution_stats_without_losses_or_positions():
+    winners = ClosedPositionList(make_positions().positions[:1])
+    assert math.isinf(winners.get_distribution_stats()["profit_factor"])
+
+    empty = ClosedPositionList([]).get_distribution_stats()
+    assert empty["profit_factor"] == 0.0
+    assert empty["profit_by_month"].empty
+    assert empty["return_percentiles"][50] == 0.0
@@ -0,0 +1,79 @@
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.portfolio.portfolio_from_dict import portfolio_from_dict
+from portfolio_toolkit.position.closed.list_from_portfolio import (
+    get_asset_closed_positions,
+)
+from portfolio_toolkit.position.lots import LotEngine
+from portfolio_toolkit.position.open.list_from_portfolio import get_asset_open_positions
+from tests.helpers import make_provider, make_tx, make_tx_dict
+
+
+def make_asset(sell_lots=None):
+    return PortfolioAsset(ticker="AAPL", prices=None, info={}, transactions=[
+        make_tx("2025-01-02", "buy", 10, 1000),  # 100
+        make_tx("2025-01-03", "buy", 10, 1500),  # 150
+        make_tx("2025-01-06", "buy", 10, 1200),  # 120
+        make_tx("2025-02-03", "sell", 15, 2100, lots=sell_lots),  # 140
+    ])
+
+
+@pytest.mark.parametrize(
+    "method, closed, open_cost",
+    [
+        ("fifo", [(10, 100), (5, 150)], 5 * 150 + 10 * 120),
+        ("lifo", [(10, 120), (5, 150)], 10 * 100 + 5 * 150),
+        ("hifo", [(10, 150), (5, 120)], 10 * 100 + 5 * 120),
+        ("average", [(15, 370 / 3)], 15 * 370 / 3),
+    ],
+)
+
+
+def test_cost_basis_methods(method, closed, open_cost):
+    asset = make_asset()
+    closed_positions = get_asset_closed_positions(asset, "2025-01-01", "2025-12-31", method)
+    open_position = get_asset_open_positions(asset, "2025-12-31", method)
+
+    assert [(p.quantity, pytest.approx(p.buy_price)) for p in closed_positions] == closed
+    assert open_position.quantity == 15
+    assert open_position.cost == pytest.approx(open_cost)
+
+    # Open and closed positions come from the same replay, so costs add up
+    closed_cost = sum(p.cost for p in closed_positions)
+    assert closed_cost + open_position.cost == pytest.approx(3700)
+
+
+def test_specific_lot_method_uses_named_lots_then_fifo():
+    asset = make_asset(sell_lots=["2025-01-06"])
+    closed_positions = get_asset_closed_positions(asset, "2025-01-01", "2025-12-31", "specific")
+
+    assert [(p.buy_date, p.quantity) for p in closed_positions] == [("2025-01-06", 10), ("2025-01-02", 5)]
+    assert get_asset_open_positions(asset, "2025-12-31", "specific").cost == pytest.approx(5 * 100 + 10 * 150)
+
+
+def test_hifo_engine_snapshot_restores_heap():
+    table = make_asset().transactions
+    engine = LotEngine(table, "hifo").advance("2025-01-31")
+    resumed = LotEngine.resume(table, engine.snapshot(), "hifo").advance()
+
+    assert [(lot.row, lot.quantity) for lot in sorted(resumed.open_lots(), key=lambda lot: lot.row)] == [(0, 10), (2, 5)]
+
+
+def test_unknown_cost_basis_method():
+    with pytest.raises(ValueError, match="Unknown cost basis method"):
+        LotEngine(make_asset().transactions, "random")
+
+
+def test_default_cost_basis_is_fifo_and_average_keeps_the_old_open_cost():
+    data = {"name": "Test", "currency": "USD", "transactions": [
+        make_tx_dict("2025-01-02", "AAPL", "buy", 10, 1000.0),
+        make_tx_dict("2025-01-03", "AAPL", "buy", 10, 1500.0),
+        make_tx_dict("2025-01-06", "AAPL", "sell", 10, 1400.0),
+    ]}
+    assert portfolio_from_dict(data, make_provider()).cost_basis == "fifo"
+
+    asset = make_asset()
+    # Open positions were valued at average cost before the lot engine
+    assert get_asset_open_positions(asset, "2025-12-31", "average").cost == pytest.approx(3700 / 30 * 15)
+    assert get_asset_open_positions(asset, "2025-12-31").cost == pytest.approx(5 * 150 + 10 * 120)
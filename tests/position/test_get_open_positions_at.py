@@ -0,0 +1,47 @@
+import pandas as pd
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.position.open.list_from_portfolio import (
+    get_open_positions,
+    get_open_positions_at,
+)
+from tests.helpers import make_tx
+
+
+def make_assets():
+    prices = pd.Series([100.0, 110.0, 120.0], index=pd.to_datetime(["2025-01-02", "2025-02-03", "2025-03-03"]))
+    aapl = PortfolioAsset(ticker="AAPL", prices=prices, info={}, transactions=[
+        make_tx("2025-01-02", "buy", 10, 1000),
+        make_tx("2025-02-10", "sell", 10, 1150),
+        make_tx("2025-03-01", "buy", 4, 460),
+    ])
+    googl = PortfolioAsset(ticker="GOOGL", prices=None, info={}, transactions=[
+        make_tx("2025-02-01", "buy", 20, 2000),
+    ])
+    return [aapl, googl]
+
+
+def test_get_open_positions_at_matches_single_date_calls():
+    assets = make_assets()
+    dates = ["2025-03-31", "2024-12-31", "2025-01-31", "2025-02-15"]
+
+    snapshots = get_open_positions_at(assets, dates)
+
+    assert len(snapshots) == len(dates)
+    for date, snapshot in zip(dates, snapshots):
+        expected = get_open_positions(assets, date)
+        assert [(p.ticker, p.quantity, p.cost, p.current_price) for p in snapshot] == [
+            (p.ticker, p.quantity, p.cost, p.current_price) for p in expected
+        ]
+
+
+def test_get_open_positions_at_snapshots():
+    snapshots = get_open_positions_at(make_assets(), ["2024-12-31", "2025-01-31", "2025-02-15", "2025-03-31"])
+
+    assert len(snapshots[0]) == 0
+    assert [(p.ticker, p.quantity, p.current_price) for p in snapshots[1]] == [("AAPL", 10, 100.0)]
+    assert [p.ticker for p in snapshots[2]] == ["GOOGL"]
+    aapl = snapshots[3][0]
+    assert aapl.quantity == 4
+    assert aapl.buy_price == 115
+    assert aapl.current_price == 120.0
@@ -0,0 +1,77 @@
+import pytest
+
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.asset.portfolio.transaction_table import TransactionTable
+from portfolio_toolkit.position.lots import LotEngine
+from tests.helpers import make_tx
+
+
+def make_transactions(months=24):
+    transactions = []
+    for month in range(months):
+        date = f"{2023 + month // 12}-{month % 12 + 1:02d}"
+        transactions.append(make_tx(f"{date}-05", "buy", 10, 1000 + 10 * month))
+        transactions.append(make_tx(f"{date}-20", "sell", 6, 700 + 5 * month))
+    return transactions
+
+
+def assert_same_replay(engine, expected):
+    closed, fresh = engine.closed_lots(), expected.closed_lots()
+    assert list(closed.quantities) == list(fresh.quantities)
+    assert list(closed.buy_prices) == list(fresh.buy_prices)
+    assert list(closed.sell_rows) == list(fresh.sell_rows)
+    assert engine.open_quantity_and_cost() == pytest.approx(expected.open_quantity_and_cost())
+    assert list(engine.position_states()[1]) == pytest.approx(list(expected.position_states()[1]))
+
+
+def test_changed_since_reports_first_changed_row():
+    table = TransactionTable(make_transactions(2))
+    version = table.version
+    assert table.changed_since(version) is None
+
+    table.append(make_tx("2023-03-01", "buy", 1, 100))
+    assert table.changed_since(version) == 4
+    table.append(make_tx("2023-01-10", "buy", 1, 100))
+    assert table.changed_since(version) == 1
+    assert table.changed_since(table.version - 1) == 1
+
+
+@pytest.mark.parametrize("checkpoint_every", [5, "M"])
+def test_sync_replays_from_checkpoint_before_edit(checkpoint_every):
+    table = TransactionTable(make_transactions())
+    engine = LotEngine(table, checkpoint_every=checkpoint_every).advance()
+    assert engine.checkpoints
+    replayed = engine.replayed_rows
+
+    table.append(make_tx("2024-06-10", "buy", 3, 400))
+    engine.sync()
+
+    assert engine.replayed_rows - replayed < len(table) // 2
+    assert_same_replay(engine, LotEngine(table).advance())
+
+
+def test_at_matches_full_replay_up_to_date():
+    table = TransactionTable(make_transactions())
+    engine = LotEngine(table, checkpoint_every=4).advance()
+
+    as_of = engine.at("2024-02-10")
+    expected = LotEngine(table).advance("2024-02-10")
+    assert as_of.next_row == expected.next_row
+    assert as_of.replayed_rows <= 4
+    assert [(lot.row, lot.quantity) for lot in as_of.open_lots()] == [
+        (lot.row, lot.quantity) for lot in expected.open_lots()
+    ]
+
+
+def test_portfolio_asset_engine_follows_mid_ledger_edit():
+    asset = PortfolioAsset(ticker="AAPL", prices=None, info={}, transactions=make_transactions())
+    engine = asset.get_lot_engine("lifo")
+
+    asset.add_transaction(make_tx("2023-07-01", "sell", 5, 600))
+    assert asset.get_lot_engine("lifo") is engine
+    assert_same_replay(engine, LotEngine(asset.transactions, "lifo").advance())
+
+
+def test_invalid_checkpoint_spacing():
+    with pytest.raises(ValueError):
+        LotEngine(TransactionTable(), checkpoint_every=0)
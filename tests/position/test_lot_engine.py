@@ -0,0 +1,61 @@
+from portfolio_toolkit.asset import PortfolioAsset
+from portfolio_toolkit.position.lots import LotEngine
+from tests.helpers import make_tx
+
+
+def make_asset():
+    return PortfolioAsset(ticker="AAPL", prices=None, info={}, transactions=[
+        make_tx("2025-01-02", "buy", 10, 1000),
+        make_tx("2025-01-03", "buy", 10, 1200),
+        make_tx("2025-02-03", "sell", 15, 1950),
+        make_tx("2025-03-03", "buy", 5, 700),
+        make_tx("2025-04-01", "sell", 8, 1200),
+    ])
+
+
+def test_lot_engine_fifo_matching():
+    engine = LotEngine(make_asset().transactions).advance()
+    closed = engine.closed_lots()
+
+    assert list(closed.quantities) == [10, 5, 5, 3]
+    assert list(closed.buy_prices) == [100, 120, 120, 140]
+    assert list(closed.sell_prices) == [130, 130, 150, 150]
+    assert [(lot.quantity, lot.price) for lot in engine.open_lots()] == [(2, 140)]
+    assert engine.open_quantity_and_cost() == (2, 280)
+
+
+def test_lot_engine_realized_profit_by_window():
+    closed = LotEngine(make_asset().transactions).advance().closed_lots()
+
+    assert closed.realized_profit("2025-02-01", "2025-02-28") == 300 + 50
+    assert closed.realized_profit("2025-03-01", "2025-04-30") == 150 + 30
+    assert closed.realized_profit() == 530
+
+
+def test_lot_engine_snapshot_and_resume():
+    table = make_asset().transactions
+    engine = LotEngine(table).advance("2025-02-28")
+    snapshot = engine.snapshot()
+    assert snapshot.next_row == 3
+
+    engine.advance()
+    full = engine.closed_lots()
+    resumed = LotEngine.resume(table, snapshot).advance()
+
+    assert [(lot.row, lot.quantity) for lot in resumed.open_lots()] == [(3, 2)]
+    assert list(resumed.closed_lots().quantities) == list(full.quantities[2:])
+
+    engine.restore(snapshot)
+    assert len(engine.closed_lots()) == 2
+    assert engine.open_quantity_and_cost() == (5, 600)
+
+
+def test_portfolio_asset_reuses_lot_replay_until_ledger_changes():
+    asset = make_asset()
+    engine = asset.get_lot_engine()
+    assert asset.get_lot_engine() is engine
+
+    asset.add_transaction(make_tx("2025-05-01", "sell", 2, 400))
+    updated = asset.get_lot_engine()
+    assert updated is engine
+    assert len(updated.closed_lots()) == 5
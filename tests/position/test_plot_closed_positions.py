@@ -0,0 +1,51 @@
+import pytest
+
+from portfolio_toolkit.position.closed import ClosedPosition, ClosedPositionList
+from portfolio_toolkit.position.closed.plot_closed_positions import (
+    plot_closed_positions,
+    plot_closed_positions_by_ticker,
+    plot_closed_positions_count_by_month,
+)
+
+
+def make_positions():
+    return ClosedPositionList([
+        ClosedPosition(ticker="AAPL", buy_price=100, quantity=10, buy_date="2024-12-02", sell_price=120, sell_date="2024-12-31", sector="Technology"),
+        ClosedPosition(ticker="XOM", buy_price=50, quantity=10, buy_date="2024-12-02", sell_price=40, sell_date="2025-01-02", sector="Energy"),
+        ClosedPosition(ticker="AAPL", buy_price=100, quantity=5, buy_date="2025-01-02", sell_price=110, sell_date="2025-04-01", sector="Technology"),
+    ])
+
+
+def test_plot_closed_positions_by_month_is_chronological():
+    chart = plot_closed_positions(make_positions())
+
+    assert chart.labels == ["2024-12", "2025-01", "2025-04"]
+    assert chart.values == [200.0, -100.0, 50.0]
+    assert chart.colors == ["green", "red", "green"]
+
+
+@pytest.mark.parametrize("group_by, labels, values", [
+    # 2024-12-31 and 2025-01-02 fall in the week starting Monday 2024-12-30
+    ("week", ["2024-12-30", "2025-03-31"], [100.0, 50.0]),
+    ("quarter", ["2024-Q4", "2025-Q1", "2025-Q2"], [200.0, -100.0, 50.0]),
+    ("year", ["2024", "2025"], [200.0, -50.0]),
+    ("sector", ["Energy", "Technology"], [-100.0, 250.0]),
+])
+def test_plot_closed_positions_grouping_keys(group_by, labels, values):
+    chart = plot_closed_positions(make_positions(), group_by=group_by)
+
+    assert chart.labels == labels
+    assert chart.values == values
+
+
+def test_plot_closed_positions_by_ticker_and_counts():
+    by_ticker = plot_closed_positions_by_ticker(make_positions().positions)
+    assert (by_ticker.labels, by_ticker.values) == (["AAPL", "XOM"], [250.0, -100.0])
+
+    counts = plot_closed_positions_count_by_month(make_positions(), group_by="quarter")
+    assert (counts.labels, counts.values) == (["2024-Q4", "2025-Q1", "2025-Q2"], [1, 1, 1])
+
+
+def test_plot_closed_positions_rejects_unknown_key():
+    with pytest.raises(ValueError):
+        plot_closed_positions(make_positions(), group_by="hour")
@@ -0,0 +1,61 @@
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from portfolio_toolkit.portfolio.time_series.utils import create_date_series_from_intervals
+from portfolio_toolkit.utils.dates import expand_day_ranges, to_datetime64, to_datetime64_array, to_day_numbers
+
+
+def test_to_datetime64_array_accepts_mixed_date_likes():
+    values = ["2025-01-02", date(2025, 1, 3), datetime(2025, 1, 4, 15, 30), pd.Timestamp("2025-01-05")]
+    result = to_datetime64_array(values)
+
+    assert result.dtype == np.dtype("datetime64[D]")
+    assert result.astype(str).tolist() == ["2025-01-02", "2025-01-03", "2025-01-04", "2025-01-05"]
+    assert to_datetime64(np.datetime64("2025-01-02T10:00")) == np.datetime64("2025-01-02")
+
+
+def test_to_datetime64_array_converts_datetime_index_without_copying_objects():
+    index = pd.date_range("2025-01-01", periods=3, freq="D")
+    assert to_datetime64_array(index).tolist() == to_datetime64_array(["2025-01-01", "2025-01-02", "2025-01-03"]).tolist()
+    assert to_day_numbers(["1970-01-02"]).tolist() == [1]
+
+
+def test_expand_day_ranges_merges_overlaps_and_skips_empty_ranges():
+    starts = to_datetime64_array(["2025-01-01", "2025-01-02", "2025-01-10"])
+    ends = to_datetime64_array(["2025-01-03", "2025-01-04", "2025-01-09"])
+
+    days = expand_day_ranges(starts, ends)
+    assert days.astype(str).tolist() == ["2025-01-01", "2025-01-02", "2025-01-03", "2025-01-04"]
+
+
+def test_create_date_series_from_intervals_matches_date_range():
+    intervals = [("2025-01-01", "2025-01-05"), ("2025-01-03", "2025-01-08"), ("2025-02-01", "2025-02-01")]
+    expected = pd.date_range("2025-01-01", "2025-01-08").append(pd.DatetimeIndex(["2025-02-01"]))
+
+    assert create_date_series_from_intervals(intervals).equals(expected)
+
+
+def test_today_is_the_local_date(monkeypatch):
+    from portfolio_toolkit.utils import dates
+
+    class LocalClock:
+        @staticmethod
+        def now():
+            # Just after local midnight, when the UTC date may still be the day before
+            return datetime(2025, 3, 1, 0, 30)
+
+    monkeypatch.setattr(dates, "datetime", LocalClock)
+    assert dates.today() == np.datetime64("2025-03-01")
+
+
+def test_calendar_periods_labels_and_bounds():
+    from portfolio_toolkit.utils.dates import calendar_periods
+
+    labels, firsts, lasts = calendar_periods("2024-02-15", "2024-07-01", "quarter")
+    assert labels == ["2024Q1", "2024Q2", "2024Q3"]
+    assert firsts.astype(str).tolist() == ["2024-01-01", "2024-04-01", "2024-07-01"]
+    assert lasts.astype(str).tolist() == ["2024-03-31", "2024-06-30", "2024-09-30"]
+    assert calendar_periods("2024-01-31", "2024-02-01", "month")[0] == ["2024-01", "2024-02"]
+    assert calendar_periods("2023-06-01", "2024-06-01")[0] == ["2023", "2024"]